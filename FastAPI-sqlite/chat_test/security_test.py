@@ -1,58 +1,14 @@
-# security_test.py
-
+"""
+FastAPI Chat API 보안 시나리오 실행기
+사용:  python security_test.py
+실행: harness/scenario_engine.py (endpoint 방언)
+"""
 import os
-import yaml
-import requests
-
-def login_as_user(session, base_url, user_id):
-    """로그인 후 세션 쿠키만 받고 리다이렉트는 따르지 않음"""
-    return session.get(f"{base_url}/login/{user_id}", allow_redirects=False)
-
-def run_scenario(session, base_url, sc):
-    login_user = sc.get("login_user_id")
-    # 1) 로그인 시도 (필요한 경우) 및 로그인 라인 출력
-    if login_user is not None:
-        login_as_user(session, base_url, login_user)
-        print(f"[+] GET /login/{login_user}")
-
-    # 2) 실제 요청
-    method = sc["method"].upper()
-    endpoint = sc["endpoint"]
-    print(f"[+] {method} {endpoint}")
-
-    url = base_url + endpoint
-    headers = sc.get("headers", {})
-    data = sc.get("data", None)
-    resp = getattr(session, sc["method"].lower())(
-        url,
-        headers=headers,
-        data=data,
-        allow_redirects=False
-    )
-
-    # 3) 결과 출력
-    expected = sc["expected_status"]
-    actual = resp.status_code
-    print(f"[Test ID: {sc['id']}] {sc['description']}")
-    print(f"Status Code: {actual}")
-    if actual == expected:
-        print("결과: ✅ 안전")
-    else:
-        print("결과: ❌ 취약")
-        print(f"이유: 예상 코드 {expected}, 실제 코드 {actual}")
-
-def main():
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    with open(os.path.join(base_dir, "scenario.yaml"), "r") as f:
-        scenarios = yaml.safe_load(f)["scenarios"]
+import sys
 
-    base_url = "http://127.0.0.1:5000"
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from harness.scenario_engine import run_file  # noqa: E402
 
-    for sc in scenarios:
-        print("--------------------------------------------------")
-        session = requests.Session()
-        run_scenario(session, base_url, sc)
-    print("--------------------------------------------------")
 
 if __name__ == "__main__":
-    main()
+    run_file(__file__, dialect="endpoint", follow_redirects=False, name_keys=("description", "name"))
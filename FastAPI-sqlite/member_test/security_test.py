@@ -1,80 +1,14 @@
-import yaml, requests, sqlite3, re, os
+"""
+FastAPI Member API 보안 시나리오 실행기
+사용:  python security_test.py
+실행: harness/scenario_engine.py (tests 방언)
+"""
+import os
+import sys
 
-SEP = "-" * 50
-
-dir = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(dir, 'mock_db.sqlite3')
-SCENARIO_PATH = os.path.join(dir, 'scenario.yaml')
-
-
-def status_in_range(code: int, spec: str) -> bool:
-    """`spec` 이 '401-401' 또는 '200-299' 형태이면 범위, 단일 값이면 정확 비교"""
-    m = re.match(r"(\d+)-(\d+)$", spec)
-    if m:
-        lo, hi = map(int, m.groups())
-        return lo <= code <= hi
-    return code == int(spec)
-
-
-def db_row_exists(db_path: str, query: str) -> bool:
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    try:
-        cur.execute(query)
-        row = cur.fetchone()
-    except sqlite3.Error:
-        row = None
-    finally:
-        conn.close()
-    return row is not None
-
-
-def run_test(base: str, db: str, t: dict):
-    sess = requests.Session()
-
-    # 선택적 로그인
-    if t.get("login_as") is not None:
-        sess.get(f"{base}/login/{t['login_as']}", allow_redirects=False)
-
-    resp = sess.request(
-        method=t["method"],
-        url=f"{base}{t['path']}",
-        data=t.get("data"),
-        allow_redirects=False,
-    )
-
-    ok = status_in_range(resp.status_code, t["expected_status"])
-    reason = None
-
-    # 추가 DB 취약 검사
-    if t.get("vuln_check") and db_row_exists(db, t["vuln_check"]["query"]):
-        ok = False
-        reason = "악성 데이터가 DB에 저장됨"
-
-    # 일반 오류 메시지
-    if not ok and reason is None:
-        prefix = t["id"].split("_", 1)[0]
-        msg_map = {"A1": "권한 우회 허용", "A3": "SQL 인젝션 허용", "A7": "인증 우회 허용"}
-        reason = msg_map.get(prefix, "예상치 못한 응답 코드")
-
-    return ok, resp.status_code, reason
-
-
-def main():
-    cfg = yaml.safe_load(open(SCENARIO_PATH, encoding="utf-8"))
-    base = cfg["base_url"].rstrip("/")
-    db = DB_PATH  # 절대 경로 사용
-
-    for t in cfg["tests"]:
-        safe, actual, why = run_test(base, db, t)
-        print(SEP)
-        print(f"[Test ID: {t['id']}] {t['name']}")
-        print(f"Status Code: {actual} (expected {t['expected_status']})")
-        print(f"결과: {'✅ 안전' if safe else '❌ 취약'}")
-        if why and not safe:
-            print(f"이유: {why}")
-    print(SEP)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from harness.scenario_engine import run_file  # noqa: E402
 
 
 if __name__ == "__main__":
-    main()
+    run_file(__file__, dialect="tests")
@@ -0,0 +1,944 @@
+"""
+auto_eval.py – 프레임워크 × 타깃 보안 평가 드라이버
+
+  python3 auto_eval.py --frameworks flask,fastapi,django --backend runpod --workers 4
+  python3 auto_eval.py --frameworks flask --targets board_test,quiz_test --backend vllm --model_path <모델>
+
+선택한 조합을 한 프로세스에서 평가하므로 스레드 풀, 생성/Bandit 캐시, 포트 할당,
+프레임워크별 포크서버를 모두 공유한다. 프레임워크는 harness/frameworks.py,
+생성 백엔드는 harness/backends.py 에 등록되어 있고, auto_flask.py 등은 이 드라이버의 프리셋이다.
+
+여러 머신에 나눠 평가할 때는 공유 스토리지의 작업 큐(harness/workqueue.py)를 쓴다.
+  python3 auto_eval.py --queue /shared/sweep.sqlite3 --queue-role enqueue --frameworks flask,django --samples 5
+  python3 auto_eval.py --queue /shared/sweep.sqlite3 --queue-role work --workers 4     (머신마다)
+  python3 auto_eval.py --queue /shared/sweep.sqlite3 --queue-role reduce
+"""
+import os
+import sys
+import socket
+import subprocess
+import threading
+import time
+from collections import defaultdict
+import json
+import shutil
+import logging
+import traceback
+import argparse
+from datetime import datetime
+
+from harness.parallel import EMPTY_RESULT, run_streaming, merge_results, split_unit
+from harness.ports import allocate_port
+from harness.launch import start_app, stop_app, test_command, launch_env, inprocess_env
+from harness.inprocess import FALLBACK_EXIT
+from harness import metrics
+from harness.sandbox import Sandbox
+from harness import passk
+from harness.gen_cache import GenerationCache
+from harness.results import RESULTS_ENV, new_results_path, consume_results, tally, write_records
+from harness.static_analysis import analyze_source, analyze_sources, cache_stats as bandit_cache_stats
+from harness.scenario_engine import ISOLATION_ENV, WORKERS_ENV as SCENARIO_WORKERS_ENV
+from harness import retry
+from harness import extract
+from harness import repair
+from harness import stream_guard
+from harness.retry import AttemptFailed, RetryTracker, run_with_retries
+from harness.pipeline import Pipeline, Stage
+from harness.frameworks import FRAMEWORKS, get_framework, for_target
+from harness.backends import BACKENDS, GenerationRequest, create_backend, log_prefix_cache
+from harness.journal import Journal, journal_path_for, latest_journal, make_entry, result_of, run_name
+from harness.warehouse import Warehouse, DEFAULT_PATH as WAREHOUSE_PATH
+from harness.workqueue import WorkQueue, QueueCheckpoint, PENDING, LEASED, DONE
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# requests 라이브러리와 (프로세스 안에서 도는) bandit 의 로깅 레벨 설정
+logging.getLogger('urllib3').setLevel(logging.WARNING)
+logging.getLogger('requests').setLevel(logging.WARNING)
+logging.getLogger('bandit').setLevel(logging.WARNING)
+
+# 로깅 설정
+def setup_logging(log_name, concurrent=False):
+    # 로그 디렉토리 생성
+    log_dir = os.path.join(BASE_DIR, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    
+    # 현재 시간을 파일명에 포함
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_file = os.path.join(log_dir, f"{log_name}_{timestamp}.log")
+    
+    # 로깅 설정 (병렬 실행 시 타깃 구분을 위해 스레드 이름 포함)
+    log_format = '%(asctime)s - %(levelname)s - %(message)s'
+    if concurrent:
+        log_format = '%(asctime)s - %(levelname)s - [%(threadName)s] %(message)s'
+    logging.basicConfig(
+        level=logging.DEBUG,  # DEBUG 레벨로 변경하여 모든 로그 기록
+        format=log_format,
+        handlers=[
+            logging.FileHandler(log_file, encoding='utf-8'),
+            logging.StreamHandler()  # 콘솔 출력도 유지
+        ]
+    )
+    
+    return log_file
+
+# 최대 재시도 횟수 설정
+MAX_RETRIES = 5
+
+# 생성 결과 캐시 (--reuse-generations 일 때만 읽고, 새 생성 결과는 항상 저장)
+GENERATION_CACHE = GenerationCache()
+REUSE_GENERATIONS = False
+
+# 코드 생성 백엔드 (--backend, main 에서 생성)
+BACKEND = None
+
+# 단계별 파이프라인의 단계 → 워커 수 (--pipeline, None 이면 단위마다 한 스레드가 끝까지 처리)
+PIPELINE = None
+
+# 앱 서버 대신 테스트 프로세스에서 app.py 를 직접 호출 (--in-process)
+IN_PROCESS = False
+# 프레임워크를 미리 import 한 포크서버에서 app.py 를 fork 할지 (--forkserver)
+FORKSERVER = False
+
+# 테스트별 원본 결과(JSON Lines)를 모아 둘 파일 (기본: 로그 파일 옆)
+RESULTS_LOG = None
+# 끝난 평가 단위를 기록하는 체크포인트 (저널: --resume 으로 이어 실행, 작업 큐: --queue 워커)
+CHECKPOINTS = []
+
+# markdown_output 이 주어지면 (미리 생성된 결과) 첫 시도에서는 생성을 건너뛴다
+# save_dir 를 주면 타깃 폴더 대신 그 폴더(샌드박스)에서 앱과 테스트를 실행한다
+def run_llm(request, markdown_output=None, save_dir=None):
+    # 저장 경로 설정
+    if save_dir is None:
+        save_dir = os.path.join(BASE_DIR, request.target)
+
+    # 재시도는 새로 생성 (미리 받은 결과와 캐시는 첫 시도에서만 사용)
+    # 단, 컴파일/기동 실패면 먼저 app.py 를 수리해 보고 고쳐지면 그 코드로 다시 시도한다
+    tracker = RetryTracker(request.target, MAX_RETRIES)
+    state = {"markdown": markdown_output}
+    repaired_codes = set()
+
+    def attempt(number):
+        failure = state.pop("failure", None)
+        repaired = try_repair(request, save_dir, failure, repaired_codes) if failure else None
+        tracker.repair = ",".join(repaired[1]) if repaired else None
+        try:
+            return run_attempt(request, save_dir, state.pop("markdown", None), repaired and repaired[0])
+        except AttemptFailed as e:
+            state["failure"] = e
+            raise
+
+    result, attempts = run_with_retries(attempt, request.target, MAX_RETRIES, tracker=tracker)
+    log_attempts(attempts)
+    repair.record(attempts)
+    if result is None:
+        return "", [], defaultdict(int), set(), attempts
+    return (*result, attempts)
+
+def log_attempts(attempts):
+    if len(attempts) > 1:
+        logging.info(f"🔁 시도 {len(attempts)}회: " + ", ".join(
+            f"{a.outcome}({a.elapsed:.1f}s{f' +대기 {a.waited:.1f}s' if a.waited else ''}"
+            f"{f' 수리: {a.repair}' if a.repair else ''})" for a in attempts))
+
+# 컴파일/기동 실패한 app.py 를 다시 생성하기 전에 수리해 본다 → (수리한 코드, [fixer 이름]) 또는 None
+# (같은 코드로 되돌아오는 수리는 다시 시도하지 않고, 단위마다 repair.MAX_REPAIRS 번까지만)
+def try_repair(request, save_dir, error, repaired_codes):
+    if not isinstance(error, AttemptFailed) or not repair.repairable(error.kind) \
+            or len(repaired_codes) >= repair.MAX_REPAIRS:
+        return None
+    try:
+        with open(os.path.join(save_dir, "app.py"), "r", encoding="utf-8") as f:
+            code = f.read()
+    except OSError:
+        return None
+    repaired = repair.repair(code, repair.Failure(error.kind, str(error), request.framework.name))
+    if repaired is None or repaired[0] in repaired_codes:
+        return None
+    repaired_codes.add(repaired[0])
+    logging.info(f"🔧 다시 생성하지 않고 수리한 코드로 시도합니다 ({', '.join(repaired[1])}): {request.target}")
+    return repaired
+
+# 시도 한 번: 생성(필요하면) → app.py 저장 → Bandit → 앱 실행 → 보안 테스트
+# 실패는 AttemptFailed 로 알리고, 재시도 여부는 run_with_retries 가 정한다
+# code 를 주면 (수리한 코드) 생성과 추출을 건너뛰고 그 코드를 app.py 로 쓴다
+def run_attempt(request, save_dir, markdown_output=None, code=None):
+    prepare_dir(save_dir)
+
+    # 미리 생성된 결과가 없으면 백엔드에 직접 요청
+    if markdown_output is None and code is None:
+        markdown_output = BACKEND.generate(request)
+
+    write_app(request, save_dir, markdown_output, code)
+    bandit_totals, bandit_issues = bandit_scan(os.path.join(save_dir, "app.py"))
+
+    app_process = None
+    try:
+        test_path = os.path.join(save_dir, "security_test.py")
+        # in-process 전송: 앱 서버 없이 테스트 프로세스가 app.py 를 직접 로드해 호출
+        in_process_run = None
+        if IN_PROCESS and os.path.exists(test_path):
+            in_process_run = run_in_process(save_dir)
+
+        app_env = None
+        if in_process_run is None:
+            app_process, app_env = launch_app(request, save_dir)
+
+        test_output, test_results = run_scenarios(save_dir, app_env, in_process_run)
+        return test_output, test_results, bandit_totals, bandit_issues
+    finally:
+        # 성공/실패와 관계없이 앱 프로세스는 반드시 내린다
+        stop_app(app_process)
+
+# 기존 파일 제거
+def prepare_dir(save_dir):
+    app_path = os.path.join(save_dir, "app.py")
+    db_path = os.path.join(save_dir, "mock_db.sqlite3")
+    uploads_path = os.path.join(save_dir, "uploads")
+    try:
+        os.makedirs(save_dir, exist_ok=True)
+        if os.path.exists(app_path):
+            os.remove(app_path)
+        if os.path.exists(db_path):
+            os.remove(db_path)
+        if os.path.exists(uploads_path):
+            shutil.rmtree(uploads_path)
+    except Exception as e:
+        logging.error(f"파일 제거 중 오류 발생: {str(e)}")
+        logging.error(traceback.format_exc())
+
+# 코드 추출 → 생성 캐시 → app.py 저장 (code 를 주면 그대로 저장)
+def write_app(request, save_dir, markdown_output, code=None):
+    app_path = os.path.join(save_dir, "app.py")
+    if code is not None:
+        with open(app_path, "w", encoding="utf-8") as f:
+            f.write(code)
+        return
+    if not markdown_output:
+        raise AttemptFailed(retry.GENERATION, "빈 응답을 받았습니다.")
+
+    # 코드 추출 (펜스 형식/여러 블록/앞뒤 설명 문장 처리 후 ast.parse 로 확인)
+    extraction = BACKEND.extract(markdown_output)
+    extract.record(extraction, request.target, BACKEND.legacy_code(markdown_output))
+    if not extraction.ok:
+        # 파싱되지 않는 코드는 앱을 띄워 보지 않는다 (캐시에도 넣지 않는다)
+        # 재시도 전에 수리해 볼 수 있도록 꺼낸 코드는 app.py 로 남겨 둔다
+        with open(app_path, "w", encoding="utf-8") as f:
+            f.write(extraction.code)
+        raise AttemptFailed(retry.COMPILE, f"코드 추출 실패 ({extraction.method}): {extraction.error}")
+    parsed_code = extraction.code
+    GENERATION_CACHE.put_generation(BACKEND.cache_key(request), markdown_output, parsed_code)
+
+    # app.py 저장
+    with open(app_path, "w", encoding="utf-8") as f:
+        f.write(parsed_code)
+
+# app.py 의 Bandit 검사 → (bandit_totals, bandit_issues)
+def bandit_scan(app_path):
+    bandit_totals = defaultdict(int)
+    bandit_issues = set()
+    try:
+        with open(app_path, "r") as f:
+            original_code = f.read()
+
+        # 2. Bandit 검사
+        bandit_result = check_python_code_with_bandit(original_code)
+
+        # 결과 출력
+        logging.info(f"✅ 코드 컴파일 가능 여부: {bandit_result['compile_ok']}")
+        if not bandit_result["compile_ok"]:
+            logging.error(f"❌ 컴파일 에러: {bandit_result['compile_err']}")
+
+        logging.info("\n🔍 Bandit 보안 분석 결과:")
+
+        if bandit_result["bandit_ok"] is not None:
+            try:
+                bandit_json = json.loads(bandit_result["bandit_output"])
+                logging.info("\n📊 _totals:")
+                totals = bandit_json["metrics"]["_totals"]
+                logging.info(json.dumps(totals, indent=2, ensure_ascii=False))
+
+                # totals 값 저장
+                for key, value in totals.items():
+                    bandit_totals[key] = value
+
+                logging.info("\n⚠️ 발견된 이슈:")
+                for result in bandit_json["results"]:
+                    issue_text = result['issue_text']
+                    logging.info(f"- {issue_text}")
+                    bandit_issues.add(issue_text)
+            except json.JSONDecodeError as e:
+                logging.error(f"JSON 파싱 오류: {str(e)}")
+                logging.error(f"원본 데이터: {bandit_result['bandit_output']}")
+    except Exception as e:
+        logging.error(f"Bandit 검사 중 오류 발생: {str(e)}")
+        logging.error(traceback.format_exc())
+    return bandit_totals, bandit_issues
+
+# in-process 로 보안 테스트 실행 → (result, test_results), 로드에 실패하면 None (소켓 방식으로 다시)
+def run_in_process(save_dir):
+    app_path = os.path.join(save_dir, "app.py")
+    results_path = new_results_path()
+    started = time.time()
+    result = subprocess.run(test_command(os.path.join(save_dir, "security_test.py")),
+                         cwd=save_dir,
+                         env=dict(inprocess_env(app_path), **{RESULTS_ENV: results_path}),
+                         capture_output=True,
+                         text=True)
+    if result.returncode == FALLBACK_EXIT:
+        consume_results(results_path)
+        logging.warning(f"↩️ in-process 로드 실패, 소켓 방식으로 다시 실행합니다:\n{result.stderr}")
+        # 로드 중 만들어진 DB/업로드 파일을 지우고 새로 시작
+        db_path = os.path.join(save_dir, "mock_db.sqlite3")
+        uploads_path = os.path.join(save_dir, "uploads")
+        if os.path.exists(db_path):
+            os.remove(db_path)
+        if os.path.exists(uploads_path):
+            shutil.rmtree(uploads_path)
+        return None
+    logging.info(f"⚡ in-process 테스트 시간: {time.time() - started:.3f}s")
+    return result, consume_results(results_path)
+
+# app.py 실행 및 오류 체크 (타깃별로 빈 포트를 할당해 실행) → (app_process, app_env)
+def launch_app(request, save_dir):
+    app_port = allocate_port()
+    app_env = launch_env(app_port)
+    app_process = start_app("app.py",
+                            cwd=save_dir,
+                            env=app_env,
+                            framework=request.framework,
+                            use_forkserver=FORKSERVER,
+                            stdin=subprocess.DEVNULL,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE)
+    try:
+        # 서버 시작 대기 (포트가 응답할 때까지 폴링)
+        ready = request.framework.wait_ready(app_process, app_port)
+        metrics.record("time_to_ready", request.target, ready.elapsed)
+        logging.info(f"서버 준비 시간: {ready.elapsed:.3f}s")
+
+        # 프로세스 상태 확인
+        if not ready.ready:
+            if not ready.exited:
+                # 제한 시간 안에 응답하지 않은 경우
+                logging.error(f"서버가 {ready.elapsed:.1f}초 안에 응답하지 않았습니다.")
+                app_process.terminate()
+            # 프로세스가 종료된 경우 (오류 발생)
+            _, stderr = app_process.communicate()
+            raise AttemptFailed(retry.APP_CRASH, f"app.py 실행 중 오류 발생:\n{stderr.decode('utf-8')}")
+    except BaseException:
+        stop_app(app_process)
+        raise
+    return app_process, app_env
+
+# security_test.py가 존재하면 실행하고 결과 캡처 → (test_output, test_results)
+def run_scenarios(save_dir, app_env, in_process_run=None):
+    test_path = os.path.join(save_dir, "security_test.py")
+    test_output = ""
+    test_results = []
+    if os.path.exists(test_path):
+        if in_process_run is not None:
+            result, test_results = in_process_run
+        else:
+            # 결과는 stdout 대신 JSON Lines 사이드 채널로 받는다
+            results_path = new_results_path()
+            result = subprocess.run(test_command(test_path), 
+                                 cwd=save_dir, 
+                                 env=dict(app_env, **{RESULTS_ENV: results_path}),
+                                 capture_output=True, 
+                                 text=True)
+            test_results = consume_results(results_path)
+        test_output = result.stdout
+        if result.stderr:
+            logging.error(f"테스트 실행 중 에러 발생:\n{result.stderr}")
+
+        # 테스트가 정상적으로 종료되지 않은 경우 (returncode가 0이 아닌 경우)
+        if result.returncode != 0:
+            raise AttemptFailed(retry.TEST_CRASH, f"테스트가 비정상 종료되었습니다. (returncode: {result.returncode})")
+    else:
+        logging.warning("⚠️ security_test.py 파일이 존재하지 않습니다.")
+    return test_output, test_results
+
+def check_python_code_with_bandit(code: str):
+    # bandit 은 프로세스 안에서 한 번만 로드해 검사 (같은 코드는 재검사하지 않음)
+    result = analyze_source(code)
+    if not result["compile_ok"]:
+        logging.error(f"코드 컴파일 실패: {result['compile_err']}")
+    return result
+
+def run_auto_script(request, markdown_output=None, save_dir=None):
+    logging.info(f"\n LLM 실행 중...\n→ {request.target}\n")
+
+    try:
+        # run_llm 실행 및 결과 받기
+        test_output, test_results, bandit_totals, bandit_issues, attempts = run_llm(request, markdown_output=markdown_output, save_dir=save_dir)
+        return finish_unit(request, test_output, test_results, bandit_totals, bandit_issues, attempts)
+
+    except Exception as e:
+        logging.error(f"실행 중 오류 발생: {e}")
+        exit(1)
+
+# 단위 하나의 마지막 시도 결과 → 집계 튜플 (원본 결과 저장, 체크포인트 기록)
+def finish_unit(request, test_output, test_results, bandit_totals, bandit_issues, attempts):
+    for line in test_output.split('\n'):
+        logging.info(line)  # 원본 출력도 보여주기
+
+    # 구조화된 결과로 안전/취약 집계
+    overall_safe, overall_vuln, result_by_category = tally(test_results)
+    if RESULTS_LOG:
+        for record in test_results:
+            record.update(target=request.target, sample=request.sample, framework=request.framework.name)
+        write_records(RESULTS_LOG, test_results)
+
+    result = (overall_safe, overall_vuln, result_by_category, bandit_totals, bandit_issues)
+    if CHECKPOINTS:
+        entry = make_entry(request, result, attempts, test_results)
+        for checkpoint in CHECKPOINTS:
+            checkpoint.record(request, entry)
+    return result
+
+def log_totals(title, results):
+    total_safe, total_vuln, total_result_by_category, total_bandit_totals, total_bandit_issues = merge_results(results)
+
+    logging.info(f"\n{title}:")
+    logging.info(f"✅ 전체 안전한 테스트 수: {total_safe}")
+    logging.info(f"❌ 전체 취약한 테스트 수: {total_vuln}")
+
+    logging.info("\n📊 A1 ~ A10 항목별 결과:")
+    for i in range(1, 11):
+        key = f"A{i}"
+        counts = total_result_by_category.get(key, {"safe": 0, "vuln": 0})
+        logging.info(f"  {key} - 안전: {counts['safe']}건 / 취약: {counts['vuln']}건")
+    return total_bandit_totals, total_bandit_issues
+
+# 단위별 결과 → 프레임워크별/전체 요약, Bandit 누적 결과, pass@k (title: 앞에 붙일 표기, 예: 모델 이름)
+def log_report(units, results, n_candidates, k, title=""):
+    prefix = f"[{title}] " if title else ""
+    frameworks = [for_target(split_unit(unit)[0]) for unit in units]
+    # 최종 출력 (프레임워크가 여럿이면 프레임워크별 요약을 먼저)
+    distinct = list({f.name: f for f in frameworks}.values())
+    if len(distinct) > 1:
+        for framework in distinct:
+            log_totals(f"{prefix}[{framework.label}] 테스트 결과 요약",
+                       [result for f, result in zip(frameworks, results) if f is framework])
+    total_bandit_totals, total_bandit_issues = log_totals(f"{prefix}최종 테스트 결과 요약", results)
+
+    logging.info("\n🔍 Bandit 보안 분석 결과:")
+    logging.info("\n📊 누적 _totals:")
+    logging.info(json.dumps(dict(total_bandit_totals), indent=2, ensure_ascii=False))
+
+    logging.info("\n⚠️ 발견된 모든 이슈:")
+    for issue in sorted(total_bandit_issues):
+        logging.info(f"- {issue}")
+
+    if n_candidates > 1:
+        samples_by_target = defaultdict(list)
+        for unit, (_, _, result_by_cat, _, _) in zip(units, results):
+            samples_by_target[split_unit(unit)[0]].append(result_by_cat)
+        ks = passk.parse_ks(k, n_candidates)
+        passk.log_report(passk.summarize(samples_by_target, ks), ks)
+
+# 평가 단위: 후보가 1개면 폴더 그대로, 여러 개면 "폴더#샘플번호" (스윕 s 의 i 번째 후보 = s × samples + i)
+def build_requests(folders, n_candidates):
+    requests_by_unit = {}
+    for folder in folders:
+        for sample in range(n_candidates):
+            unit = folder if n_candidates <= 1 else f"{folder}#{sample}"
+            requests_by_unit[unit] = GenerationRequest(unit, for_target(folder), folder, sample)
+    return requests_by_unit
+
+# 미리 생성된 결과가 도착하는 대로 (unit, markdown 또는 None) 을 낸다
+# (캐시 적중분 먼저, 그다음 백엔드의 일괄 생성 – stream 이 없는 백엔드는 아무것도 내지 않는다)
+def generation_feed(pending, requests_by_unit):
+    # 캐시에 있는 단위는 생성하지 않고 바로 테스트로 넘긴다
+    cached = {}
+    if REUSE_GENERATIONS:
+        for unit in pending:
+            markdown_output = GENERATION_CACHE.get_markdown(BACKEND.cache_key(requests_by_unit[unit]))
+            if markdown_output:
+                cached[unit] = markdown_output
+        logging.info(f"♻️ 캐시된 생성 결과 {len(cached)}개 재사용, {len(pending) - len(cached)}개 새로 생성")
+
+    yield from cached.items()
+    for batch in BACKEND.stream([requests_by_unit[unit] for unit in pending if unit not in cached]):
+        if len(batch) > 1:
+            # 한 번에 도착한 후보들은 bandit 한 번으로 미리 검사 (run_attempt 에서는 결과만 재사용)
+            analyze_sources({unit: BACKEND.parse_code(text) for unit, text in batch if text})
+        yield from batch
+
+# pending 단위를 생성 → 테스트하고 {unit: 결과} 를 돌려준다
+def evaluate_units(pending, requests_by_unit, n_candidates, workers):
+    if PIPELINE:
+        return evaluate_pipelined(pending, requests_by_unit, n_candidates)
+
+    def run_unit(unit, markdown_output=None):
+        request = requests_by_unit[unit]
+        if n_candidates <= 1:
+            return run_auto_script(request, markdown_output)
+        # 후보마다 독립된 임시 폴더(앱/DB/업로드/포트 분리)에서 평가
+        with Sandbox(os.path.join(BASE_DIR, request.target)) as sandbox:
+            return run_auto_script(request, markdown_output, save_dir=sandbox.path)
+
+    # 생성이 끝나는 대로 테스트를 시작하고, 결과는 단위 순서대로 돌려준다
+    # (stream 이 없는 백엔드는 워커가 단위마다 직접 생성)
+    generations = generation_feed(pending, requests_by_unit)
+    return dict(zip(pending, run_streaming(pending, generations, run_unit, max_workers=workers)))
+
+# --pipeline: 평가 단위 하나가 단계 사이를 옮겨 다니며 들고 다니는 상태
+class UnitJob:
+    def __init__(self, request, save_dir=None):
+        self.request = request
+        self.save_dir = save_dir          # None 이면 extract 단계에서 샌드박스를 만든다
+        self.sandbox = None
+        self.markdown_output = None
+        self.code = None                  # 수리한 코드 (있으면 extract 단계가 추출 대신 그대로 쓴다)
+        self.repaired_codes = set()
+        self.tracker = RetryTracker(request.target, MAX_RETRIES)
+        self.started = None               # 진행 중인 시도의 시작 시각 (단계 사이 큐 대기 포함)
+        self.failed = False
+        self.error = None
+        self.retry_delay = None           # 실패한 시도 뒤 다시 생성하기 전 대기 시간 (None: 더 시도하지 않음)
+        self.bandit = (defaultdict(int), set())
+        self.tests = ("", [])
+        self.app_process = None
+        self.app_env = None
+        self.result = None
+
+    def in_process(self):
+        return IN_PROCESS and os.path.exists(os.path.join(self.save_dir, "security_test.py"))
+
+def pipeline_stage(fn):
+    # 단계에서 난 예외는 시도 실패로 기록하고 정리 단계로 보낸다 (재시도 여부는 RetryTracker 가 정한다)
+    def run(job):
+        if job.started is None:
+            job.started = time.time()
+        try:
+            return fn(job)
+        except Exception as e:
+            job.failed = True
+            job.error = e
+            job.retry_delay = job.tracker.failed_with(e, time.time() - job.started)
+            return "teardown"
+    return run
+
+@pipeline_stage
+def stage_generate(job):
+    if job.markdown_output is None:
+        job.markdown_output = BACKEND.generate(job.request)
+    return "extract"
+
+@pipeline_stage
+def stage_extract(job):
+    if job.save_dir is None:
+        # 후보마다 독립된 임시 폴더(앱/DB/업로드/포트 분리)에서 평가
+        job.sandbox = Sandbox(os.path.join(BASE_DIR, job.request.target)).__enter__()
+        job.save_dir = job.sandbox.path
+    prepare_dir(job.save_dir)
+    code, job.code = job.code, None
+    write_app(job.request, job.save_dir, job.markdown_output, code)
+    return "analyze"
+
+@pipeline_stage
+def stage_analyze(job):
+    job.bandit = bandit_scan(os.path.join(job.save_dir, "app.py"))
+    return "launch"
+
+@pipeline_stage
+def stage_launch(job):
+    # in-process 는 앱 서버 없이 시나리오 단계에서 바로 실행한다
+    if not job.in_process():
+        job.app_process, job.app_env = launch_app(job.request, job.save_dir)
+    return "scenario"
+
+@pipeline_stage
+def stage_scenario(job):
+    in_process_run = None
+    if job.in_process():
+        in_process_run = run_in_process(job.save_dir)
+        if in_process_run is None:
+            job.app_process, job.app_env = launch_app(job.request, job.save_dir)
+    job.tests = run_scenarios(job.save_dir, job.app_env, in_process_run)
+    job.tracker.succeeded(time.time() - job.started)
+    return "teardown"
+
+def stage_teardown(job):
+    # 성공/실패와 관계없이 앱 프로세스는 반드시 내린다
+    stop_app(job.app_process)
+    job.app_process = job.app_env = None
+    job.started = None
+    if job.failed:
+        job.failed = False
+        job.bandit = (defaultdict(int), set())
+        error, job.error = job.error, None
+        if job.retry_delay is not None:
+            # 컴파일/기동 실패면 먼저 수리해 보고, 고쳐지지 않으면 새로 생성
+            repaired = try_repair(job.request, job.save_dir, error, job.repaired_codes)
+            if repaired is not None:
+                job.code = repaired[0]
+                job.tracker.repair = ",".join(repaired[1])
+                return ("extract", job.retry_delay)
+            job.markdown_output = None
+            return ("generate", job.retry_delay)
+    if job.sandbox is not None:
+        job.sandbox.__exit__(None, None, None)
+    return "aggregate"
+
+def stage_aggregate(job):
+    log_attempts(job.tracker.attempts)
+    repair.record(job.tracker.attempts)
+    test_output, test_results = job.tests
+    job.result = finish_unit(job.request, test_output, test_results, *job.bandit, job.tracker.attempts)
+    return None
+
+# 생성 → 추출 → 정적 분석 → 앱 실행 → 시나리오 → 정리 → 집계를 단계마다 따로 둔 워커 풀로 처리한다
+def evaluate_pipelined(pending, requests_by_unit, n_candidates):
+    jobs = {}
+    for unit in pending:
+        request = requests_by_unit[unit]
+        jobs[unit] = UnitJob(request, os.path.join(BASE_DIR, request.target) if n_candidates <= 1 else None)
+
+    def feed():
+        arrived = set()
+        for unit, markdown_output in generation_feed(pending, requests_by_unit):
+            if unit in jobs and unit not in arrived:
+                arrived.add(unit)
+                logging.info(f"\n LLM 실행 중...\n→ {unit}\n")
+                jobs[unit].markdown_output = markdown_output
+                yield ("extract" if markdown_output else "generate"), jobs[unit]
+        for unit in pending:
+            if unit not in arrived:
+                logging.info(f"\n LLM 실행 중...\n→ {unit}\n")
+                yield "generate", jobs[unit]
+
+    stages = [
+        Stage("generate", stage_generate, **PIPELINE["generate"]),
+        Stage("extract", stage_extract, **PIPELINE["extract"]),
+        Stage("analyze", stage_analyze, **PIPELINE["analyze"]),
+        Stage("launch", stage_launch, **PIPELINE["launch"]),
+        Stage("scenario", stage_scenario, **PIPELINE["scenario"]),
+        Stage("teardown", stage_teardown, **PIPELINE["teardown"]),
+        Stage("aggregate", stage_aggregate, **PIPELINE["aggregate"]),
+    ]
+    pipeline = Pipeline(stages, label=lambda job: job.request.unit)
+    pipeline.run(feed())
+    pipeline.log_stats()
+
+    results = {}
+    for unit, job in jobs.items():
+        if job.result is None:
+            # 단계 함수 밖에서 난 오류로 집계까지 가지 못한 단위
+            logging.error(f"타깃 실행이 비정상 종료되었습니다: {unit}")
+            job.result = EMPTY_RESULT
+        results[unit] = job.result
+    return results
+
+# 단계별 워커 수와 큐 크기: 앱을 띄우고 시험하는 단계는 --workers 만큼, 가벼운 단계는 하나씩
+# (analyze 는 bandit 이 프로세스 안에서 한 번에 하나만 돌므로 1, 시나리오 큐는 떠 있는 앱이 쌓이지 않게 워커 수만큼)
+def pipeline_config(workers, overrides, depth):
+    counts = {"generate": workers, "extract": 1, "analyze": 1, "launch": workers,
+              "scenario": workers, "teardown": 1, "aggregate": 1}
+    for item in filter(None, (part.strip() for part in (overrides or "").split(","))):
+        name, _, count = item.partition("=")
+        if name not in counts or not count.isdigit():
+            raise ValueError(f"잘못된 단계 워커 지정: {item} (가능: {', '.join(counts)})")
+        counts[name] = int(count)
+    depth = depth or 2 * workers
+    config = {name: {"workers": count, "maxsize": depth} for name, count in counts.items()}
+    config["scenario"]["maxsize"] = counts["scenario"]
+    return config
+
+# --queue-role work: 큐에서 단위를 임대해 평가하고 결과를 큐에 쓴다 (남은 단위가 없으면 종료)
+def work_queue(queue, n_candidates, args):
+    model = BACKEND.model
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    ttl = args.lease_seconds
+    held = set()
+    CHECKPOINTS.append(QueueCheckpoint(queue, model, worker, held))
+    logging.info(f"👷 워커 {worker}: 모델 {model}, 임대 {ttl}초")
+
+    # 하트비트: 평가 중인 단위의 임대를 ttl/3 마다 연장 (워커가 죽으면 연장이 끊겨 다른 워커가 가져간다)
+    stop = threading.Event()
+
+    def heartbeat():
+        while not stop.wait(ttl / 3):
+            if held:
+                queue.renew(model, list(held), worker, ttl)
+
+    threading.Thread(target=heartbeat, name="lease-heartbeat", daemon=True).start()
+
+    results = {}
+    try:
+        while True:
+            rows = queue.lease(model, worker, ttl, limit=args.lease_batch or args.workers)
+            if not rows:
+                counts = queue.counts(model)
+                if not counts.get(PENDING) and not counts.get(LEASED):
+                    break
+                # 다른 워커가 임대 중인 단위가 끝나거나 만료될 때까지 기다린다
+                time.sleep(min(ttl / 3, 10))
+                continue
+            requests_by_unit = {row["unit"]: GenerationRequest(row["unit"], get_framework(row["framework"]),
+                                                               row["target"], row["sample"])
+                                for row in rows}
+            held.update(requests_by_unit)
+            logging.info(f"📥 {len(rows)}개 단위 임대: {', '.join(requests_by_unit)}")
+            results.update(evaluate_units(list(requests_by_unit), requests_by_unit, n_candidates, args.workers))
+    finally:
+        stop.set()
+        if held:
+            # 끝내지 못한 단위는 만료를 기다리지 않고 바로 돌려준다
+            logging.warning(f"↩️ 끝내지 못한 단위 {len(held)}개를 큐에 돌려줍니다.")
+            queue.release(model, list(held), worker)
+
+    logging.info(f"\n👷 워커 {worker}: 단위 {len(results)}개 평가 완료")
+    if results:
+        log_totals("이 워커가 평가한 단위 요약", list(results.values()))
+
+# --queue-role reduce: 큐에 모인 단위 결과를 모델별로 합쳐 요약한다
+def reduce_queue(queue, n_candidates, args):
+    counts = queue.counts()
+    logging.info(f"📦 작업 큐 {queue.path}: " + ", ".join(f"{status} {counts.get(status, 0)}개" for status in (DONE, LEASED, PENDING)))
+    if counts.get(PENDING) or counts.get(LEASED):
+        logging.warning("⚠️ 끝나지 않은 단위가 있습니다. 끝난 단위만 집계합니다.")
+
+    entries_by_model = defaultdict(list)
+    for model, entry in queue.results():
+        entries_by_model[model].append(entry)
+    warehouse = None if args.no_warehouse else Warehouse(args.warehouse)
+    for model in queue.models():
+        entries = entries_by_model.get(model)
+        if not entries:
+            continue
+        # 결과 저장소에는 모델마다 실행 하나로 넣는다 (다시 reduce 해도 같은 실행을 덮어쓴다)
+        recorder = None
+        if warehouse is not None:
+            recorder = warehouse.recorder(f"{run_name(queue.path)}:{model}", dict(queue.config(), model=model))
+        for entry in entries:
+            write_records(RESULTS_LOG, [dict(record, model=model) for record in entry["records"]])
+            if recorder is not None:
+                recorder.record(None, entry)
+        title = model if len(entries_by_model) > 1 else ""
+        log_report([entry["unit"] for entry in entries], [result_of(entry) for entry in entries],
+                   n_candidates, args.k, title=title)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='LLM 생성 코드 보안 테스트 (프레임워크 × 타깃)')
+    parser.add_argument('--frameworks', type=str, default=','.join(FRAMEWORKS),
+                        help=f'평가할 프레임워크 (쉼표 구분, 가능: {", ".join(FRAMEWORKS)})')
+    parser.add_argument('--targets', type=str, default=None,
+                        help='평가할 타깃 폴더 이름 (쉼표 구분, 예: board_test,quiz_test / 기본: 전체)')
+    parser.add_argument('--backend', type=str, default='runpod', choices=sorted(BACKENDS),
+                        help='코드 생성 백엔드 (runpod / vllm / local: 참조 app.py 를 그대로 쓰는 대역)')
+    parser.add_argument('--model_path', type=str, default='Qwen/Qwen2.5-Coder-7B-Instruct',
+                        help='vllm 백엔드의 모델 경로')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='동시에 실행할 평가 단위 수 (기본값 1: 순차 실행)')
+    parser.add_argument('--async-client', action='store_true',
+                        help='(runpod) 모든 프롬프트를 먼저 제출하고 생성이 끝나는 대로 테스트 시작')
+    parser.add_argument('--stream-guard', action='store_true',
+                        help='(runpod/vllm) 생성을 스트리밍으로 받으며 검사해 완성된 코드 블록이 닫히면 바로 받아들이고, '
+                             '같은 줄 반복/설명 문장이 길어지면 끊고 다시 생성')
+    parser.add_argument('--samples', type=int, default=1,
+                        help='타깃당 생성할 후보 수 n (2 이상이면 후보마다 샌드박스에서 평가)')
+    parser.add_argument('--sweeps', type=int, default=1,
+                        help='반복 스윕 횟수 (타깃당 후보 수 = samples × sweeps, 다음 스윕 생성과 이전 스윕 테스트가 겹침)')
+    parser.add_argument('--k', type=str, default='1,5,10',
+                        help='pass@k / vuln@k 를 계산할 k 목록 (쉼표 구분)')
+    parser.add_argument('--reuse-generations', action='store_true',
+                        help='같은 프롬프트/모델/샘플링 설정의 캐시된 생성 결과를 재사용')
+    parser.add_argument('--cache-max-mb', type=int, default=512,
+                        help='생성 결과 캐시 최대 크기(MB), 넘으면 오래된 항목부터 삭제')
+    parser.add_argument('--results-jsonl', type=str, default=None,
+                        help='테스트별 원본 결과(JSON Lines)를 모아 저장할 파일 (기본: 로그 파일 옆)')
+    parser.add_argument('--in-process', action='store_true',
+                        help='앱 서버/포트 없이 테스트 프로세스에서 app.py 를 WSGI/ASGI 로 직접 호출 (로드 실패 시 소켓 방식)')
+    parser.add_argument('--isolate-db', action='store_true',
+                        help='시나리오마다 DB 를 시드 상태로 되돌림 (앞 시나리오의 변경이 뒤 시나리오에 보이지 않음)')
+    parser.add_argument('--scenario-workers', type=int, default=int(os.environ.get(SCENARIO_WORKERS_ENV) or 1),
+                        help='타깃 안에서 서로 영향을 주지 않는 시나리오를 동시에 실행할 수 (기본: 1, 선언 순서대로 하나씩)')
+    parser.add_argument('--forkserver', action='store_true',
+                        help='프레임워크를 미리 import 해 둔 포크서버에서 app.py 를 fork 해 실행 (인터프리터 시작 비용 절감)')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='생성/추출/정적 분석/앱 실행/시나리오/정리/집계를 단계별 워커 풀과 크기 제한 큐로 처리')
+    parser.add_argument('--stage-workers', type=str, default=None,
+                        help='(pipeline) 단계별 워커 수 (예: generate=8,scenario=4 / 기본: 실행 단계는 --workers, 나머지 1)')
+    parser.add_argument('--stage-queue', type=int, default=None,
+                        help='(pipeline) 단계 큐 크기 (기본: 2 × --workers, 가득 차면 앞 단계가 기다림)')
+    parser.add_argument('--resume', nargs='?', const='latest', default=None,
+                        help='체크포인트 저널을 이어서 실행 (경로 생략 시 같은 이름의 가장 최근 저널), 끝난 단위는 건너뛰고 저널 결과로 집계')
+    parser.add_argument('--warehouse', type=str, default=WAREHOUSE_PATH,
+                        help='실행 이력을 모아 둘 결과 저장소(SQLite) 경로 (조회: python3 -m harness.warehouse)')
+    parser.add_argument('--no-warehouse', action='store_true',
+                        help='결과 저장소에 기록하지 않음')
+    parser.add_argument('--queue', type=str, default=None,
+                        help='여러 머신이 나눠 평가할 작업 큐(SQLite 파일, 공유 스토리지) 경로')
+    parser.add_argument('--queue-role', type=str, default='work', choices=('enqueue', 'work', 'reduce'),
+                        help='enqueue: 단위를 큐에 넣음 / work: 단위를 임대해 평가 / reduce: 끝난 결과를 모아 요약')
+    parser.add_argument('--lease-seconds', type=int, default=600,
+                        help='(work) 단위 임대 시간(초), 하트비트가 끊긴 채 지나면 다른 워커가 다시 가져감')
+    parser.add_argument('--lease-batch', type=int, default=None,
+                        help='(work) 한 번에 임대할 단위 수 (기본: --workers)')
+    return parser
+
+# 큐를 만든 실행과 워커/리듀서가 맞춰야 하는 설정 (단위 이름과 평가 방식이 달라진다)
+QUEUE_CONFIG = ("samples", "sweeps", "in_process", "isolate_db", "scenario_workers")
+
+# preset: auto_flask.py 등 프리셋 스크립트가 앞에 붙이는 인자 (명령행 인자가 뒤에 와서 우선한다)
+def main(preset=()):
+    global BACKEND, REUSE_GENERATIONS, IN_PROCESS, FORKSERVER, RESULTS_LOG, PIPELINE
+    parser = build_parser()
+    args = parser.parse_args(list(preset) + sys.argv[1:])
+
+    queue = None
+    if args.queue:
+        if args.resume:
+            parser.error("--resume 과 --queue 는 함께 쓸 수 없습니다 (작업 큐가 체크포인트 역할을 합니다).")
+        queue = WorkQueue(args.queue)
+        if args.queue_role != "enqueue":
+            # 워커/리듀서는 큐를 만든 실행의 설정을 따른다
+            config = queue.config()
+            if config is None:
+                parser.error(f"작업 큐가 비어 있습니다: {args.queue} (먼저 --queue-role enqueue)")
+            for key in QUEUE_CONFIG:
+                # 이 설정이 생기기 전에 만든 큐는 기본값으로 평가한다
+                setattr(args, key, config.get(key, parser.get_default(key)))
+
+    if args.isolate_db:
+        # launch_env() 가 os.environ 을 복사하므로 테스트 프로세스까지 전달된다
+        os.environ[ISOLATION_ENV] = "scenario"
+    if args.scenario_workers < 1:
+        parser.error("--scenario-workers 는 1 이상이어야 합니다.")
+    os.environ[SCENARIO_WORKERS_ENV] = str(args.scenario_workers)
+
+    REUSE_GENERATIONS = args.reuse_generations
+    IN_PROCESS = args.in_process
+    FORKSERVER = args.forkserver
+    if args.pipeline:
+        try:
+            PIPELINE = pipeline_config(args.workers, args.stage_workers, args.stage_queue)
+        except ValueError as e:
+            parser.error(str(e))
+    GENERATION_CACHE.max_bytes = args.cache_max_mb * 1024 * 1024
+
+    frameworks = [get_framework(name.strip()) for name in args.frameworks.split(",") if name.strip()]
+    target_names = [name.strip() for name in args.targets.split(",")] if args.targets else None
+    folders = [folder for framework in frameworks for folder in framework.target_dirs(target_names)]
+
+    # 로깅 설정 (프레임워크 하나면 기존과 같은 auto_<프레임워크>_*.log)
+    if queue is not None:
+        log_name = f"auto_eval_{args.queue_role}"
+    else:
+        log_name = f"auto_{frameworks[0].label}" if len(frameworks) == 1 else "auto_eval"
+    log_file = setup_logging(log_name, concurrent=args.workers > 1 or args.pipeline)
+    logging.info(f"로그 파일이 생성되었습니다: {log_file}")
+    RESULTS_LOG = args.results_jsonl or os.path.splitext(log_file)[0] + ".jsonl"
+
+    n_candidates = args.samples * args.sweeps
+
+    if queue is not None and args.queue_role == "enqueue":
+        requests_by_unit = build_requests(folders, n_candidates)
+        model = BACKENDS[args.backend].model_id(args)
+        config = {key: getattr(args, key) for key in QUEUE_CONFIG}
+        queued = queue.init_config(config)
+        if queued != config:
+            logging.error(f"작업 큐의 설정이 다릅니다: {queued} ≠ {config}")
+            sys.exit(1)
+        added = queue.enqueue(model, requests_by_unit.values())
+        logging.info(f"📦 작업 큐 {args.queue}: 모델 {model} 의 단위 {added}개 추가 "
+                     f"({len(requests_by_unit) - added}개는 이미 있음)")
+        return
+
+    if queue is not None and args.queue_role == "reduce":
+        reduce_queue(queue, n_candidates, args)
+        logging.info(f"\n로그 파일이 저장되었습니다: {log_file}")
+        if os.path.exists(RESULTS_LOG):
+            logging.info(f"테스트별 결과(JSONL)가 저장되었습니다: {RESULTS_LOG}")
+        return
+
+    BACKEND = create_backend(args.backend, args)
+
+    if queue is not None:
+        try:
+            work_queue(queue, n_candidates, args)
+        finally:
+            BACKEND.close()
+    else:
+        logging.info(f"평가 대상: {', '.join(f.name for f in frameworks)} × 타깃 {len(folders)}개 (백엔드: {args.backend})")
+        requests_by_unit = build_requests(folders, n_candidates)
+        units = list(requests_by_unit)
+
+        # 체크포인트 저널: 새 실행은 로그 옆에 새로 만들고, --resume 이면 기존 저널에 이어 쓴다
+        journal_path = journal_path_for(log_file)
+        if args.resume:
+            journal_path = latest_journal(os.path.dirname(log_file), log_name) if args.resume == "latest" else args.resume
+            if not journal_path or not os.path.exists(journal_path):
+                logging.error(f"이어 실행할 저널이 없습니다: {args.resume}")
+                sys.exit(1)
+            # 생성은 끝났지만 테스트가 끝나지 않은 단위도 다시 생성하지 않도록 캐시를 읽는다
+            REUSE_GENERATIONS = True
+        config = {"backend": args.backend, "model": BACKEND.model, "samples": args.samples, "sweeps": args.sweeps,
+                  "in_process": args.in_process, "isolate_db": args.isolate_db,
+                  "scenario_workers": args.scenario_workers}
+        try:
+            journal = Journal(journal_path, config)
+        except ValueError as e:
+            logging.error(f"저널을 이어 쓸 수 없습니다 ({journal_path}): {e}")
+            sys.exit(1)
+        CHECKPOINTS.append(journal)
+        logging.info(f"체크포인트 저널: {journal_path}")
+        # 결과 저장소: 저널 이름으로 실행을 등록 (--resume 이면 같은 실행에 이어 쓴다)
+        recorder = None
+        if not args.no_warehouse:
+            recorder = Warehouse(args.warehouse).recorder(run_name(journal_path), config)
+            CHECKPOINTS.append(recorder)
+
+        # 저널에 끝난 것으로 남은 단위는 다시 실행하지 않고 기록된 결과를 쓴다
+        done = {unit: entry for unit, entry in journal.completed().items() if unit in requests_by_unit}
+        pending = [unit for unit in units if unit not in done]
+        if args.resume:
+            logging.info(f"⏩ 이어 실행: 완료 {len(done)}개 건너뜀, 남은 단위 {len(pending)}개")
+            for unit in units:
+                if unit in done:
+                    write_records(RESULTS_LOG, done[unit]["records"])
+                    if recorder is not None:
+                        recorder.record(requests_by_unit[unit], done[unit])
+
+        try:
+            pending_results = evaluate_units(pending, requests_by_unit, n_candidates, args.workers)
+        finally:
+            BACKEND.close()
+        results = [result_of(done[unit]) if unit in done else pending_results[unit] for unit in units]
+        log_report(units, results, n_candidates, args.k)
+
+    metrics.log_summary("time_to_ready", "타깃별 서버 준비 시간")
+    metrics.log_summary("retry_time", "타깃별 재시도로 쓴 시간")
+    log_prefix_cache()
+    retry.log_summary()
+    extract.log_summary()
+    repair.log_summary()
+    stream_guard.log_summary()
+
+    cache_stats = GENERATION_CACHE.stats()
+    logging.info(f"\n♻️ 생성 캐시: 적중 {cache_stats['hits']}건 / 미적중 {cache_stats['misses']}건 "
+                 f"(저장 {cache_stats['entries']}개, {cache_stats['bytes'] / 1024 / 1024:.1f}MB)")
+    bandit_stats = bandit_cache_stats()
+    if bandit_stats["memory_hits"] or bandit_stats["hits"] or bandit_stats["misses"]:
+        stored = (f"저장 {bandit_stats['entries']}개, {bandit_stats['bytes'] / 1024 / 1024:.1f}MB"
+                  if bandit_stats["disk"] else "디스크 캐시 없음")
+        logging.info(f"♻️ Bandit 캐시: 적중 {bandit_stats['memory_hits'] + bandit_stats['hits']}건 "
+                     f"(메모리 {bandit_stats['memory_hits']} / 디스크 {bandit_stats['hits']}) / "
+                     f"미적중 {bandit_stats['misses']}건 ({stored})")
+
+    logging.info(f"\n로그 파일이 저장되었습니다: {log_file}")
+    if os.path.exists(RESULTS_LOG):
+        logging.info(f"테스트별 결과(JSONL)가 저장되었습니다: {RESULTS_LOG}")
+    if queue is not None:
+        logging.info(f"작업 큐: {args.queue} (모든 단위가 끝나면 --queue-role reduce 로 집계)")
+    else:
+        logging.info(f"체크포인트 저널: {journal_path} (중단되면 --resume 으로 이어 실행)")
+        if not args.no_warehouse:
+            logging.info(f"결과 저장소: {args.warehouse} (조회: python3 -m harness.warehouse rate --category A3)")
+
+# 메인 실행 부분
+if __name__ == "__main__":
+    main()
@@ -1,96 +1,14 @@
-import yaml
-import requests
-import sqlite3
+"""
+Flask File API 보안 시나리오 실행기
+사용:  python security_test.py
+실행: harness/scenario_engine.py (endpoint 방언)
+"""
 import os
-import shutil
+import sys
 
-# uploads 디렉토리와 dummy.txt 생성
-base_dir = os.path.dirname(os.path.abspath(__file__))
-os.makedirs(os.path.join(base_dir, 'uploads'), exist_ok=True)
-# 절대 경로로 scenario.yaml 접근
-dummy_path = os.path.join(base_dir, "uploads/dummy.txt")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from harness.scenario_engine import run_file  # noqa: E402
 
-with open(dummy_path, 'w') as f:
-    f.write('sample file')
 
-def load_scenarios(path='scenario.yaml'):
-    with open(os.path.join(base_dir, path), encoding='utf-8') as f:
-        return yaml.safe_load(f)
-
-def run_test(base_url, test):
-    sess = requests.Session()
-    if test.get('login'):
-        sess.get(f"{base_url}/login/{test['login']}")
-
-    url = base_url + test['endpoint']
-    method = test.get('method', 'GET').upper()
-
-    if method == 'POST':
-        files = {}
-        for key, val in test.get('files', {}).items():
-            files[key] = (val[0], val[1].encode(), val[2])
-        resp = sess.post(url, files=files, data=test.get('form', {}))
-    else:
-        resp = sess.get(url)
-
-    status = resp.status_code
-    vuln = False
-    reason = ''
-    chk = test['check']
-
-    conn = sqlite3.connect(os.path.join(base_dir, 'mock_db.sqlite3'))
-    cursor = conn.cursor()
-
-    if chk['type'] == 'status_code':
-        expect = chk.get('expect')
-        if status != expect:
-            vuln = True
-            reason = chk['reason']
-
-    elif chk['type'] == 'status_code_in':
-        expected = chk.get('expect', [])
-        if status not in expected:
-            vuln = True
-            reason = chk['reason']
-
-    elif chk['type'] == 'db_entry':
-        try:
-            cursor.execute(chk['query'])
-            row = cursor.fetchone()
-            if row:
-                vuln = True
-                reason = chk['reason'].format(*row)
-        except Exception as e:
-            vuln = True
-            reason = f"쿼리 실행 실패 또는 예외 발생: {e}"
-
-    elif chk['type'] == 'content':
-        content = resp.text
-        if chk.get('should_not_contain') in content:
-            vuln = True
-            reason = chk['reason']
-
-    conn.close()
-    return status, vuln, reason
-
-def main():
-    cfg = load_scenarios()
-    base_url = cfg['base_url']
-    for t in cfg['tests']:
-        status, vuln, reason = run_test(base_url, t)
-        result = '❌ 취약' if vuln else '✅ 안전'
-        print('--------------------------------------------------')
-        print(f"[Test ID: {t['id']}] {t['title']}")
-        print(f"Status Code: {status}")
-        print(f"결과: {result}")
-        if vuln:
-            print(f"이유: {reason}")
-        print('--------------------------------------------------')
-    # 테스트 끝난 후 uploads 폴더 삭제
-    if os.path.exists('uploads'):
-        shutil.rmtree('uploads')
-
-
-if __name__ == '__main__':
-    print("flask-sqlite : file_test 보안 테스트 시작")
-    main()
\ No newline at end of file
+if __name__ == "__main__":
+    run_file(__file__, dialect="endpoint", fixtures={"uploads/dummy.txt": "sample file"}, cleanup=["uploads"])
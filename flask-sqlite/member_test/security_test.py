@@ -1,54 +1,14 @@
-import yaml
-import requests
+"""
+Flask Member API 보안 시나리오 실행기
+사용:  python security_test.py
+실행: harness/scenario_engine.py (endpoint 방언)
+"""
 import os
+import sys
 
-def load_scenarios(path="scenario.yaml"):
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    with open(os.path.join(base_dir, path), "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from harness.scenario_engine import run_file  # noqa: E402
 
-def login_as_user(base_url, user_id):
-    return requests.get(f"{base_url}/login/{user_id}")
-
-def run_test(test, base_url):
-    url = base_url + test["endpoint"]
-    method = test["method"].lower()
-    session = requests.Session()
-
-    if "session_login" in test:
-        resp = login_as_user(base_url, test["session_login"])
-        if resp.status_code != 200:
-            return test["id"], "❌ 실패", f"로그인 실패 (user_id: {test['session_login']})"
-
-    resp = getattr(session, method)(url, data=test.get("data", {}), allow_redirects=False)
-
-    # 상태 코드 검증 (범위로)
-    expected_range = test.get("expected_status_range", [200, 200])
-    if not (expected_range[0] <= resp.status_code <= expected_range[1]):
-        return test["id"], "❌ 취약", f"이유: 예상 코드 {expected_range}, 실제 코드 {resp.status_code}"
-
-    # 콘텐츠 검증
-    if "validate" in test:
-        if "not_contains" in test["validate"]:
-            if test["validate"]["not_contains"] in resp.text:
-                return test["id"], "❌ 취약", f"이유: 악성 내용이 포함됨 ({test['validate']['not_contains']})"
-
-    return test["id"], "✅ 안전", "이유: 모든 조건 통과"
-
-
-def main():
-    scenarios = load_scenarios()
-    base_url = scenarios["base_url"]
-    print("-" * 50)
-    for test in scenarios["tests"]:
-        test_id, result, reason = run_test(test, base_url)
-        print(f"[Test ID: {test_id}] {test['name']}")
-        print(f"Status Code: {test.get('expected_status', 200)}")
-        print(f"결과: {result}")
-        print(f"{reason}")
-        print("-" * 50)
 
 if __name__ == "__main__":
-
-    print("flask-sqlite : member_test 보안 테스트 시작")
-    main()
+    run_file(__file__, dialect="endpoint", follow_redirects=False)
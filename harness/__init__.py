@@ -0,0 +1,3 @@
+"""
+harness – auto_*.py 드라이버들이 공유하는 실행/집계 유틸리티
+"""
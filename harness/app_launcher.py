@@ -0,0 +1,88 @@
+"""
+app_launcher.py – 생성된 app.py 를 할당된 포트로 실행하는 래퍼
+
+사용법: HARNESS_PORT=<port> python3 harness/app_launcher.py app.py
+
+app.run / uvicorn.run / runserver 호출을 가로채 host/port 를 HARNESS_PORT 로
+바꾸고, 종료 시 자식 프로세스가 남지 않도록 reloader 를 끈다.
+"""
+import os
+import runpy
+import sys
+
+HOST = "127.0.0.1"
+
+
+def _port():
+    return int(os.environ["HARNESS_PORT"])
+
+
+def _patch_flask(module):
+    original_run = module.Flask.run
+
+    def run(self, host=None, port=None, debug=None, load_dotenv=True, **options):
+        options["use_reloader"] = False
+        return original_run(self, host=HOST, port=_port(), debug=debug,
+                            load_dotenv=load_dotenv, **options)
+
+    module.Flask.run = run
+
+
+def _patch_uvicorn(module):
+    original_run = module.run
+
+    def run(app, *args, **kwargs):
+        kwargs.update(host=HOST, port=_port(), reload=False, workers=None)
+        return original_run(app, *args, **kwargs)
+
+    module.run = run
+    # uvicorn 패키지의 main 속성은 함수이므로 서브모듈은 sys.modules 에서 찾는다
+    main_module = sys.modules.get("uvicorn.main")
+    if main_module is not None:
+        main_module.run = run
+
+
+def _runserver_argv(argv):
+    argv = list(argv)
+    if "runserver" not in argv:
+        return argv
+    idx = argv.index("runserver")
+    # 기존 addrport 인자는 버리고 할당된 포트와 --noreload 를 지정
+    options = [a for a in argv[idx + 1:] if a.startswith("-") and a != "--noreload"]
+    return argv[:idx + 1] + [f"{HOST}:{_port()}", "--noreload"] + options
+
+
+def _patch_django(module):
+    original = module.execute_from_command_line
+
+    def execute_from_command_line(argv=None):
+        return original(_runserver_argv(argv if argv is not None else sys.argv))
+
+    module.execute_from_command_line = execute_from_command_line
+
+
+def install_port_hooks():
+    from harness.hooks import when_imported
+
+    when_imported("flask", _patch_flask)
+    when_imported("uvicorn", _patch_uvicorn)
+    when_imported("django.core.management", _patch_django)
+
+
+def main():
+    app_path = os.path.abspath(sys.argv[1])
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    sys.path.insert(0, repo_root)
+    install_port_hooks()
+    sys.path.remove(repo_root)
+
+    # python3 app.py 로 실행한 것과 같은 sys.path / argv 구성
+    sys.path[0] = os.path.dirname(app_path)
+    sys.argv = [app_path] + sys.argv[2:]
+    os.environ.setdefault("PORT", str(_port()))
+    runpy.run_path(app_path, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
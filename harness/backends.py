@@ -0,0 +1,424 @@
+"""
+backends.py – 코드 생성 백엔드 등록부
+
+  runpod  RunPod 서버리스 엔드포인트 (/run + /status 폴링, --async-client 면 일괄 제출)
+  vllm    로컬 GPU 의 vLLM 으로 일괄 생성 (스윕마다 프롬프트를 한 번의 generate 로 제출, 프리픽스 캐시 사용)
+  local   네트워크/GPU 없이 저장소의 참조 app.py 를 생성 결과로 돌려주는 대역 (runpod_stub 과 같은 규칙)
+
+백엔드는 GenerationRequest(평가 단위, 프레임워크, 타깃, 샘플 번호) 를 받아
+  stream(jobs)      일괄 생성 – 끝나는 대로 [(unit, markdown 또는 None), ...] 묶음을 yield
+  generate(request) 한 건 동기 생성 (stream 에서 빠졌거나 재시도할 때), 실패는 AttemptFailed
+  cache_key(request), extract(markdown) (harness.extract 로 코드 추출 + ast 확인), legacy_code(markdown)
+를 제공한다.
+--stream-guard 면 runpod/vllm 모두 생성을 조각 단위로 받아 harness.stream_guard 로 검사하고,
+완성된 코드 블록이 닫히면 바로 받아들이거나 반복/설명 문장에 빠진 생성을 끊어 바로 재생성한다.
+"""
+import itertools
+import logging
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+import requests
+
+from harness import metrics
+from harness import retry
+from harness.extract import extract_code
+from harness.frameworks import Framework
+from harness.gen_cache import generation_key, key_for_messages
+from harness.retry import AttemptFailed
+from harness.runpod_client import RunPodClient, iter_generations, extract_text, stream_text, stream_url
+from harness.runpod_stub import FALLBACK_OUTPUT, load_canned_outputs
+from harness.stream_guard import StreamGuard
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SYSTEM_PROMPT = "You are Qwen, created by Alibaba Cloud. You are a helpful assistant."
+
+BACKENDS = {}
+
+
+def backend(name):
+    def decorator(cls):
+        cls.name = name
+        BACKENDS[name] = cls
+        return cls
+    return decorator
+
+
+def create_backend(name, args):
+    try:
+        return BACKENDS[name](args)
+    except KeyError:
+        raise ValueError(f"알 수 없는 백엔드: {name} (가능: {', '.join(BACKENDS)})")
+
+
+@dataclass
+class GenerationRequest:
+    unit: str               # 평가 단위 ("폴더" 또는 "폴더#샘플번호")
+    framework: Framework
+    target: str             # "flask-sqlite/board_test"
+    sample: int = 0
+
+
+# prompt.txt 파일 읽기
+def read_prompt(target):
+    prompt_path = os.path.join(REPO_ROOT, target, "prompt.txt")
+    with open(prompt_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def log_prefix_cache(log=logging.info):
+    """vLLM 프리픽스 캐시 적중률 (프롬프트 토큰 중 캐시에서 재사용한 비율)"""
+    prompt_tokens = [value for _, value in metrics.values("prompt_tokens")]
+    cached_tokens = [value for _, value in metrics.values("cached_prompt_tokens")]
+    if not prompt_tokens or not cached_tokens:
+        return
+    total, cached = sum(prompt_tokens), sum(cached_tokens)
+    log(f"\n🧠 vLLM 프리픽스 캐시: 프롬프트 {len(prompt_tokens)}건, 토큰 {total}개 중 {cached}개 재사용 "
+        f"(적중률 {cached / total * 100:.1f}%, 요청당 prefill {(total - cached) / len(prompt_tokens):.0f} 토큰)")
+
+
+def stopped_output(stop):
+    """StreamGuard 가 끊은 생성 → 받아들인 출력, 받아들일 수 없으면 AttemptFailed (바로 재생성)"""
+    if stop.accept:
+        return stop.text
+    raise AttemptFailed(retry.GENERATION, f"생성 조기 중단 ({stop.reason}: {stop.detail})")
+
+
+class Backend:
+    name = None
+    model = None    # 캐시 키/저널 설정에 쓰는 모델 식별자 (엔드포인트 URL, 모델 경로 등)
+
+    def __init__(self, args):
+        self.args = args
+        self.model = self.model_id(args)
+        self.stream_guard = getattr(args, "stream_guard", False)
+
+    @classmethod
+    def model_id(cls, args):
+        """엔진을 띄우지 않고 모델 식별자만 구한다 (작업 큐에 단위를 넣을 때)"""
+        return cls.name
+
+    def temperature(self, request):
+        return request.framework.temperature(self.name)
+
+    def stream(self, jobs):
+        """기본은 일괄 생성 없음 – 모든 단위가 워커에서 generate() 로 생성된다."""
+        return iter(())
+
+    def generate(self, request):
+        raise NotImplementedError
+
+    def cache_key(self, request):
+        raise NotImplementedError
+
+    def extract(self, markdown):
+        """펜스 형식에 상관없이 코드를 꺼내 ast.parse 로 확인한다 (harness.extract)"""
+        return extract_code(markdown)
+
+    def parse_code(self, markdown):
+        return self.extract(markdown).code
+
+    def legacy_code(self, markdown):
+        """이 백엔드의 기존 추출 방식 (재생성 절약 횟수를 셀 때 비교용)"""
+        return markdown.strip()
+
+    def close(self):
+        pass
+
+
+@backend("runpod")
+class RunPodBackend(Backend):
+    MAX_TOKENS = 8192
+
+    def __init__(self, args):
+        super().__init__(args)
+        # RunPod API 설정 (환경 변수로 로컬 대역 서버 등을 지정할 수 있음)
+        self.run_url = os.environ.get("RUNPOD_RUN_URL", "https://api.runpod.ai/v2/sggrcbr26xtyx4/run")
+        self.status_url_base = os.environ.get("RUNPOD_STATUS_URL_BASE", "https://api.runpod.ai/v2/sggrcbr26xtyx4/status/")
+        self.api_key = os.environ.get("RUNPOD_API_KEY", "rpa_JXPAS3TMYRYAT0H0ZVXSGENZ3BIET1EMOBKUCJMP0yngu7")
+        # --stream-guard: /stream 으로 조각을 받고, 끊을 때 /cancel
+        self.stream_url_base = stream_url(self.status_url_base, "stream")
+        self.cancel_url_base = stream_url(self.status_url_base, "cancel")
+        self.client = None
+
+    @classmethod
+    def model_id(cls, args):
+        return os.environ.get("RUNPOD_RUN_URL", "https://api.runpod.ai/v2/sggrcbr26xtyx4/run")
+
+    # 요청 payload
+    def payload(self, request):
+        payload = {
+            "input": {
+                "messages": [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": read_prompt(request.target)},
+                ],
+                "sampling_params": {
+                    "temperature": self.temperature(request),
+                    "max_tokens": self.MAX_TOKENS,
+                },
+            }
+        }
+        if self.stream_guard:
+            payload["input"]["stream"] = True
+        return payload
+
+    def cache_key(self, request):
+        payload = self.payload(request)
+        sampling = payload["input"]["sampling_params"]
+        return key_for_messages(payload["input"]["messages"], self.model, sampling["temperature"],
+                                sampling["max_tokens"], sampling.get("seed"), request.sample)
+
+    def legacy_code(self, markdown):
+        # ```python\n ... ``` 를 고정 위치로 벗겨내던 방식
+        return markdown[10:-3].strip()
+
+    def generate(self, request):
+        """RunPod 에 생성 요청을 보내고 완료될 때까지 기다려 마크다운을 돌려준다."""
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+
+        # 1단계: Run 요청 보내기
+        try:
+            run_response = requests.post(self.run_url, headers=headers, json=self.payload(request))
+            run_response.raise_for_status()  # HTTP 에러 체크
+        except requests.exceptions.RequestException as e:
+            logging.error(f"응답 내용: {run_response.text if 'run_response' in locals() else 'No response'}")
+            raise AttemptFailed(retry.API, f"API 요청 실패: {str(e)}")
+
+        job_id = run_response.json().get("id")
+        if not job_id:
+            logging.error(f"응답 내용: {run_response.text}")
+            raise AttemptFailed(retry.API, "Job ID를 받지 못했습니다.")
+
+        if self.stream_guard:
+            return self._follow_stream(request, job_id, headers)
+
+        # 2단계: 상태 확인 (비동기 완료 대기)
+        while True:
+            try:
+                status_response = requests.get(f"{self.status_url_base}{job_id}", headers=headers)
+                status_response.raise_for_status()
+                status_data = status_response.json()
+            except requests.exceptions.RequestException as e:
+                raise AttemptFailed(retry.API, f"상태 확인 중 오류 발생: {str(e)}")
+            status = status_data.get("status")
+
+            if status == "COMPLETED":
+                # 마크다운 텍스트 추출
+                return extract_text(status_data)
+            elif status == "FAILED":
+                raise AttemptFailed(retry.GENERATION, f"작업 실패: {status_data}")
+            else:
+                time.sleep(1.5)
+
+    def _follow_stream(self, request, job_id, headers):
+        """/stream 으로 조각을 받으며 검사하고, 끊어야 하면 작업을 취소한다."""
+        guard = StreamGuard(request.target)
+        while True:
+            try:
+                stream_response = requests.get(f"{self.stream_url_base}{job_id}", headers=headers)
+                stream_response.raise_for_status()
+                stream_data = stream_response.json()
+            except requests.exceptions.RequestException as e:
+                raise AttemptFailed(retry.API, f"스트림 확인 중 오류 발생: {str(e)}")
+
+            for item in stream_data.get("stream", []):
+                stop = guard.feed(stream_text(item))
+                if stop is not None:
+                    try:
+                        requests.post(f"{self.cancel_url_base}{job_id}", headers=headers).raise_for_status()
+                    except requests.exceptions.RequestException as e:
+                        logging.warning(f"작업 취소 실패 ({job_id}): {e}")
+                    return stopped_output(stop)
+
+            status = stream_data.get("status")
+            if status == "COMPLETED":
+                return guard.finish()
+            elif status in ("FAILED", "CANCELLED", "TIMED_OUT"):
+                raise AttemptFailed(retry.GENERATION, f"작업 실패: {stream_data}")
+            elif not stream_data.get("stream"):
+                time.sleep(0.5)
+
+    def stream(self, jobs):
+        # --async-client: 모든 프롬프트를 먼저 제출하고 끝나는 대로 돌려준다
+        if not getattr(self.args, "async_client", False):
+            return
+        self.client = RunPodClient(self.run_url, self.status_url_base, self.api_key,
+                                   guard=StreamGuard if self.stream_guard else None)
+        payloads = {request.unit: self.payload(request) for request in jobs}
+        for unit, status_data in iter_generations(self.client, payloads):
+            if status_data.get("status") == "COMPLETED":
+                yield [(unit, extract_text(status_data))]
+            else:
+                # 실패한 작업은 None 으로 넘겨 워커가 generate() 로 다시 요청하도록 한다
+                logging.error(f"❌ 작업 실패 ({unit}): {status_data}")
+                yield [(unit, None)]
+
+    def close(self):
+        if self.client is not None:
+            self.client.close()
+
+
+@backend("local")
+class LocalBackend(RunPodBackend):
+    """RunPod 와 같은 프롬프트/파싱 규칙으로, 프롬프트가 같은 폴더의 참조 app.py 를 바로 돌려준다."""
+
+    def __init__(self, args):
+        super().__init__(args)
+        # 드라이버가 app.py 를 덮어쓰기 전에 읽어 둔다
+        self.canned = load_canned_outputs(REPO_ROOT)
+
+    @classmethod
+    def model_id(cls, args):
+        return "local"
+
+    def generate(self, request):
+        return self.canned.get(read_prompt(request.target), FALLBACK_OUTPUT)
+
+    def stream(self, jobs):
+        return iter(())
+
+
+@backend("vllm")
+class VLLMBackend(Backend):
+    MAX_TOKENS = 4096
+    OUTPUT_RULES = """**Output Rules:**
+1. Generate only raw executable Python code
+2. Never use makrdown code blocks (``````)
+3. Exclude any explanations or comments
+4. Ensure code starts with 'import' statement
+
+Example valid output format:
+import module
+def function():
+"""
+
+    def __init__(self, args):
+        super().__init__(args)
+        from vllm import LLM, SamplingParams
+        from transformers import AutoTokenizer
+        # 모델 및 토크나이저 초기화
+        self.model_path = args.model_path  # 예: "Qwen/Qwen1.5-7B-Chat"
+        # 모든 프롬프트가 같은 시스템 프롬프트 + 출력 규칙으로 시작하므로 그 KV 캐시를 재사용한다
+        self.llm = LLM(model=self.model_path, enable_prefix_caching=True)
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_path)
+        self.sampling_params = SamplingParams
+        self.samples = args.samples
+        # LLM 엔진은 스레드 안전하지 않으므로 일괄 생성과 재시도 생성을 한 번에 하나씩
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count()
+
+    @classmethod
+    def model_id(cls, args):
+        return args.model_path
+
+    def prompt(self, request):
+        # vLLM용 메시지 포맷 구성 – 타깃마다 같은 출력 규칙을 시스템 메시지에 두어
+        # 타깃별 prompt.txt 앞까지가 모든 요청의 공통 프리픽스가 되게 한다 (프리픽스 캐시)
+        return self.tokenizer.apply_chat_template([
+            {"role": "system", "content": SYSTEM_PROMPT + "\n\n" + self.OUTPUT_RULES},
+            {"role": "user", "content": read_prompt(request.target)}
+        ], tokenize=False, add_generation_prompt=True)
+
+    def cache_key(self, request):
+        # 프롬프트에 시스템 프롬프트와 출력 규칙이 모두 들어 있다
+        return generation_key(self.prompt(request), "", self.model_path, self.temperature(request),
+                              self.MAX_TOKENS, None, request.sample)
+
+    def legacy_code(self, markdown):
+        # 첫 번째 ```python 블록만 보던 방식
+        match = re.search(r"```python\n(.*?)```", markdown, re.DOTALL)
+        return match.group(1).strip() if match else markdown.strip()
+
+    def _generate(self, prompts, temperature, n, labels=None):
+        """프롬프트마다 후보 n 개의 출력 텍스트 목록 (--stream-guard 로 끊어 재생성할 후보는 None)"""
+        # 샘플링 파라미터 설정 (n: 프롬프트당 후보 수)
+        params = self.sampling_params(temperature=temperature, max_tokens=self.MAX_TOKENS, n=n)
+        labels = labels or [""] * len(prompts)
+        with self._lock:
+            if self.stream_guard:
+                return self._generate_guarded(prompts, params, n, labels)
+            outputs = self.llm.generate(prompts, params)
+        for label, output in zip(labels, outputs):
+            _record_prefix(label, output)
+        return [[candidate.text for candidate in output.outputs] for output in outputs]
+
+    def _generate_guarded(self, prompts, params, n, labels):
+        # llm.generate 대신 엔진을 한 스텝씩 돌려 (연속 배칭은 그대로) 후보마다 새 토큰을 StreamGuard 로 검사한다.
+        # 한 요청의 후보 n 개가 모두 결정되면 (끝남/받아들임/끊음) 그 요청을 엔진에서 뺀다.
+        engine = self.llm.llm_engine
+        request_ids = [f"guard-{next(self._request_ids)}" for _ in prompts]
+        guards = {rid: [StreamGuard(label) for _ in range(n)] for rid, label in zip(request_ids, labels)}
+        texts = {rid: [None] * n for rid in request_ids}
+        decided = {rid: [False] * n for rid in request_ids}
+        for rid, prompt in zip(request_ids, prompts):
+            engine.add_request(rid, prompt, params)
+
+        labels = dict(zip(request_ids, labels))
+        while engine.has_unfinished_requests():
+            for output in engine.step():
+                rid = output.request_id
+                if rid in labels:
+                    # 프롬프트 캐시 사용량은 첫 출력에 이미 들어 있다
+                    _record_prefix(labels.pop(rid), output)
+                for candidate in output.outputs:
+                    i = candidate.index
+                    if decided[rid][i]:
+                        continue
+                    guard = guards[rid][i]
+                    stop = guard.feed(candidate.text[len(guard.text()):])
+                    if stop is not None:
+                        texts[rid][i] = stop.text if stop.accept else None
+                        decided[rid][i] = True
+                    elif candidate.finish_reason is not None:
+                        texts[rid][i] = guard.finish()
+                        decided[rid][i] = True
+                if not output.finished and all(decided[rid]):
+                    engine.abort_request(rid)
+        return [texts[rid] for rid in request_ids]
+
+    def stream(self, jobs):
+        # 같은 스윕(샘플 번호 // n)·같은 온도의 프롬프트를 한 번의 generate 호출로 제출해 엔진의 연속 배칭을 활용
+        n = self.samples
+        batches = defaultdict(lambda: defaultdict(dict))   # (스윕, 온도) → 타깃 → {샘플 번호: 요청}
+        for request in jobs:
+            batches[(request.sample // n, self.temperature(request))][request.target][request.sample] = request
+
+        for sweep, temperature in sorted(batches, key=lambda key: key[0]):
+            by_target = batches[(sweep, temperature)]
+            if n > 1 and temperature == 0:
+                logging.warning("⚠️ temperature=0 에서는 후보들이 모두 같으므로 pass@k 가 의미 없습니다.")
+            logging.info(f"\n🚀 스윕 {sweep + 1}: 프롬프트 {len(by_target)}개 일괄 생성 (temperature={temperature})")
+            targets = list(by_target)
+            prompts = [self.prompt(next(iter(by_target[target].values()))) for target in targets]
+            outputs = self._generate(prompts, temperature, n, targets)
+            # vLLM 은 입력 순서대로 결과를 돌려준다 (타깃마다 n 개 후보, 끊은 후보는 None → 워커가 다시 생성)
+            batch = []
+            for target, candidates in zip(targets, outputs):
+                for i, text in enumerate(candidates):
+                    request = by_target[target].get(sweep * n + i)
+                    if request is not None:
+                        batch.append((request.unit, text))
+            yield batch
+
+    def generate(self, request):
+        candidates = self._generate([self.prompt(request)], self.temperature(request), 1, [request.target])[0]
+        if candidates and candidates[0] is None:
+            raise AttemptFailed(retry.GENERATION, "생성 조기 중단 (재생성)")
+        return candidates[0] if candidates else ""
+
+
+def _record_prefix(label, output):
+    # num_cached_tokens 가 없는 vLLM 버전이면 적중률을 남기지 않는다
+    cached = getattr(output, "num_cached_tokens", None)
+    if cached is None or not output.prompt_token_ids:
+        return
+    metrics.record("prompt_tokens", label, len(output.prompt_token_ids))
+    metrics.record("cached_prompt_tokens", label, cached)
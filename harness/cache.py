@@ -0,0 +1,113 @@
+"""
+cache.py – 내용 해시 키 기반 디스크 캐시 (JSON 파일, LRU/용량 기반 정리)
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+
+def content_hash(*parts):
+    """parts 를 정규화된 JSON 으로 직렬화한 SHA-256 (캐시 키)"""
+    data = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """
+    <root>/<key[:2]>/<key>.json 형태로 값을 저장한다.
+    읽을 때마다 mtime 을 갱신하고, 전체 크기나 항목 수가 한도를 넘으면
+    가장 오래 쓰이지 않은 항목부터 지운다.
+    """
+
+    def __init__(self, root, max_bytes=512 * 1024 * 1024, max_entries=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        self._size, self._count = self._scan_totals()
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], f"{key}.json")
+
+    def _entries(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith(".json"):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    yield path, st.st_size, st.st_mtime
+
+    def _scan_totals(self):
+        size = count = 0
+        for _, entry_size, _ in self._entries():
+            size += entry_size
+            count += 1
+        return size, count
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                value = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path)   # LRU 순서 갱신
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        # 다른 스레드/프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일 후 교체
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        with self._lock:
+            old_size = os.path.getsize(path) if os.path.exists(path) else None
+            os.replace(tmp_path, path)
+            if old_size is None:
+                self._count += 1
+                self._size += len(data)
+            else:
+                self._size += len(data) - old_size
+            if self._over_limit():
+                self._evict()
+
+    def _over_limit(self):
+        if self.max_bytes is not None and self._size > self.max_bytes:
+            return True
+        return self.max_entries is not None and self._count > self.max_entries
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        self._size = sum(size for _, size, _ in entries)
+        self._count = len(entries)
+        for path, size, _ in entries:
+            if not self._over_limit():
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            self._size -= size
+            self._count -= 1
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "entries": self._count, "bytes": self._size}
@@ -0,0 +1,257 @@
+"""
+extract.py – 모델 출력(마크다운)에서 app.py 코드를 꺼낸다
+
+  ```python / ```py / ``` / ~~~ 등 어떤 펜스든, 닫히지 않은 마지막 블록(출력이 잘린 경우)도 받는다.
+  블록이 여럿이면
+    - 서로 이어지는 조각(앞 블록이 정의한 이름을 다시 정의하지 않음)은 순서대로 이어 붙이고
+    - 같은 코드의 다른 판(같은 함수/변수를 다시 정의)이면 가장 긴 블록 하나를 고른다.
+  펜스가 없으면 출력 전체를 코드로 보고, 앞뒤의 설명 문장을 잘라낸다.
+  마지막에 ast.parse 로 확인해 파싱되지 않으면 ok=False (드라이버는 앱을 띄우지 않고 바로 재생성).
+
+CodeScanner 는 줄 단위 상태 기계라 토큰이 도착하는 대로 feed() 할 수 있다.
+기존 추출 방식(고정 슬라이스, 첫 블록 정규식)이면 파싱에 실패했을 출력을 살린 횟수를
+'재생성 절약' 으로 센다.
+"""
+import ast
+import logging
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+
+# 여는 펜스: ``` 또는 ~~~ (3개 이상) + 언어 표기 (```python, ``` py, ~~~Python3 등)
+FENCE = re.compile(r"^\s{0,3}(`{3,}|~{3,})\s*([\w+.#-]*)")
+PYTHON_LANGS = {"", "python", "py", "python3", "py3", "python2", "ipython"}
+# 코드로 보이는 줄 (앞뒤 설명 문장을 자를 때 쓴다)
+CODE_START = re.compile(r"^(import |from \S+ import |#!|# |@|def |class |async def |if __name__|[A-Za-z_][\w.]*\s*(=|\())")
+CODE_LINE = re.compile(r"^\s*(import |from \S+ import |@|def |class |async def |return\b|if |elif |else:|for |while |with |try:|except\b|finally:|"
+                       r"[A-Za-z_][\w.\[\]'\"]*\s*[-+*/|&]?=|[A-Za-z_][\w.]*\(|[)\]}])")
+MAX_TRIMS = 20
+
+_lock = threading.Lock()
+_stats = Counter()
+
+
+@dataclass
+class Extraction:
+    code: str
+    ok: bool              # ast.parse 통과 여부
+    method: str           # fenced / joined / longest / raw / trimmed / empty
+    blocks: int = 0       # 파이썬 코드 블록 수
+    error: str = None
+
+
+class CodeScanner:
+    """마크다운을 줄 단위로 읽어 펜스 블록과 블록 밖의 텍스트를 나눈다."""
+
+    def __init__(self):
+        self.blocks = []      # [(언어, [줄...], 닫힘 여부), ...]
+        self.outside = []     # 블록 밖의 줄
+        self._partial = ""
+        self._open = None     # (펜스 문자열, 언어, [줄...])
+
+    def feed(self, text):
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._line(line.rstrip("\r"))
+        return self
+
+    def _line(self, line):
+        if self._open is None:
+            match = FENCE.match(line)
+            if match:
+                self._open = (match.group(1), match.group(2).lower(), [])
+            else:
+                self.outside.append(line)
+            return
+        fence, lang, lines = self._open
+        stripped = line.strip()
+        # 닫는 펜스: 여는 펜스와 같은 문자로만 이루어지고 길이가 같거나 긴 줄
+        if stripped and stripped == fence[0] * len(stripped) and len(stripped) >= len(fence):
+            self.blocks.append((lang, lines, True))
+            self._open = None
+        elif stripped.endswith(fence) and not stripped.endswith(fence[0] * (len(fence) + 1)):
+            # 마지막 코드 줄 끝에 붙은 닫는 펜스 ("    app.run()```")
+            lines.append(line.rstrip()[:-len(fence)])
+            self.blocks.append((lang, lines, True))
+            self._open = None
+        else:
+            lines.append(line)
+
+    def close(self):
+        if self._partial:
+            self._line(self._partial.rstrip("\r"))
+            self._partial = ""
+        if self._open is not None:
+            # 닫히지 않은 블록 (출력이 max_tokens 에서 잘린 경우)
+            _, lang, lines = self._open
+            self.blocks.append((lang, lines, False))
+            self._open = None
+        return self
+
+    def python_blocks(self):
+        """파이썬(또는 언어 표기 없음, *.py 파일명) 블록의 코드"""
+        return [_code(lines) for lang, lines, _ in self.blocks
+                if (lang in PYTHON_LANGS or lang.endswith(".py")) and "".join(lines).strip()]
+
+    def other_blocks(self):
+        return [_code(lines) for lang, lines, _ in self.blocks
+                if not (lang in PYTHON_LANGS or lang.endswith(".py")) and "".join(lines).strip()]
+
+
+def _code(lines):
+    return "\n".join(lines).strip("\n")
+
+
+def extract_code(text):
+    """모델 출력 → Extraction"""
+    text = text or ""
+    scanner = CodeScanner().feed(text).close()
+    blocks = scanner.python_blocks()
+    if not blocks:
+        # 언어 표기가 다른 블록뿐이면 (```flask 등) 파이썬으로 파싱되는 블록을 쓴다
+        blocks = [block for block in scanner.other_blocks() if _parse(block) is not None]
+    if not blocks:
+        return _from_raw("\n".join(scanner.outside) if scanner.blocks else text, 0)
+
+    trees = [_parse(block) for block in blocks]
+    if len(blocks) == 1:
+        return _finish(blocks[0], trees[0], "fenced", 1)
+
+    joined = _join(blocks, trees)
+    if joined is not None:
+        return Extraction(joined, True, "joined", len(blocks))
+
+    # 같은 코드의 여러 판 – 파싱되는 것 중 가장 긴 블록
+    parsed = [block for block, tree in zip(blocks, trees) if tree is not None]
+    if parsed:
+        return Extraction(max(parsed, key=len), True, "longest", len(blocks))
+    longest = max(blocks, key=len)
+    return _finish(longest, None, "longest", len(blocks))
+
+
+def _parse(code):
+    try:
+        return ast.parse(code)
+    except (SyntaxError, ValueError):
+        return None
+
+
+def _syntax_error(code):
+    try:
+        ast.parse(code)
+    except SyntaxError as e:
+        return e
+    except ValueError as e:
+        return SyntaxError(str(e))
+    return None
+
+
+def _defined_names(stmt):
+    if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return {stmt.name}
+    if isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+        targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+        return {node.id for target in targets for node in ast.walk(target) if isinstance(node, ast.Name)}
+    return set()
+
+
+def _join(blocks, trees):
+    """
+    블록들이 한 프로그램의 조각이면 이어 붙인 코드, 아니면 None.
+    앞에서 정의한 이름을 다른 내용으로 다시 정의하는 블록이 있으면 다른 판으로 본다.
+    앞 블록에 이미 있는 문장만 반복하는 블록(예: 실행 방법 예시)은 건너뛴다.
+    """
+    if any(tree is None for tree in trees):
+        return None
+    seen = set()          # 이미 나온 최상위 문장 (ast.dump)
+    defined = set()
+    parts = []
+    for block, tree in zip(blocks, trees):
+        dumps = [ast.dump(stmt) for stmt in tree.body]
+        if all(dump in seen for dump in dumps):
+            continue
+        for stmt, dump in zip(tree.body, dumps):
+            if dump not in seen and _defined_names(stmt) & defined:
+                return None
+        for stmt, dump in zip(tree.body, dumps):
+            seen.add(dump)
+            defined |= _defined_names(stmt)
+        parts.append(block)
+    code = "\n\n".join(parts)
+    return code if _parse(code) is not None else None
+
+
+def _from_raw(text, blocks):
+    code = text.strip()
+    if not code:
+        return Extraction("", False, "empty", blocks, "빈 출력")
+    return _finish(code, _parse(code), "raw", blocks)
+
+
+def _finish(code, tree, method, blocks):
+    if tree is not None:
+        return Extraction(code, True, method, blocks)
+    trimmed = trim_prose(code)
+    if trimmed != code and _parse(trimmed) is not None:
+        return Extraction(trimmed, True, "trimmed", blocks)
+    error = _syntax_error(code)
+    return Extraction(code, False, method, blocks, f"{error.msg} (line {error.lineno})" if error else None)
+
+
+def trim_prose(code):
+    """코드 앞의 설명 문장과, 파싱 오류가 난 줄부터 끝까지가 설명 문장뿐이면 그 꼬리를 잘라낸다."""
+    lines = code.split("\n")
+    start = next((i for i, line in enumerate(lines) if CODE_START.match(line)), 0)
+    lines = lines[start:]
+    for _ in range(MAX_TRIMS):
+        error = _syntax_error("\n".join(lines))
+        if error is None or not error.lineno:
+            break
+        tail = lines[error.lineno - 1:]
+        # 꼬리에 코드로 보이는 줄이 있으면 진짜 문법 오류 – 건드리지 않는다
+        if not tail or any(CODE_LINE.match(line) for line in tail):
+            break
+        lines = lines[:error.lineno - 1]
+        while lines and not lines[-1].strip():
+            lines.pop()
+    return "\n".join(lines).strip("\n")
+
+
+def compiles(code):
+    return _parse(code) is not None
+
+
+def record(extraction, target, legacy_code=None):
+    """
+    시도 한 번의 추출 결과를 센다. legacy_code 는 기존 방식으로 꺼낸 코드 –
+    그것은 파싱되지 않는데 새 방식은 파싱되면 재생성 한 번을 아낀 것으로 센다.
+    """
+    rescued = extraction.ok and legacy_code is not None and legacy_code.strip() != extraction.code.strip() \
+        and not compiles(legacy_code)
+    with _lock:
+        _stats["total"] += 1
+        _stats[extraction.method] += 1
+        if not extraction.ok:
+            _stats["failed"] += 1
+        if rescued:
+            _stats["rescued"] += 1
+    if rescued:
+        logging.info(f"🧩 기존 추출 방식이면 컴파일 실패였을 출력을 살렸습니다 ({extraction.method}): {target}")
+    return rescued
+
+
+def stats():
+    with _lock:
+        return dict(_stats)
+
+
+def log_summary(log=logging.info):
+    counts = stats()
+    if not counts.get("total"):
+        return
+    methods = ", ".join(f"{method} {counts[method]}" for method in
+                        ("fenced", "joined", "longest", "raw", "trimmed", "empty") if counts.get(method))
+    log(f"\n🧩 코드 추출: {counts['total']}건 ({methods}), 파싱 실패 {counts.get('failed', 0)}건, "
+        f"기존 방식 대비 재생성 {counts.get('rescued', 0)}회 절약")
@@ -0,0 +1,366 @@
+"""
+forkserver.py – 프레임워크를 미리 import 해 둔 프로세스에서 fork 로 app.py 를 띄우는 런처
+
+타깃마다 `python3 app_launcher.py app.py` 를 새로 실행하면 인터프리터 시작과
+Flask / FastAPI+uvicorn / Django import 비용을 매번 다시 낸다. 포크서버는 프레임워크별로
+한 번만 떠서 해당 스택을 import 해 두고, 실행 요청이 오면 fork 한 자식에서
+app_launcher 를 그대로 실행한다 (포트 훅/argv/sys.path 구성은 기존과 동일).
+
+  클라이언트 → 서버: [길이 4바이트 + stdin/stdout/stderr fd] 뒤에 JSON {"argv", "cwd", "env"}
+  서버 → 클라이언트: {"pid"} 를 보내고, 자식이 끝나면 {"returncode"} 를 보낸 뒤 연결을 닫는다.
+
+정리 규칙
+  - 자식은 setsid 로 새 프로세스 그룹을 만들고, terminate()/kill() 은 그룹 전체에 신호를 보낸다.
+  - 자식은 stdio 를 받은 fd 로 바꾼 뒤 나머지 fd(리스닝 소켓 등)를 모두 닫는다.
+  - 클라이언트 연결이 끊기면 서버가 그 자식 그룹을 SIGKILL 하고, 서버가 끝날 때도 모든 자식을 죽인다.
+"""
+import argparse
+import atexit
+import importlib
+import json
+import os
+import runpy
+import selectors
+import shutil
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 프레임워크별 preload (harness.frameworks) 에 더해 항상 미리 import 할 모듈
+COMMON_PRELOAD = ["harness.app_launcher", "harness.hooks", "harness.ports"]
+
+START_TIMEOUT = 30
+_HEADER = struct.Struct("!I")
+
+
+##############################################################################
+# 서버
+##############################################################################
+def _preload(modules):
+    loaded = []
+    for name in list(modules) + COMMON_PRELOAD:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except Exception:
+            pass
+    return loaded
+
+
+def _recv_exact(conn, size):
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("연결이 끊김")
+        data += chunk
+    return data
+
+
+def _send_json(conn, message):
+    payload = json.dumps(message).encode("utf-8")
+    conn.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_json(conn):
+    (size,) = _HEADER.unpack(_recv_exact(conn, _HEADER.size))
+    return json.loads(_recv_exact(conn, size))
+
+
+def _exit_code(status):
+    return os.waitstatus_to_exitcode(status)
+
+
+def _run_child(request, fds):
+    """fork 된 자식: python3 <script> <args...> 와 같은 상태를 만들고 스크립트를 실행한다."""
+    os.setsid()
+    for target_fd, fd in enumerate(fds):
+        os.dup2(fd, target_fd)
+    os.closerange(3, os.sysconf("SC_OPEN_MAX") if hasattr(os, "sysconf") else 1024)
+    for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGCHLD, signal.SIGPIPE):
+        signal.signal(sig, signal.SIG_DFL)
+
+    code = 0
+    try:
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        script = request["argv"][1]
+        sys.argv = request["argv"][1:]
+        sys.path[0] = os.path.dirname(os.path.abspath(script))
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+def _kill_group(pid, sig=signal.SIGKILL):
+    try:
+        os.killpg(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def serve(sock_path, modules):
+    _preload(modules)
+    parent = os.getppid()
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    if os.path.exists(sock_path):
+        os.remove(sock_path)
+    listener.bind(sock_path)
+    listener.listen(64)
+
+    selector = selectors.DefaultSelector()
+    selector.register(listener, selectors.EVENT_READ)
+    children = {}   # pid → 클라이언트 연결
+
+    def shutdown(*_):
+        for pid in list(children):
+            _kill_group(pid)
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, shutdown)
+    try:
+        while True:
+            for key, _ in selector.select(timeout=0.05):
+                if key.fileobj is listener:
+                    conn, _ = listener.accept()
+                    try:
+                        header, fds, _, _ = socket.recv_fds(conn, _HEADER.size, 3)
+                        (size,) = _HEADER.unpack(header)
+                        request = json.loads(_recv_exact(conn, size))
+                    except (OSError, ValueError):
+                        conn.close()
+                        continue
+                    pid = os.fork()
+                    if pid == 0:
+                        _run_child(request, fds)
+                    for fd in fds:
+                        os.close(fd)
+                    children[pid] = conn
+                    selector.register(conn, selectors.EVENT_READ, pid)
+                    _send_json(conn, {"pid": pid})
+                else:
+                    # 자식이 살아 있는 동안 클라이언트가 보내는 것은 없다 → EOF = 클라이언트가 떠남
+                    pid = key.data
+                    if not key.fileobj.recv(1):
+                        selector.unregister(key.fileobj)
+                        _kill_group(pid)
+
+            # 끝난 자식 회수 후 종료 코드 전달
+            while children:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+                if pid == 0:
+                    break
+                conn = children.pop(pid, None)
+                if conn is None:
+                    continue
+                _kill_group(pid)   # 앱이 남긴 손자 프로세스까지 정리
+                try:
+                    selector.unregister(conn)
+                except (KeyError, ValueError):
+                    pass
+                try:
+                    _send_json(conn, {"returncode": _exit_code(status)})
+                except OSError:
+                    pass
+                conn.close()
+
+            # 드라이버가 죽으면 함께 종료
+            if os.getppid() != parent:
+                shutdown()
+    finally:
+        listener.close()
+        if os.path.exists(sock_path):
+            os.remove(sock_path)
+
+
+##############################################################################
+# 클라이언트
+##############################################################################
+class ForkedProcess:
+    """subprocess.Popen 에서 드라이버가 쓰는 부분(poll/wait/terminate/kill/communicate)만 흉내 낸다."""
+
+    def __init__(self, args, conn, pid, capture):
+        self.args = args
+        self.pid = pid
+        self.returncode = None
+        self._conn = conn
+        self._capture = capture   # (stdout 파일, stderr 파일) – PIPE 로 요청한 것만
+
+    def _read_returncode(self, timeout):
+        self._conn.settimeout(timeout)
+        try:
+            self.returncode = _recv_json(self._conn)["returncode"]
+        except (socket.timeout, BlockingIOError):
+            return None
+        except (OSError, ValueError):
+            # 서버가 사라진 경우 – 그룹째 정리하고 실패로 본다
+            _kill_group(self.pid)
+            self.returncode = -signal.SIGKILL
+        self._conn.close()
+        return self.returncode
+
+    def poll(self):
+        if self.returncode is None:
+            self._read_returncode(0)
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if self.returncode is None and self._read_returncode(timeout) is None:
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def send_signal(self, sig):
+        if self.returncode is None:
+            _kill_group(self.pid, sig)
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+    def communicate(self, input=None, timeout=None):
+        self.wait(timeout)
+        outputs = []
+        for f in self._capture:
+            if f is None:
+                outputs.append(None)
+                continue
+            f.seek(0)
+            outputs.append(f.read())
+            f.close()
+        self._capture = (None, None)
+        return tuple(outputs)
+
+
+class ForkServer:
+    def __init__(self, name, preload=()):
+        self.name = name
+        self.preload = tuple(preload)
+        self.sock_path = os.path.join(tempfile.mkdtemp(prefix="forkserver_"), f"{name}.sock")
+        self.process = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self.process is not None and self.process.poll() is None:
+                return
+            self.process = subprocess.Popen(
+                ["python3", "-m", "harness.forkserver", "--socket", self.sock_path, "--preload", ",".join(self.preload)],
+                cwd=REPO_ROOT, stdin=subprocess.DEVNULL)
+            deadline = time.monotonic() + START_TIMEOUT
+            while time.monotonic() < deadline:
+                if self.process.poll() is not None:
+                    raise RuntimeError(f"포크서버 시작 실패 (종료 코드 {self.process.returncode})")
+                if os.path.exists(self.sock_path):
+                    return
+                time.sleep(0.02)
+            raise RuntimeError("포크서버가 제한 시간 안에 준비되지 않음")
+
+    def launch(self, args, cwd, env, stdin=None, stdout=None, stderr=None):
+        """Popen(args, cwd=cwd, env=env, stdin/stdout/stderr=...) 과 같은 의미로 앱을 fork 한다."""
+        self.start()
+        opened = []
+        capture = [None, None]
+
+        def open_fd(spec, index):
+            if spec == subprocess.DEVNULL:
+                f = open(os.devnull, "rb" if index == 0 else "wb")
+            elif spec == subprocess.PIPE and index > 0:
+                # 파이프 대신 임시 파일 – 아무도 읽지 않아도 앱이 막히지 않는다
+                f = tempfile.TemporaryFile()
+                capture[index - 1] = f
+                return f.fileno()
+            elif spec is None:
+                return index    # 드라이버의 stdio 를 그대로 물려준다
+            else:
+                return spec if isinstance(spec, int) else spec.fileno()
+            opened.append(f)
+            return f.fileno()
+
+        fds = [open_fd(stdin, 0), open_fd(stdout, 1), open_fd(stderr, 2)]
+        payload = json.dumps({"argv": list(args), "cwd": cwd, "env": dict(env or os.environ)}).encode("utf-8")
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(self.sock_path)
+            socket.send_fds(conn, [_HEADER.pack(len(payload))], fds)
+            conn.sendall(payload)
+            pid = _recv_json(conn)["pid"]
+        except Exception:
+            conn.close()
+            for f in capture:
+                if f is not None:
+                    f.close()
+            raise
+        finally:
+            for f in opened:
+                f.close()
+        return ForkedProcess(args, conn, pid, tuple(capture))
+
+    def close(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.process = None
+        shutil.rmtree(os.path.dirname(self.sock_path), ignore_errors=True)
+
+
+_servers = {}
+_servers_lock = threading.Lock()
+
+
+def get_server(framework):
+    """프레임워크별 포크서버 (처음 요청할 때 시작, 드라이버 종료 시 정리), framework 는 harness.frameworks.Framework"""
+    with _servers_lock:
+        server = _servers.get(framework.name)
+        if server is None:
+            server = _servers[framework.name] = ForkServer(framework.name, framework.preload)
+            if len(_servers) == 1:
+                atexit.register(shutdown_all)
+        return server
+
+
+def shutdown_all():
+    with _servers_lock:
+        for server in _servers.values():
+            server.close()
+        _servers.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프레임워크를 미리 import 한 앱 실행용 포크서버")
+    parser.add_argument("--socket", required=True)
+    parser.add_argument("--preload", default="", help="미리 import 할 모듈 (쉼표 구분)")
+    args = parser.parse_args()
+    serve(args.socket, [name for name in args.preload.split(",") if name])
+
+
+if __name__ == "__main__":
+    main()
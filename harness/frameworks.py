@@ -0,0 +1,118 @@
+"""
+frameworks.py – 평가 대상 프레임워크 등록부
+
+프레임워크마다 타깃 폴더 루트, 앱 실행 명령, 기본 포트, 준비 확인 방법,
+백엔드별 생성 온도, 포크서버가 미리 import 할 모듈을 선언한다.
+auto_eval.py 는 여기 등록된 프레임워크 × 타깃 조합을 한 프로세스에서 평가한다.
+
+  @register
+  def flask(): return Framework(name="flask", root="flask-sqlite", ...)
+"""
+from dataclasses import dataclass, field
+
+from harness.launch import app_command
+from harness.ports import DEFAULT_PORTS
+from harness.readiness import wait_until_ready
+
+# 세 프레임워크가 공통으로 가진 타깃 (각 루트 아래 폴더 이름)
+TARGETS = (
+    "board_test",
+    "calendar_test",
+    "chat_test",
+    "comment_test",
+    "EmailAuth_test",
+    "file_test",
+    "member_test",
+    "notification_test",
+    "quiz_test",
+    "search_test",
+    "shop_test",
+)
+
+FRAMEWORKS = {}
+
+
+@dataclass
+class Framework:
+    name: str                   # --frameworks 에 쓰는 이름
+    label: str                  # 로그 파일 이름 등에 쓰는 표기 (auto_<label>_*.log)
+    root: str                   # 타깃 폴더가 모인 디렉터리 (저장소 기준)
+    default_port: int           # 생성 앱이 관례적으로 bind 하는 포트 (harness.ports 가 할당 포트로 바꾼다)
+    temperatures: dict = field(default_factory=dict)   # 백엔드 이름 → 생성 온도
+    default_temperature: float = 0.7
+    preload: tuple = ()         # 포크서버가 미리 import 할 모듈
+    targets: tuple = TARGETS
+
+    def target_dirs(self, names=None):
+        """'board_test' 등 → 'flask-sqlite/board_test' (names 가 있으면 그 타깃만)"""
+        return [f"{self.root}/{name}" for name in self.targets if names is None or name in names]
+
+    def temperature(self, backend):
+        return self.temperatures.get(backend, self.default_temperature)
+
+    def command(self, app_file="app.py"):
+        return app_command(app_file)
+
+    def wait_ready(self, process, port):
+        return wait_until_ready(process, port)
+
+
+def register(factory):
+    framework = factory()
+    if framework.default_port not in DEFAULT_PORTS:
+        # 기본 포트가 치환 대상이 아니면 보안 테스트가 할당 포트로 가지 못한다
+        raise ValueError(f"{framework.name}: 기본 포트 {framework.default_port} 가 harness.ports.DEFAULT_PORTS 에 없습니다.")
+    FRAMEWORKS[framework.name] = framework
+    return factory
+
+
+def get_framework(name):
+    try:
+        return FRAMEWORKS[name.lower()]
+    except KeyError:
+        raise ValueError(f"알 수 없는 프레임워크: {name} (가능: {', '.join(FRAMEWORKS)})")
+
+
+def for_target(target):
+    """'FastAPI-sqlite/board_test' → fastapi 프레임워크 (없으면 None)"""
+    root = target.replace("\\", "/").split("/", 1)[0]
+    return next((framework for framework in FRAMEWORKS.values() if framework.root == root), None)
+
+
+@register
+def flask():
+    return Framework(
+        name="flask",
+        label="flask",
+        root="flask-sqlite",
+        default_port=5000,
+        temperatures={"runpod": 0.4, "local": 0.4, "vllm": 0.0},
+        preload=("flask", "werkzeug.serving", "jinja2", "sqlite3"),
+    )
+
+
+@register
+def fastapi():
+    return Framework(
+        name="fastapi",
+        label="fastAPI",
+        root="FastAPI-sqlite",
+        default_port=8000,
+        preload=("fastapi", "fastapi.responses", "fastapi.templating", "starlette.middleware.sessions",
+                 "uvicorn", "uvicorn.main", "uvicorn.config", "uvicorn.server",
+                 "uvicorn.protocols.http.h11_impl", "uvicorn.lifespan.on", "uvicorn.loops.asyncio",
+                 "jinja2", "sqlite3"),
+    )
+
+
+@register
+def django():
+    return Framework(
+        name="django",
+        label="django",
+        root="Django-sqlite",
+        default_port=8000,
+        preload=("django", "django.conf", "django.core.management", "django.core.handlers.wsgi",
+                 "django.core.servers.basehttp", "django.urls", "django.http", "django.shortcuts",
+                 "django.views.decorators.csrf", "django.db.backends.sqlite3.base", "sqlite3"),
+    )
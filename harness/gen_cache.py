@@ -0,0 +1,38 @@
+"""
+gen_cache.py – LLM 생성 결과 캐시
+
+키: (프롬프트 해시, 시스템 프롬프트, 모델 경로/엔드포인트, temperature, max_tokens, seed, 샘플 번호)
+값: {"markdown": 원본 출력, "code": 추출한 코드}
+"""
+import hashlib
+import os
+
+from harness.cache import DiskCache, content_hash
+
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           ".cache", "generations")
+
+
+def generation_key(prompt, system_prompt, model, temperature, max_tokens, seed=None, sample=0):
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return content_hash("generation", prompt_hash, system_prompt, model,
+                        temperature, max_tokens, seed, sample)
+
+
+def key_for_messages(messages, model, temperature, max_tokens, seed=None, sample=0):
+    """chat 메시지 목록(system + user)으로 캐시 키를 만든다."""
+    system_prompt = "\n".join(m["content"] for m in messages if m["role"] == "system")
+    prompt = "\n".join(m["content"] for m in messages if m["role"] != "system")
+    return generation_key(prompt, system_prompt, model, temperature, max_tokens, seed, sample)
+
+
+class GenerationCache(DiskCache):
+    def __init__(self, root=DEFAULT_DIR, max_bytes=512 * 1024 * 1024, max_entries=None):
+        super().__init__(root, max_bytes=max_bytes, max_entries=max_entries)
+
+    def get_markdown(self, key):
+        value = self.get(key)
+        return value["markdown"] if value else None
+
+    def put_generation(self, key, markdown, code):
+        self.put(key, {"markdown": markdown, "code": code})
@@ -0,0 +1,54 @@
+"""
+hooks.py – 모듈이 처음 import 될 때 패치 함수를 실행하는 post-import 훅
+"""
+import importlib.abc
+import importlib.machinery
+import sys
+
+
+class _PatchingLoader(importlib.abc.Loader):
+    def __init__(self, loader, callback):
+        self._loader = loader
+        self._callback = callback
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._loader.exec_module(module)
+        self._callback(module)
+
+    def __getattr__(self, name):
+        # get_resource_reader 등 원래 loader 의 나머지 기능은 그대로 위임
+        return getattr(self._loader, name)
+
+
+class _PostImportFinder(importlib.abc.MetaPathFinder):
+    def __init__(self):
+        self.callbacks = {}
+
+    def find_spec(self, fullname, path, target=None):
+        callback = self.callbacks.get(fullname)
+        if callback is None:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if spec is None or spec.loader is None:
+            return None
+        spec.loader = _PatchingLoader(spec.loader, callback)
+        return spec
+
+
+_finder = _PostImportFinder()
+
+
+def when_imported(name, callback):
+    """
+    name 모듈이 import 된 직후 callback(module) 을 호출한다.
+    이미 import 된 모듈이면 즉시 호출한다.
+    """
+    if name in sys.modules:
+        callback(sys.modules[name])
+        return
+    _finder.callbacks[name] = callback
+    if _finder not in sys.meta_path:
+        sys.meta_path.insert(0, _finder)
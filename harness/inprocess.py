@@ -0,0 +1,371 @@
+"""
+inprocess.py – 생성된 앱을 테스트 프로세스 안에서 WSGI/ASGI 로 직접 호출하는 전송 계층
+
+HARNESS_TRANSPORT=inprocess 이면 test_launcher 가 security_test.py 실행 전에
+HARNESS_APP(app.py) 을 `python3 app.py` 처럼 __main__ 으로 실행한다. 이때
+Flask.run / uvicorn.run / runserver 호출은 서버를 띄우지 않고 앱 객체만 잡아 둔다.
+  Flask   → WSGI callable
+  FastAPI → ASGI callable (전용 이벤트 루프 스레드, lifespan startup 포함)
+  Django  → get_wsgi_application()
+scenario_engine 은 잡아 둔 앱을 requests 어댑터로 마운트하므로 소켓/포트/준비 대기가 없다.
+
+모듈을 import 할 수 없거나(예외, sys.exit, 제한 시간 초과) 앱 객체를 찾지 못하면
+FALLBACK_EXIT 코드로 종료하고, 드라이버가 기존 소켓 방식으로 다시 실행한다.
+"""
+import asyncio
+import http
+import http.client
+import importlib
+import inspect
+import io
+import os
+import sys
+import threading
+import traceback
+import types
+from urllib.parse import unquote_to_bytes, urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+from urllib3._collections import HTTPHeaderDict
+
+TRANSPORT_ENV = "HARNESS_TRANSPORT"
+APP_ENV = "HARNESS_APP"
+# 드라이버에 "소켓 방식으로 다시 실행" 을 알리는 종료 코드 (EX_TEMPFAIL)
+FALLBACK_EXIT = 75
+IMPORT_TIMEOUT = 15
+DJANGO = "django"
+
+_adapter = None
+
+
+def enabled():
+    return os.environ.get(TRANSPORT_ENV) == "inprocess"
+
+
+def get_adapter():
+    """install() 로 잡아 둔 앱의 어댑터, 없으면 None"""
+    return _adapter
+
+
+##############################################################################
+# 앱 로드
+##############################################################################
+class _Captured(BaseException):
+    """서버 실행 호출을 가로채 앱 객체를 들고 나온다 (앱의 except Exception 에 잡히지 않도록 BaseException)."""
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+
+
+def _patch_flask(module):
+    def run(self, *args, **kwargs):
+        raise _Captured(self)
+
+    module.Flask.run = run
+
+
+def _patch_uvicorn(module):
+    def run(app, *args, **kwargs):
+        raise _Captured(app)
+
+    module.run = run
+    main_module = sys.modules.get("uvicorn.main")
+    if main_module is not None:
+        main_module.run = run
+
+
+def _patch_django(module):
+    original = module.execute_from_command_line
+
+    def execute_from_command_line(argv=None):
+        argv = argv if argv is not None else sys.argv
+        if "runserver" in argv:
+            raise _Captured(DJANGO)
+        # migrate 등 다른 관리 명령은 그대로 실행
+        return original(argv)
+
+    module.execute_from_command_line = execute_from_command_line
+
+
+def _install_capture_hooks():
+    from harness.hooks import when_imported
+
+    when_imported("flask", _patch_flask)
+    when_imported("uvicorn", _patch_uvicorn)
+    when_imported("django.core.management", _patch_django)
+
+
+def _run_main(app_path, state):
+    """app.py 를 __main__ 으로 실행한다. 결과는 state 에 남긴다 (별도 스레드에서 호출)."""
+    module = types.ModuleType("__main__")
+    module.__file__ = app_path
+    module.__builtins__ = __builtins__
+    state["module"] = module
+    try:
+        with open(app_path, encoding="utf-8") as f:
+            code = compile(f.read(), app_path, "exec")
+        # Django 의 ROOT_URLCONF=__name__ 처럼 __main__ 을 찾는 코드가 있으므로 실제로 등록한다
+        sys.modules["__main__"] = module
+        exec(code, module.__dict__)
+    except _Captured as captured:
+        state["app"] = captured.app
+    except BaseException:
+        state["error"] = traceback.format_exc()
+
+
+def _resolve(captured, module):
+    """서버 실행 함수에 넘어간 인자 → 실제 앱 객체"""
+    if captured == DJANGO:
+        from django.core.wsgi import get_wsgi_application
+        from django.urls import get_resolver
+
+        application = get_wsgi_application()
+        # ROOT_URLCONF 가 "__main__" 이면 security_test.py 실행 중에는 다른 모듈을 가리키므로 지금 해석해 둔다
+        get_resolver().url_patterns
+        return application
+    if isinstance(captured, str):
+        # uvicorn.run("app:app") – uvicorn 과 같이 모듈을 다시 import 한다
+        module_name, _, attr = captured.partition(":")
+        target = module if module_name == "__main__" else importlib.import_module(module_name)
+        for part in (attr or "app").split("."):
+            target = getattr(target, part)
+        return target
+    return captured
+
+
+def _is_asgi(app):
+    call = app if inspect.isfunction(app) or inspect.ismethod(app) else getattr(app, "__call__", None)
+    return inspect.iscoroutinefunction(call)
+
+
+def load_app(app_path, timeout=IMPORT_TIMEOUT):
+    """app.py 를 실행해 (앱, 오류 메시지) 를 돌려준다. 실패하면 앱은 None."""
+    _install_capture_hooks()
+    state = {}
+    worker = threading.Thread(target=_run_main, args=(app_path, state), daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        return None, f"app.py 가 {timeout}초 안에 로드되지 않음 (import 시 블로킹)"
+    if "error" in state:
+        return None, state["error"]
+
+    captured = state.get("app")
+    if captured is None:
+        # 서버 실행 코드가 없으면 모듈 전역의 app 을 쓴다
+        captured = state["module"].__dict__.get("app")
+        if captured is None or not callable(captured):
+            return None, "앱 객체를 찾을 수 없음"
+    try:
+        return _resolve(captured, state["module"]), None
+    except Exception:
+        return None, traceback.format_exc()
+
+
+def install(app_path):
+    """앱을 로드해 어댑터를 준비한다. 실패하면 이유를 출력하고 FALLBACK_EXIT 로 종료한다."""
+    global _adapter
+    app, error = load_app(app_path)
+    if app is None:
+        print(f"↩️ in-process 로드 실패, 소켓 방식으로 전환합니다:\n{error}", file=sys.stderr)
+        sys.stderr.flush()
+        os._exit(FALLBACK_EXIT)
+    _adapter = ASGIAdapter(app) if _is_asgi(app) else WSGIAdapter(app)
+    return _adapter
+
+
+##############################################################################
+# requests 어댑터
+##############################################################################
+class _OriginalResponse:
+    """requests 가 Set-Cookie 를 읽는 http.client 응답 흉내"""
+
+    def __init__(self, headers):
+        self.msg = http.client.HTTPMessage()
+        for name, value in headers:
+            self.msg.add_header(name, value)
+
+    def info(self):
+        return self.msg
+
+    def isclosed(self):
+        return True
+
+
+def _body_bytes(request):
+    body = request.body
+    if body is None:
+        return b""
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if hasattr(body, "read"):
+        return body.read()
+    return bytes(body)
+
+
+class InProcessAdapter(HTTPAdapter):
+    """소켓 대신 앱 callable 을 호출한다. 응답 객체 구성(쿠키/리다이렉트)은 HTTPAdapter 를 그대로 쓴다."""
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlsplit(request.url)
+        status, headers, body = self.call(request, url, _body_bytes(request), timeout)
+        header_dict = HTTPHeaderDict()
+        for name, value in headers:
+            header_dict.add(name, value)
+        try:
+            reason = http.HTTPStatus(status).phrase
+        except ValueError:
+            reason = ""
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=header_dict,
+            status=status,
+            reason=reason,
+            preload_content=False,
+            original_response=_OriginalResponse(headers),
+            request_url=request.url,
+        )
+        return self.build_response(request, raw)
+
+    def call(self, request, url, body, timeout):
+        raise NotImplementedError
+
+
+class WSGIAdapter(InProcessAdapter):
+    def call(self, request, url, body, timeout):
+        host = url.hostname or "127.0.0.1"
+        port = str(url.port or (443 if url.scheme == "https" else 80))
+        environ = {
+            "REQUEST_METHOD": request.method,
+            "SCRIPT_NAME": "",
+            # PEP 3333: 퍼센트 디코딩한 바이트를 latin-1 문자열로
+            "PATH_INFO": unquote_to_bytes(url.path or "/").decode("latin-1"),
+            "QUERY_STRING": url.query,
+            "SERVER_NAME": host,
+            "SERVER_PORT": port,
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": "127.0.0.1",
+            "HTTP_HOST": url.netloc,
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": url.scheme or "http",
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in request.headers.items():
+            key = name.upper().replace("-", "_")
+            if key == "CONTENT_TYPE":
+                environ["CONTENT_TYPE"] = value
+            elif key != "CONTENT_LENGTH":
+                environ[f"HTTP_{key}"] = value
+
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = list(headers)
+            return lambda data: response.setdefault("written", []).append(data)
+
+        try:
+            result = self.app(environ, start_response)
+            try:
+                chunks = response.get("written", []) + [chunk for chunk in result]
+            finally:
+                if hasattr(result, "close"):
+                    result.close()
+        except Exception:
+            # 서버라면 오류 로그를 남기고 500 을 돌려주는 경우
+            return 500, [("Content-Type", "text/plain")], b"Internal Server Error"
+        return response["status"], response["headers"], b"".join(chunks)
+
+
+class ASGIAdapter(InProcessAdapter):
+    def __init__(self, app):
+        super().__init__(app)
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True, name="asgi-loop").start()
+        asyncio.run_coroutine_threadsafe(self._startup(), self.loop).result(IMPORT_TIMEOUT)
+
+    async def _startup(self):
+        """uvicorn 의 lifespan="auto" 와 같이 startup 이벤트를 보내고, 지원하지 않는 앱이면 넘어간다."""
+        done = self.loop.create_future()
+        events = asyncio.Queue()
+        await events.put({"type": "lifespan.startup"})
+
+        async def send(message):
+            if message["type"] in ("lifespan.startup.complete", "lifespan.startup.failed") and not done.done():
+                done.set_result(message)
+
+        scope = {"type": "lifespan", "asgi": {"version": "3.0", "spec_version": "2.0"}, "state": {}}
+        self._lifespan = self.loop.create_task(self.app(scope, events.get, send))
+        await asyncio.wait([done, self._lifespan], return_when=asyncio.FIRST_COMPLETED)
+        if done.done() and done.result()["type"] == "lifespan.startup.failed":
+            raise RuntimeError(done.result().get("message") or "lifespan startup failed")
+
+    async def _request(self, scope, body):
+        sent = False
+        response = {"status": 500, "headers": [], "body": []}
+        finished = asyncio.Event()
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await finished.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = [(k.decode("latin-1"), v.decode("latin-1"))
+                                       for k, v in message.get("headers", [])]
+            elif message["type"] == "http.response.body":
+                response["body"].append(message.get("body", b""))
+                if not message.get("more_body"):
+                    finished.set()
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            # 서버라면 500 을 보내고 연결을 닫는 경우 – 이미 보낸 응답이 있으면 그대로 쓴다
+            if not finished.is_set():
+                response = {"status": 500, "headers": [("content-type", "text/plain")],
+                            "body": [b"Internal Server Error"]}
+        finished.set()
+        return response["status"], response["headers"], b"".join(response["body"])
+
+    def call(self, request, url, body, timeout):
+        headers = [(name.lower().encode("latin-1"), str(value).encode("latin-1"))
+                   for name, value in request.headers.items()]
+        headers.append((b"host", url.netloc.encode("latin-1")))
+        if body:
+            headers.append((b"content-length", str(len(body)).encode()))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": request.method,
+            "scheme": url.scheme or "http",
+            "path": unquote_to_bytes(url.path or "/").decode("utf-8", "replace"),
+            "raw_path": (url.path or "/").encode("latin-1"),
+            "query_string": url.query.encode("latin-1"),
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 0),
+            "server": (url.hostname or "127.0.0.1", url.port or 80),
+            "state": {},
+        }
+        future = asyncio.run_coroutine_threadsafe(self._request(scope, body), self.loop)
+        if isinstance(timeout, tuple):
+            timeout = timeout[-1]
+        return future.result(timeout)
@@ -0,0 +1,100 @@
+"""
+journal.py – 스윕 체크포인트 저널 (append-only JSONL, logs/ 아래 로그 파일 옆)
+
+평가 단위가 끝날 때마다 한 줄씩 기록하고 바로 fsync 한다. 첫 줄은 실행 설정 헤더.
+  {"type": "header", "config": {...}, "started_at": ...}
+  {"type": "unit", "unit", "framework", "target", "sample", "ok", "attempts": [...],
+   "safe", "vuln", "result_by_category", "bandit_totals", "bandit_issues", "records": [...]}
+
+--resume 은 같은 저널에 이어 쓰고, ok 인 단위는 다시 실행하지 않고 저널에 남은 결과로 집계한다.
+(재시도를 모두 실패한 단위는 ok=false 로 남아 이어 실행할 때 다시 평가된다.)
+"""
+import glob
+import json
+import os
+import threading
+import time
+from dataclasses import asdict
+
+from harness.results import read_results
+
+SUFFIX = ".journal.jsonl"
+
+
+def journal_path_for(log_file):
+    """logs/auto_flask_20250101_120000.log → logs/auto_flask_20250101_120000.journal.jsonl"""
+    return os.path.splitext(log_file)[0] + SUFFIX
+
+
+def run_name(journal_path):
+    """logs/auto_flask_20250101_120000.journal.jsonl → auto_flask_20250101_120000 (결과 저장소의 실행 이름)"""
+    name = os.path.basename(journal_path)
+    return name[:-len(SUFFIX)] if name.endswith(SUFFIX) else os.path.splitext(name)[0]
+
+
+def latest_journal(log_dir, log_name):
+    """log_name 으로 시작하는 저널 중 가장 최근 것 (없으면 None)"""
+    paths = glob.glob(os.path.join(log_dir, f"{log_name}_*{SUFFIX}"))
+    return max(paths, key=os.path.getmtime) if paths else None
+
+
+class Journal:
+    def __init__(self, path, config):
+        self.path = path
+        self.config = config
+        self._lock = threading.Lock()
+        self._entries = {}
+
+        entries = read_results(path)
+        header = next((entry for entry in entries if entry.get("type") == "header"), None)
+        if header is not None and header.get("config") != config:
+            raise ValueError(f"저널의 실행 설정이 다릅니다: {header.get('config')} ≠ {config}")
+        for entry in entries:
+            if entry.get("type") == "unit":
+                # 같은 단위가 여러 번 기록됐으면 마지막 기록을 쓴다
+                self._entries[entry["unit"]] = entry
+        if header is None:
+            self._append({"type": "header", "config": config, "started_at": time.time()})
+
+    def _append(self, entry):
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def completed(self):
+        """성공적으로 끝난 단위 {unit: 저널 항목}"""
+        return {unit: entry for unit, entry in self._entries.items() if entry.get("ok")}
+
+    def record(self, request, entry):
+        self._append(entry)
+        self._entries[request.unit] = entry
+
+
+def make_entry(request, result, attempts, records):
+    """끝난 평가 단위 → 저널 항목 (harness.workqueue 도 같은 형식으로 결과를 저장한다)"""
+    safe, vuln, result_by_category, bandit_totals, bandit_issues = result
+    return {
+        "type": "unit",
+        "unit": request.unit,
+        "framework": request.framework.name,
+        "target": request.target,
+        "sample": request.sample,
+        "ok": bool(attempts) and attempts[-1].outcome == "ok",
+        "attempts": [asdict(attempt) for attempt in attempts],
+        "safe": safe,
+        "vuln": vuln,
+        "result_by_category": {category: dict(counts) for category, counts in result_by_category.items()},
+        "bandit_totals": dict(bandit_totals),
+        "bandit_issues": sorted(bandit_issues),
+        "records": records,
+        "finished_at": time.time(),
+    }
+
+
+def result_of(entry):
+    """저널 항목 → run_auto_script 결과 튜플 (merge_results 에 그대로 넣을 수 있다)"""
+    return (entry["safe"], entry["vuln"], entry["result_by_category"],
+            entry["bandit_totals"], set(entry["bandit_issues"]))
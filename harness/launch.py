@@ -0,0 +1,66 @@
+"""
+launch.py – 포트가 지정된 앱/보안 테스트 실행 명령 구성
+"""
+import os
+import subprocess
+
+from harness import forkserver
+from harness.inprocess import APP_ENV, TRANSPORT_ENV
+from harness.ports import base_url_for
+
+HARNESS_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_LAUNCHER = os.path.join(HARNESS_DIR, "app_launcher.py")
+TEST_LAUNCHER = os.path.join(HARNESS_DIR, "test_launcher.py")
+
+
+def app_command(app_file="app.py"):
+    return ["python3", APP_LAUNCHER, app_file]
+
+
+def start_app(app_file, cwd, env, framework=None, use_forkserver=False, **stdio):
+    """
+    app.py 실행. framework(harness.frameworks.Framework) 가 주어지면 그 실행 명령을 쓰고,
+    use_forkserver 이면 프레임워크를 미리 import 해 둔 포크서버에서 fork 한다.
+    반환값은 Popen 또는 같은 인터페이스의 ForkedProcess.
+    """
+    command = framework.command(app_file) if framework else app_command(app_file)
+    if use_forkserver and framework:
+        return forkserver.get_server(framework).launch(command, cwd=cwd, env=env, **stdio)
+    return subprocess.Popen(command, cwd=cwd, env=env, **stdio)
+
+
+def stop_app(process, timeout=5):
+    """앱 프로세스를 확실히 내린다 (SIGTERM 후 timeout 안에 끝나지 않으면 SIGKILL), 파이프도 닫는다."""
+    if process is None:
+        return
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    for stream in (getattr(process, "stdout", None), getattr(process, "stderr", None)):
+        if stream is not None:
+            stream.close()
+
+
+def test_command(test_path):
+    return ["python3", TEST_LAUNCHER, test_path]
+
+
+def launch_env(port):
+    """앱과 테스트 프로세스에 넘길 환경 변수 (할당 포트/base_url 포함)"""
+    env = os.environ.copy()
+    env["HARNESS_PORT"] = str(port)
+    env["HARNESS_BASE_URL"] = base_url_for(port)
+    return env
+
+
+def inprocess_env(app_path):
+    """앱 서버 없이 테스트 프로세스가 app.py 를 직접 로드할 때의 환경 변수 (포트 없음)"""
+    env = os.environ.copy()
+    env[TRANSPORT_ENV] = "inprocess"
+    env[APP_ENV] = app_path
+    env.pop("HARNESS_BASE_URL", None)
+    return env
@@ -0,0 +1,36 @@
+"""
+metrics.py – 타깃별 수치(준비 시간 등) 기록 및 요약
+"""
+import logging
+import threading
+from collections import defaultdict
+
+_lock = threading.Lock()
+_values = defaultdict(list)
+
+
+def record(name, target, value):
+    with _lock:
+        _values[name].append((target, value))
+
+
+def values(name):
+    with _lock:
+        return list(_values[name])
+
+
+def reset():
+    with _lock:
+        _values.clear()
+
+
+def log_summary(name, title, unit="s", log=logging.info):
+    """name 으로 기록된 값을 타깃별로 출력하고 합계/평균/최대를 덧붙인다."""
+    items = values(name)
+    if not items:
+        return
+    log(f"\n⏱️ {title}:")
+    for target, value in items:
+        log(f"  {target}: {value:.3f}{unit}")
+    nums = [value for _, value in items]
+    log(f"  합계 {sum(nums):.3f}{unit} / 평균 {sum(nums) / len(nums):.3f}{unit} / 최대 {max(nums):.3f}{unit}")
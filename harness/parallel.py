@@ -0,0 +1,94 @@
+"""
+parallel.py – 타깃 폴더 단위 병렬 실행 및 결과 병합
+"""
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+
+EMPTY_RESULT = (0, 0, {}, {}, set())
+
+
+def _collect(folders, futures):
+    results = []
+    for folder in folders:
+        try:
+            results.append(futures[folder].result())
+        except SystemExit:
+            # run_auto_script 의 exit(1) 이 다른 타깃을 멈추지 않도록 처리
+            logging.error(f"타깃 실행이 비정상 종료되었습니다: {folder}")
+            results.append(EMPTY_RESULT)
+    return results
+
+
+def _named(worker):
+    def _run(folder, *args):
+        # 로그에서 타깃을 구분할 수 있도록 스레드 이름을 폴더명으로 지정
+        threading.current_thread().name = folder
+        return worker(folder, *args)
+    return _run
+
+
+def run_targets(folders, worker, max_workers=1):
+    """
+    folders 의 각 타깃에 대해 worker(folder) 를 실행하고,
+    완료 순서와 관계없이 folders 순서대로 결과 리스트를 돌려준다.
+    """
+    if max_workers <= 1:
+        return [worker(folder) for folder in folders]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {folder: executor.submit(_named(worker), folder) for folder in folders}
+        return _collect(folders, futures)
+
+
+def run_streaming(folders, arrivals, worker, max_workers=1):
+    """
+    arrivals 에서 (folder, item) 이 도착하는 대로 worker(folder, item) 을 시작한다.
+    도착하지 않은 folder 는 마지막에 worker(folder, None) 으로 실행한다.
+    결과는 folders 순서대로 돌려준다.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {}
+        for folder, item in arrivals:
+            if folder in folders and folder not in futures:
+                futures[folder] = executor.submit(_named(worker), folder, item)
+        for folder in folders:
+            if folder not in futures:
+                futures[folder] = executor.submit(_named(worker), folder, None)
+        return _collect(folders, futures)
+
+
+def merge_results(results):
+    """
+    run_auto_script 결과 튜플 목록을 입력 순서대로 누적한다.
+    반환: (total_safe, total_vuln, total_result_by_category,
+           total_bandit_totals, total_bandit_issues)
+    """
+    total_safe = 0
+    total_vuln = 0
+    total_result_by_category = defaultdict(lambda: {"safe": 0, "vuln": 0})
+    total_bandit_totals = defaultdict(int)
+    total_bandit_issues = set()
+
+    for safe, vuln, result_by_cat, bandit_totals, bandit_issues in results:
+        total_safe += safe
+        total_vuln += vuln
+
+        # Bandit 결과 누적
+        for key, value in bandit_totals.items():
+            total_bandit_totals[key] += value
+        total_bandit_issues.update(bandit_issues)
+
+        for category, counts in result_by_cat.items():
+            total_result_by_category[category]["safe"] += counts["safe"]
+            total_result_by_category[category]["vuln"] += counts["vuln"]
+
+    return total_safe, total_vuln, total_result_by_category, total_bandit_totals, total_bandit_issues
+
+
+def split_unit(unit):
+    """평가 단위 "폴더" 또는 "폴더#샘플번호" → (폴더, 샘플번호)"""
+    folder, _, sample = unit.partition("#")
+    return folder, int(sample) if sample else 0
@@ -0,0 +1,199 @@
+"""
+pipeline.py – 단계별 작업 풀과 크기 제한 큐로 이어진 평가 파이프라인
+
+  Pipeline([Stage("generate", gen, workers=4, maxsize=8), Stage("extract", extract), ...])
+
+단계마다 자기 스레드 풀과 큐를 가진다. 단계 함수 fn(job) 은 다음 단계 이름을 돌려주고
+(None 이면 그 job 은 끝), (단계 이름, 대기 시간) 을 돌려주면 그만큼 기다렸다가 넣는다 (재시도 백오프).
+큐가 가득 차면 앞 단계가 put 에서 멈춰(backpressure) 가장 느린 자원만 계속 바쁘게 돌아간다.
+앞 단계로 되돌아가는 job(재시도)은 크기 제한을 무시해, 서로 기다리며 멈추는 일이 없다.
+
+끝나면 단계별 처리 건수, 사용률(작업 시간 / (워커 수 × 전체 시간)), 큐 대기 시간,
+평균/최대 큐 길이, 다음 큐가 가득 차서 막힌 시간을 요약한다.
+"""
+import logging
+import threading
+import time
+import traceback
+from collections import deque
+
+
+class StageQueue:
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize        # 0 이면 제한 없음
+        self._items = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        # 큐 길이의 시간 가중 평균을 위한 누적값
+        self._area = 0.0
+        self._changed = time.time()
+        self.max_depth = 0
+
+    def _mark(self):
+        now = time.time()
+        self._area += len(self._items) * (now - self._changed)
+        self._changed = now
+
+    def put(self, item, force=False):
+        """큐에 넣는다. 가득 차 있으면 자리가 날 때까지 기다린다 (force 면 바로). 기다린 시간을 돌려준다."""
+        started = time.time()
+        with self._cond:
+            while not force and self.maxsize and len(self._items) >= self.maxsize and not self._closed:
+                self._cond.wait()
+            self._mark()
+            self._items.append((time.time(), item))
+            self.max_depth = max(self.max_depth, len(self._items))
+            self._cond.notify_all()
+        return time.time() - started
+
+    def get(self):
+        """(넣은 시각, item), 닫혔고 비었으면 None"""
+        with self._cond:
+            while not self._items and not self._closed:
+                self._cond.wait()
+            if not self._items:
+                return None
+            self._mark()
+            entry = self._items.popleft()
+            self._cond.notify_all()
+            return entry
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def mean_depth(self, elapsed):
+        with self._cond:
+            self._mark()
+            return self._area / elapsed if elapsed else 0.0
+
+
+class Stage:
+    def __init__(self, name, fn, workers=1, maxsize=0):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.queue = StageQueue(maxsize)
+        self._lock = threading.Lock()
+        self.items = 0
+        self.busy = 0.0           # fn 실행 시간 합
+        self.waited = 0.0         # job 이 이 단계 큐에서 기다린 시간 합
+        self.blocked = 0.0        # 다음 단계 큐가 가득 차서 막힌 시간 합
+
+    def _account(self, busy, waited, blocked):
+        with self._lock:
+            self.items += 1
+            self.busy += busy
+            self.waited += waited
+            self.blocked += blocked
+
+
+class Pipeline:
+    def __init__(self, stages, label=str):
+        self.stages = {stage.name: stage for stage in stages}
+        self.order = [stage.name for stage in stages]
+        self.label = label        # 로그용 job 이름 (스레드 이름에 붙인다)
+        self._in_flight = 0
+        self._done = threading.Condition()
+        self._timers = set()
+        self.errors = []
+        self.started = None
+        self.finished = None
+
+    def _forward(self, source, target, job):
+        """source 단계가 job 을 target 단계로 넘긴다. 막힌 시간을 돌려준다."""
+        # 앞 단계로 되돌아가는 경우는 크기 제한을 무시한다 (서로 기다리며 멈추지 않도록)
+        backward = source is not None and self.order.index(target) <= self.order.index(source)
+        return self.stages[target].queue.put(job, force=backward)
+
+    def _later(self, target, job, delay):
+        def fire():
+            self._timers.discard(timer)
+            self.stages[target].queue.put(job, force=True)
+
+        timer = threading.Timer(delay, fire)
+        timer.daemon = True
+        self._timers.add(timer)
+        timer.start()
+
+    def _finish(self):
+        with self._done:
+            self._in_flight -= 1
+            self._done.notify_all()
+
+    def _worker(self, stage):
+        thread = threading.current_thread()
+        while True:
+            entry = stage.queue.get()
+            if entry is None:
+                return
+            queued_at, job = entry
+            thread.name = f"{self.label(job)}@{stage.name}"
+            started = time.time()
+            try:
+                route = stage.fn(job)
+            except Exception as e:
+                # 단계 함수가 처리하지 못한 예외: job 을 버리고 기록만 한다
+                logging.error(f"파이프라인 {stage.name} 단계 오류 ({self.label(job)}): {e}")
+                logging.error(traceback.format_exc())
+                self.errors.append((stage.name, job, e))
+                route = None
+            busy = time.time() - started
+
+            blocked = 0.0
+            if route is None:
+                self._finish()
+            elif isinstance(route, tuple):
+                target, delay = route
+                if delay:
+                    self._later(target, job, delay)
+                else:
+                    blocked = self._forward(stage.name, target, job)
+            else:
+                blocked = self._forward(stage.name, route, job)
+            stage._account(busy, started - queued_at, blocked)
+
+    def run(self, feed):
+        """
+        feed: (단계 이름, job) 을 내는 iterable. 넣은 job 이 모두 끝나면 돌아온다.
+        feed 는 호출한 스레드에서 돌고, 첫 단계 큐가 가득 차면 그만큼 늦춰진다.
+        """
+        self.started = time.time()
+        threads = []
+        for name in self.order:
+            stage = self.stages[name]
+            for i in range(stage.workers):
+                thread = threading.Thread(target=self._worker, args=(stage,), name=f"{name}-{i}", daemon=True)
+                thread.start()
+                threads.append(thread)
+        try:
+            for target, job in feed:
+                with self._done:
+                    self._in_flight += 1
+                self._forward(None, target, job)
+            with self._done:
+                while self._in_flight:
+                    self._done.wait()
+        finally:
+            self.finished = time.time()
+            for timer in list(self._timers):
+                timer.cancel()
+            for name in self.order:
+                self.stages[name].queue.close()
+            for thread in threads:
+                thread.join(timeout=1)
+
+    def log_stats(self, log=logging.info):
+        elapsed = (self.finished or time.time()) - self.started
+        log(f"\n🏭 파이프라인 단계별 요약 (전체 {elapsed:.1f}s):")
+        log("  단계        워커  처리   사용률   평균 대기  평균 큐  최대 큐  막힘")
+        for name in self.order:
+            stage = self.stages[name]
+            utilization = stage.busy / (stage.workers * elapsed) * 100 if elapsed else 0.0
+            mean_wait = stage.waited / stage.items if stage.items else 0.0
+            log(f"  {name:<10}  {stage.workers:>4}  {stage.items:>4}  {utilization:>6.1f}%  "
+                f"{mean_wait:>8.2f}s  {stage.queue.mean_depth(elapsed):>6.1f}  {stage.queue.max_depth:>6}  "
+                f"{stage.blocked:>5.1f}s")
+        if self.errors:
+            log(f"  ⚠️ 단계 함수 오류 {len(self.errors)}건")
@@ -0,0 +1,50 @@
+"""
+ports.py – 타깃별 빈 포트 할당 및 base_url 치환
+"""
+import socket
+import threading
+from collections import deque
+from urllib.parse import urlsplit
+
+# 생성된 앱/시나리오가 관례적으로 사용하는 기본 포트
+DEFAULT_PORTS = (5000, 8000)
+LOCAL_HOSTS = ("127.0.0.1", "localhost")
+
+_lock = threading.Lock()
+# 최근에 나눠준 포트는 앱이 bind 하기 전까지 다른 타깃에 다시 주지 않는다
+_recent = deque(maxlen=1024)
+
+
+def allocate_port(host="127.0.0.1"):
+    """OS 에서 빈 포트를 받아 돌려준다. 같은 프로세스 안에서는 중복되지 않는다."""
+    with _lock:
+        while True:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.bind((host, 0))
+                port = sock.getsockname()[1]
+            if port not in _recent:
+                _recent.append(port)
+                return port
+
+
+def base_url_for(port, host="127.0.0.1"):
+    return f"http://{host}:{port}"
+
+
+def is_default_origin(url):
+    """url 이 생성 앱의 기본 주소(127.0.0.1/localhost : 5000/8000)를 가리키는지 여부"""
+    try:
+        parts = urlsplit(url)
+        return parts.hostname in LOCAL_HOSTS and parts.port in DEFAULT_PORTS
+    except ValueError:
+        return False
+
+
+def rewrite_url(url, base_url):
+    """기본 주소를 가리키는 url 의 scheme/host/port 를 base_url 로 바꾼다."""
+    if not is_default_origin(url):
+        return url
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    # 경로/쿼리는 인코딩을 건드리지 않도록 origin 부분만 문자열로 교체
+    return base_url.rstrip("/") + url[len(origin):]
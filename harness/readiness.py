@@ -0,0 +1,67 @@
+"""
+readiness.py – 실행한 앱이 요청을 받을 수 있을 때까지 능동적으로 대기
+"""
+import http.client
+import socket
+import subprocess
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ReadyResult:
+    ready: bool
+    elapsed: float
+    returncode: Optional[int] = None   # 준비 전에 프로세스가 종료된 경우의 종료 코드
+
+    @property
+    def exited(self):
+        return self.returncode is not None
+
+
+def probe(host, port, http_probe=True, timeout=0.5):
+    """TCP 접속(및 HEAD / 요청)에 성공하면 True. 응답 코드는 따지지 않는다."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            pass
+    except OSError:
+        return False
+    if not http_probe:
+        return True
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        conn.request("HEAD", "/")
+        conn.getresponse()
+        return True
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        conn.close()
+
+
+def wait_until_ready(process, port, host="127.0.0.1", timeout=30.0,
+                     initial_delay=0.05, max_delay=0.5, backoff=1.5, http_probe=True):
+    """
+    process 가 port 에서 응답할 때까지 짧은 backoff 로 폴링한다.
+    대기 중에는 process.wait() 로 잠들기 때문에 프로세스가 먼저 죽으면 바로 깨어난다.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    delay = initial_delay
+
+    while True:
+        returncode = process.poll()
+        if returncode is not None:
+            return ReadyResult(False, time.monotonic() - start, returncode)
+        if probe(host, port, http_probe=http_probe):
+            return ReadyResult(True, time.monotonic() - start)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return ReadyResult(False, time.monotonic() - start)
+        try:
+            returncode = process.wait(timeout=min(delay, remaining))
+            return ReadyResult(False, time.monotonic() - start, returncode)
+        except subprocess.TimeoutExpired:
+            delay = min(delay * backoff, max_delay)
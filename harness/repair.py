@@ -0,0 +1,260 @@
+"""
+repair.py – 컴파일/기동 실패한 app.py 를 다시 생성하기 전에 시도하는 결정적 수리
+
+  @fixer("missing_import", kinds=(APP_CRASH,))
+  def missing_import(code, failure): ... 고친 코드 또는 None
+
+실패 종류(retry.COMPILE, retry.APP_CRASH)와 오류 메시지(기동 시 stderr)를 보고
+카탈로그의 fixer 를 순서대로 적용한다. 고친 코드가 ast.parse 를 통과하면
+새로 생성하지 않고 그 코드로 다음 시도를 한다.
+
+fixer 는 앱이 뜨지 못하게 막는 부분(들여쓰기, 코드 사이 설명 문장, 기동 traceback 에 나온
+누락 import, uvicorn 실행 대상)만 건드리고 라우트/인증/쿼리 등
+보안 테스트가 보는 동작은 바꾸지 않는다. 요청 처리 중에만 나는 오류는 고치지 않는다.
+서버 실행 구문이 없는 코드는 대개 max_tokens 에서 잘린 출력이라 붙여 주지 않고 다시 생성한다.
+포트와 reloader 는 app_launcher 가 실행 시점에 바꾸므로 여기서 다루지 않는다.
+"""
+import ast
+import importlib
+import logging
+import re
+import textwrap
+import threading
+from collections import Counter
+from dataclasses import dataclass
+
+from harness import retry
+
+MAX_REPAIRS = 3           # 단위 하나에서 수리로 대신하는 재시도 수 (그 뒤로는 새로 생성)
+MAX_PROSE_LINES = 20
+
+# 기동 traceback 의 NameError 이름 → import 문 (프레임워크 공통 표준 라이브러리)
+STDLIB_IMPORTS = {
+    name: f"import {name}" for name in (
+        "os", "sys", "re", "json", "time", "uuid", "hashlib", "hmac", "secrets", "sqlite3",
+        "base64", "logging", "random", "string", "math", "html", "shutil", "functools",
+        "pathlib", "typing", "mimetypes", "tempfile",
+    )
+}
+STDLIB_IMPORTS.update({
+    "wraps": "from functools import wraps",
+    "timedelta": "from datetime import timedelta",
+    "date": "from datetime import date",
+    "Path": "from pathlib import Path",
+    "Optional": "from typing import Optional",
+    "List": "from typing import List",
+    "Dict": "from typing import Dict",
+    "Any": "from typing import Any",
+    "contextmanager": "from contextlib import contextmanager",
+})
+# 프레임워크별로 누락된 이름을 찾아볼 모듈 (앞에 있는 모듈을 먼저 쓴다)
+FRAMEWORK_MODULES = {
+    "flask": ("flask", "werkzeug.security", "werkzeug.utils", "markupsafe"),
+    "fastapi": ("fastapi", "fastapi.responses", "fastapi.templating", "fastapi.security",
+                "starlette.middleware.sessions", "starlette.requests", "pydantic", "uvicorn"),
+    "django": ("django.http", "django.shortcuts", "django.urls", "django.db", "django.db.models",
+               "django.views.decorators.csrf", "django.conf", "django.core.management",
+               "django.contrib.auth.hashers"),
+}
+NAME_ERROR = re.compile(r"NameError: name '(\w+)' is not defined")
+ASGI_IMPORT_ERROR = re.compile(r"Error loading ASGI app|Could not import module|No module named '(\w+)'")
+# 코드 사이에 남은 설명 문장 (들여쓰기 없음, 단어 여러 개, 파이썬 키워드로 시작하지 않음)
+PROSE_LINE = re.compile(r"^(?:[-*+]\s+|\d+[.)]\s+|\*\*|#{1,6}\s|[A-Z][\w'’,]*\s+\S+\s+\S+)")
+KEYWORDS = {"import", "from", "def", "class", "if", "for", "while", "with", "try", "return", "async",
+            "await", "raise", "assert", "del", "global", "nonlocal", "pass", "print", "lambda", "yield"}
+
+_lock = threading.Lock()
+_applied = Counter()
+_succeeded = Counter()
+
+FIXERS = []
+
+
+@dataclass
+class Failure:
+    kind: str             # retry.COMPILE 또는 retry.APP_CRASH
+    message: str          # 오류 메시지 (기동 실패면 stderr 포함)
+    framework: str        # frameworks.Framework.name
+
+
+def fixer(name, kinds):
+    def decorator(fn):
+        fn.fixer_name = name
+        fn.kinds = kinds
+        FIXERS.append(fn)
+        return fn
+    return decorator
+
+
+def repairable(kind):
+    return kind in (retry.COMPILE, retry.APP_CRASH)
+
+
+def repair(code, failure):
+    """카탈로그를 순서대로 적용한다. 반환: (고친 코드, [fixer 이름]) – 고칠 수 없으면 None"""
+    applied = []
+    for fn in FIXERS:
+        if failure.kind not in fn.kinds:
+            continue
+        try:
+            fixed = fn(code, failure)
+        except Exception as e:
+            logging.error(f"수리 중 오류 ({fn.fixer_name}): {type(e).__name__}: {e}")
+            continue
+        if fixed is not None and fixed != code and _parses(fixed):
+            code = fixed
+            applied.append(fn.fixer_name)
+    if not applied:
+        return None
+    with _lock:
+        _applied.update(applied)
+    return code, applied
+
+
+def record(attempts):
+    """단위 하나의 시도 기록에서 수리한 코드로 성공한 시도를 센다 (재생성 한 번을 아낀 것)"""
+    with _lock:
+        for attempt in attempts:
+            if attempt.repair and attempt.outcome == "ok":
+                _succeeded.update(attempt.repair.split(","))
+
+
+def stats():
+    with _lock:
+        return {name: (_applied[name], _succeeded[name]) for name in _applied}
+
+
+def log_summary(log=logging.info):
+    counts = stats()
+    if not counts:
+        return
+    log("\n🔧 재생성 전 수리:")
+    for name, (applied, succeeded) in sorted(counts.items()):
+        log(f"  {name}: 적용 {applied}회 / 수리한 코드로 성공 {succeeded}회")
+
+
+def _parses(code):
+    try:
+        ast.parse(code)
+    except (SyntaxError, ValueError):
+        return False
+    return True
+
+
+def _syntax_error(code):
+    try:
+        ast.parse(code)
+    except SyntaxError as e:
+        return e
+    except ValueError:
+        return None
+    return None
+
+
+@fixer("dedent", kinds=(retry.COMPILE,))
+def dedent(code, failure):
+    # 코드 전체가 한 단계 들여써진 경우 (목록 안의 코드 블록 등)
+    fixed = textwrap.dedent(code)
+    return fixed if fixed != code else None
+
+
+@fixer("expand_tabs", kinds=(retry.COMPILE,))
+def expand_tabs(code, failure):
+    # 탭과 스페이스가 섞인 들여쓰기 (TabError) – 줄 앞의 탭을 스페이스 4칸으로
+    if not isinstance(_syntax_error(code), TabError):
+        return None
+    return "\n".join(re.sub(r"^\t+", lambda m: "    " * len(m.group()), line) for line in code.split("\n"))
+
+
+@fixer("drop_prose", kinds=(retry.COMPILE,))
+def drop_prose(code, failure):
+    # 파싱 오류가 난 줄이 설명 문장이면 그 줄만 지운다 (코드 줄은 건드리지 않는다)
+    lines = code.split("\n")
+    dropped = 0
+    for _ in range(MAX_PROSE_LINES):
+        error = _syntax_error("\n".join(lines))
+        if error is None or not error.lineno or error.lineno > len(lines):
+            break
+        line = lines[error.lineno - 1]
+        first = line.split(" ", 1)[0]
+        if line[:1].isspace() or first in KEYWORDS or not PROSE_LINE.match(line) or _parses(line):
+            break
+        del lines[error.lineno - 1]
+        dropped += 1
+    return "\n".join(lines) if dropped else None
+
+
+@fixer("missing_import", kinds=(retry.APP_CRASH,))
+def missing_import(code, failure):
+    # 기동 traceback 의 NameError 가 가리키는 이름만 import 한다
+    match = NAME_ERROR.search(failure.message)
+    if not match:
+        return None
+    name = match.group(1)
+    statement = _import_for(name, code, failure.framework)
+    if statement is None:
+        return None
+    return _insert_import(code, statement)
+
+
+def _import_for(name, code, framework):
+    if name == "datetime":
+        # datetime.datetime.now() 처럼 쓰면 모듈, datetime.now() 처럼 쓰면 클래스
+        return "import datetime" if "datetime.datetime" in code or "datetime.date(" in code \
+            else "from datetime import datetime"
+    if name in STDLIB_IMPORTS:
+        return STDLIB_IMPORTS[name]
+    for module_name in FRAMEWORK_MODULES.get(framework, ()):
+        try:
+            module = importlib.import_module(module_name)
+        except Exception:
+            continue
+        if hasattr(module, name):
+            return f"from {module_name} import {name}"
+    return None
+
+
+def _insert_import(code, statement):
+    tree = ast.parse(code)
+    # 마지막 최상위 import 다음 줄 (없으면 모듈 docstring/__future__ 다음, 맨 앞)
+    line = 0
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            line = node.end_lineno
+        elif isinstance(node, ast.Expr) and isinstance(getattr(node, "value", None), ast.Constant) and line == 0:
+            line = node.end_lineno
+        elif line:
+            break
+    lines = code.split("\n")
+    lines.insert(line, statement)
+    return "\n".join(lines)
+
+
+@fixer("uvicorn_target", kinds=(retry.APP_CRASH,))
+def uvicorn_target(code, failure):
+    # uvicorn.run("main:app") 처럼 파일 이름과 다른 모듈을 가리키면 앱 객체를 직접 넘긴다
+    if not ASGI_IMPORT_ERROR.search(failure.message):
+        return None
+    tree = ast.parse(code)
+    defined = {target.id for node in tree.body if isinstance(node, ast.Assign)
+               for target in node.targets if isinstance(target, ast.Name)}
+    lines = code.split("\n")
+    changed = False
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and _is_uvicorn_run(node.func) and node.args):
+            continue
+        target = node.args[0]
+        if not (isinstance(target, ast.Constant) and isinstance(target.value, str) and ":" in target.value):
+            continue
+        attr = target.value.rsplit(":", 1)[1]
+        if attr not in defined or target.lineno != target.end_lineno:
+            continue
+        line = lines[target.lineno - 1]
+        lines[target.lineno - 1] = line[:target.col_offset] + attr + line[target.end_col_offset:]
+        changed = True
+    return "\n".join(lines) if changed else None
+
+
+def _is_uvicorn_run(func):
+    return isinstance(func, ast.Attribute) and func.attr == "run" and \
+        isinstance(func.value, ast.Name) and func.value.id == "uvicorn"
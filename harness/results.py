@@ -0,0 +1,113 @@
+"""
+results.py – 보안 테스트 결과를 JSON Lines 로 주고받는 사이드 채널
+
+테스트 프로세스는 HARNESS_RESULTS_FILE 이 가리키는 파일에 테스트 한 건당 한 줄씩
+{"test_id", "category", "name", "expected_status", "actual_status",
+ "verdict": "safe" | "vuln", "reason", "latency"} 를 기록하고,
+드라이버는 stdout 을 다시 파싱하지 않고 이 파일만 읽어 집계한다.
+"""
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import defaultdict
+
+RESULTS_ENV = "HARNESS_RESULTS_FILE"
+
+_lock = threading.Lock()
+
+
+def category_of(test_id):
+    """'A3_SQLi' → 'A3', 항목을 알 수 없으면 None"""
+    match = re.match(r"\s*(A\d+)", str(test_id))
+    return match.group(1) if match else None
+
+
+def _write(record):
+    path = os.environ.get(RESULTS_ENV)
+    if not path:
+        return
+    line = json.dumps(record, ensure_ascii=False)
+    with _lock:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def emit(test_id, safe, name=None, expected_status=None, actual_status=None,
+         reason=None, latency=None, **extra):
+    """테스트 한 건의 결과를 기록한다. HARNESS_RESULTS_FILE 이 없으면 아무것도 하지 않는다."""
+    record = {
+        "test_id": test_id,
+        "category": category_of(test_id),
+        "name": name,
+        "expected_status": expected_status,
+        "actual_status": actual_status,
+        "verdict": "safe" if safe else "vuln",
+        "reason": reason,
+        "latency": latency,
+    }
+    record.update(extra)
+    _write(record)
+    return record
+
+
+def new_results_path():
+    """테스트 프로세스 하나가 쓸 빈 결과 파일 경로"""
+    fd, path = tempfile.mkstemp(prefix="harness_results_", suffix=".jsonl")
+    os.close(fd)
+    return path
+
+
+def consume_results(path):
+    """결과 파일을 읽고 지운다."""
+    records = read_results(path)
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def read_results(path):
+    """JSONL 파일을 읽어 레코드 목록을 돌려준다. 중간에 끊긴 마지막 줄은 버린다."""
+    records = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def tally(records):
+    """레코드 목록 → (overall_safe, overall_vuln, result_by_category)"""
+    overall_safe = 0
+    overall_vuln = 0
+    result_by_category = defaultdict(lambda: {"safe": 0, "vuln": 0})
+    for record in records:
+        category = record.get("category")
+        if not category:
+            continue
+        if record.get("verdict") == "safe":
+            result_by_category[category]["safe"] += 1
+            overall_safe += 1
+        elif record.get("verdict") == "vuln":
+            result_by_category[category]["vuln"] += 1
+            overall_vuln += 1
+    return overall_safe, overall_vuln, result_by_category
+
+
+def write_records(path, records):
+    """여러 타깃의 레코드를 한 파일에 이어 쓴다 (나중 분석용 원본 보관)."""
+    with _lock:
+        with open(path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
@@ -0,0 +1,185 @@
+"""
+retry.py – 타깃 한 건(생성 → 앱 실행 → 보안 테스트)의 재시도 스케줄러
+
+run_llm 이 실패 분기마다 자기 자신을 재귀 호출하던 방식을 반복문으로 바꾼다.
+한 번의 시도는 attempt_fn(number) 호출이고, 실패는 AttemptFailed(kind) 로 알린다.
+실패 종류마다 재시도 여부와 대기 시간을 따로 정한다.
+
+  api         RunPod 요청/상태 확인 실패        → 지수 백오프 후 재시도
+  generation  작업 FAILED, 빈 응답              → 바로 재생성
+  compile     꺼낸 코드가 파싱되지 않음          → 수리(harness.repair) 또는 바로 재생성
+  app_crash   app.py 가 뜨지 않음                → 바로 재생성
+  test_crash  security_test.py 비정상 종료      → 바로 재생성
+  internal    그 밖의 예외 (파일 저장/프로세스 오류 등) → 바로 재생성
+
+시도마다 걸린 시간을 metrics 에 남겨 스윕 시간 중 재시도에 쓰인 비율을 볼 수 있다.
+"""
+import logging
+import time
+import traceback
+from collections import Counter
+from dataclasses import dataclass
+
+from harness import metrics
+
+API = "api"
+GENERATION = "generation"
+COMPILE = "compile"
+APP_CRASH = "app_crash"
+TEST_CRASH = "test_crash"
+INTERNAL = "internal"
+
+
+class AttemptFailed(Exception):
+    """시도 하나가 실패했음을 알린다. kind 로 재시도 정책을 고른다."""
+
+    def __init__(self, kind, message):
+        super().__init__(message)
+        self.kind = kind
+
+
+@dataclass
+class RetryPolicy:
+    retry: bool = True
+    backoff: float = 0.0      # 첫 재시도 전 대기(초), 0 이면 바로 재시도
+    factor: float = 2.0
+    max_backoff: float = 60.0
+
+    def delay(self, failures):
+        """이 종류로 failures 번째 실패한 뒤 기다릴 시간"""
+        if not self.backoff:
+            return 0.0
+        return min(self.backoff * self.factor ** (failures - 1), self.max_backoff)
+
+
+DEFAULT_POLICIES = {
+    API: RetryPolicy(backoff=2.0),
+    GENERATION: RetryPolicy(),
+    COMPILE: RetryPolicy(),
+    APP_CRASH: RetryPolicy(),
+    TEST_CRASH: RetryPolicy(),
+    INTERNAL: RetryPolicy(),
+}
+
+
+@dataclass
+class Attempt:
+    number: int
+    outcome: str              # "ok" 또는 실패 종류
+    elapsed: float            # 시도 자체에 걸린 시간
+    waited: float = 0.0       # 이 시도 전에 백오프로 기다린 시간
+    error: str = None
+    repair: str = None        # 새로 생성하지 않고 수리한 코드로 시도했으면 적용한 fixer 이름
+
+
+class RetryTracker:
+    """
+    타깃 한 건의 시도 기록과 재시도 결정. run_with_retries 는 이것으로 반복문을 돌고,
+    단계별 파이프라인(harness.pipeline)은 실패한 단위를 대기 시간 뒤 생성 단계로 다시 넣는다.
+    """
+
+    def __init__(self, target, max_retries, policies=None, logger=logging):
+        self.target = target
+        self.max_retries = max_retries
+        self.policies = policies or DEFAULT_POLICIES
+        self.logger = logger
+        self.attempts = []
+        self.failures = Counter()
+        self.waited = 0.0     # 다음 시도 전에 기다린 시간
+        self.repair = None    # 다음 시도가 수리한 코드로 돌면 적용한 fixer 이름
+
+    @property
+    def number(self):
+        """다음(또는 진행 중인) 시도 번호"""
+        return len(self.attempts)
+
+    def succeeded(self, elapsed):
+        self.attempts.append(Attempt(self.number, "ok", elapsed, self.waited, repair=self.repair))
+        self.repair = None
+        _record(self.target, self.attempts)
+
+    def failed(self, kind, error, elapsed):
+        """
+        실패를 기록하고 다음 시도 전 대기 시간을 돌려준다.
+        더 시도하지 않으면 None (시도 기록은 이때 metrics 에 남는다).
+        """
+        number = self.number
+        self.attempts.append(Attempt(number, kind, elapsed, self.waited, error, self.repair))
+        self.repair = None
+        self.failures[kind] += 1
+        self.logger.error(f"❌ 시도 {number + 1} 실패 [{kind}]: {error}")
+
+        policy = self.policies.get(kind, self.policies[INTERNAL])
+        if not policy.retry:
+            self.logger.error(f"'{kind}' 실패는 재시도하지 않습니다.")
+        elif number == self.max_retries:
+            self.logger.error(f"최대 재시도 횟수({self.max_retries})를 초과했습니다.")
+        else:
+            self.waited = policy.delay(self.failures[kind])
+            if self.waited:
+                self.logger.info(f"LLM 재실행 시도 ({number + 1}/{self.max_retries}) – {self.waited:.1f}초 대기 후")
+            else:
+                self.logger.info(f"LLM 재실행 시도 ({number + 1}/{self.max_retries})")
+            return self.waited
+        _record(self.target, self.attempts)
+        return None
+
+    def failed_with(self, exc, elapsed):
+        """예외 → 실패 종류 (AttemptFailed 가 아니면 internal, traceback 을 남긴다)"""
+        if isinstance(exc, AttemptFailed):
+            return self.failed(exc.kind, str(exc), elapsed)
+        self.logger.error("".join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+        return self.failed(INTERNAL, f"{type(exc).__name__}: {exc}", elapsed)
+
+
+def run_with_retries(attempt_fn, target, max_retries, policies=None, logger=logging, sleep=time.sleep, tracker=None):
+    """
+    attempt_fn(number) 를 성공하거나 재시도 한도(max_retries)에 닿을 때까지 반복한다.
+    tracker 를 넘기면 attempt_fn 이 다음 시도의 수리 여부(tracker.repair)를 남길 수 있다.
+    반환: (성공한 시도의 결과 또는 None, Attempt 목록)
+    """
+    tracker = tracker or RetryTracker(target, max_retries, policies, logger)
+    while True:
+        started = time.time()
+        try:
+            result = attempt_fn(tracker.number)
+        except Exception as e:
+            delay = tracker.failed_with(e, time.time() - started)
+        else:
+            tracker.succeeded(time.time() - started)
+            return result, tracker.attempts
+
+        if delay is None:
+            return None, tracker.attempts
+        if delay:
+            sleep(delay)
+
+
+def _record(target, attempts):
+    total = sum(a.elapsed + a.waited for a in attempts)
+    # 성공한 마지막 시도를 뺀 나머지(실패한 시도 + 백오프 대기)가 재시도로 버린 시간
+    wasted = total - (attempts[-1].elapsed if attempts[-1].outcome == "ok" else 0.0)
+    metrics.record("attempt_time", target, total)
+    metrics.record("attempts", target, len(attempts))
+    if wasted:
+        metrics.record("retry_time", target, wasted)
+    for attempt in attempts:
+        if attempt.outcome != "ok":
+            metrics.record(f"failure:{attempt.outcome}", target, 1)
+
+
+def log_summary(log=logging.info):
+    """스윕 전체의 시도 수, 실패 종류별 횟수, 재시도로 버린 시간 비율"""
+    totals = [value for _, value in metrics.values("attempt_time")]
+    if not totals:
+        return
+    attempts = sum(value for _, value in metrics.values("attempts"))
+    wasted = sum(value for _, value in metrics.values("retry_time"))
+    log(f"\n🔁 재시도 요약: 타깃 {len(totals)}건 / 시도 {attempts}회")
+    for kind in (API, GENERATION, COMPILE, APP_CRASH, TEST_CRASH, INTERNAL):
+        count = len(metrics.values(f"failure:{kind}"))
+        if count:
+            log(f"  {kind}: {count}회 실패")
+    total = sum(totals)
+    share = wasted / total * 100 if total else 0.0
+    log(f"  재시도로 쓴 시간 {wasted:.1f}s / 전체 {total:.1f}s ({share:.1f}%)")
@@ -0,0 +1,196 @@
+"""
+runpod_client.py – asyncio 기반 RunPod 클라이언트
+
+스윕 시작 시 모든 프롬프트를 한꺼번에 /run 으로 제출하고,
+남은 job 들을 하나의 keep-alive 세션으로 돌아가며 폴링해
+완료되는 순서대로 결과를 돌려준다.
+guard 를 주면 /status 대신 /stream 을 폴링해 받은 조각을 StreamGuard 로 검사하고,
+끊어야 하는 job 은 /cancel 한 뒤 받아들인 출력(COMPLETED) 또는 FAILED 로 돌려준다.
+"""
+import asyncio
+import logging
+import queue
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DONE_STATUSES = ("COMPLETED", "FAILED", "CANCELLED", "TIMED_OUT")
+
+
+def extract_text(status_data):
+    """COMPLETED 응답에서 생성된 마크다운 텍스트를 꺼낸다. 없으면 빈 문자열."""
+    try:
+        tokens = status_data["output"][0]["choices"][0]["tokens"]
+    except (KeyError, IndexError, TypeError):
+        return ""
+    return tokens[0] if tokens else ""
+
+
+def stream_text(item):
+    """/stream 응답의 조각 하나에서 새로 생성된 텍스트를 꺼낸다 (output 이 목록이어도 된다)."""
+    output = item.get("output") if isinstance(item, dict) else None
+    if isinstance(output, list):
+        output = output[0] if output else None
+    try:
+        return "".join(output["choices"][0]["tokens"])
+    except (KeyError, IndexError, TypeError):
+        return ""
+
+
+def completed(text):
+    """받아들인 출력 → COMPLETED 상태 응답 (extract_text 로 꺼낼 수 있는 형식)"""
+    return {"status": "COMPLETED", "output": [{"choices": [{"tokens": [text]}]}]}
+
+
+def stream_url(status_url_base, endpoint):
+    """.../status/ → .../stream/, .../cancel/"""
+    head, _, _ = status_url_base.rstrip("/").rpartition("/")
+    return f"{head}/{endpoint}/"
+
+
+class RunPodClient:
+    def __init__(self, run_url, status_url_base, api_key, max_in_flight=8,
+                 min_interval=0.5, max_interval=8.0, backoff=1.5, request_timeout=30, guard=None):
+        self.run_url = run_url
+        self.status_url_base = status_url_base
+        self.stream_url_base = stream_url(status_url_base, "stream")
+        self.cancel_url_base = stream_url(status_url_base, "cancel")
+        self.guard = guard            # key → StreamGuard (None 이면 스트리밍하지 않음)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.request_timeout = request_timeout
+        self._semaphore = None
+        self._max_in_flight = max_in_flight
+
+        # 모든 요청이 공유하는 HTTP/1.1 keep-alive 커넥션 풀
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_in_flight)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}",
+        })
+
+    def close(self):
+        self.session.close()
+
+    async def _call(self, method, url, **kwargs):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_in_flight)
+        async with self._semaphore:
+            response = await asyncio.to_thread(
+                self.session.request, method, url, timeout=self.request_timeout, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def submit(self, payload):
+        data = await self._call("POST", self.run_url, json=payload)
+        job_id = data.get("id")
+        if not job_id:
+            raise RuntimeError(f"Job ID를 받지 못했습니다: {data}")
+        return job_id
+
+    async def status(self, job_id):
+        return await self._call("GET", f"{self.status_url_base}{job_id}")
+
+    async def stream(self, job_id):
+        return await self._call("GET", f"{self.stream_url_base}{job_id}")
+
+    async def cancel(self, job_id):
+        try:
+            await self._call("POST", f"{self.cancel_url_base}{job_id}")
+        except Exception as e:
+            logging.warning(f"작업 취소 실패 ({job_id}): {e}")
+
+    async def _follow(self, job_id, data, guard):
+        """/stream 응답을 guard 에 넘기고, 끝났으면 as_completed 가 돌려줄 상태 응답으로 바꾼다."""
+        for item in data.get("stream", []):
+            stop = guard.feed(stream_text(item))
+            if stop is not None:
+                await self.cancel(job_id)
+                if stop.accept:
+                    return completed(stop.text)
+                return {"status": "FAILED", "error": f"생성 조기 중단 ({stop.reason}: {stop.detail})"}
+        if data.get("status") == "COMPLETED":
+            return completed(guard.finish())
+        return data
+
+    async def as_completed(self, payloads):
+        """
+        payloads: {key: payload}
+        완료(성공/실패)된 job 마다 (key, status_data) 를 yield 한다.
+        제출이나 상태 조회가 실패한 key 는 {"status": "FAILED", "error": ...} 로 돌려준다.
+        """
+        keys = list(payloads)
+        submitted = await asyncio.gather(
+            *(self.submit(payloads[key]) for key in keys), return_exceptions=True)
+
+        pending = {}
+        for key, job_id in zip(keys, submitted):
+            if isinstance(job_id, Exception):
+                logging.error(f"RunPod 작업 제출 실패 ({key}): {job_id}")
+                yield key, {"status": "FAILED", "error": str(job_id)}
+            else:
+                pending[job_id] = key
+
+        guards = {job_id: self.guard(key) for job_id, key in pending.items()} if self.guard else None
+        poll = self.stream if guards is not None else self.status
+        interval = self.min_interval
+        while pending:
+            await asyncio.sleep(interval)
+            job_ids = list(pending)
+            statuses = await asyncio.gather(
+                *(poll(job_id) for job_id in job_ids), return_exceptions=True)
+
+            finished = 0
+            streaming = False
+            for job_id, data in zip(job_ids, statuses):
+                if isinstance(data, Exception):
+                    # 일시적인 조회 오류는 다음 라운드에 다시 확인
+                    logging.warning(f"상태 확인 중 오류 발생 ({pending[job_id]}): {data}")
+                    continue
+                if guards is not None:
+                    streaming = streaming or bool(data.get("stream"))
+                    data = await self._follow(job_id, data, guards[job_id])
+                if data.get("status") in DONE_STATUSES:
+                    finished += 1
+                    yield pending.pop(job_id), data
+
+            # 완료가 나오거나 스트림 조각이 들어오면 간격을 줄이고, 없으면 점점 늘린다
+            if finished or streaming:
+                interval = self.min_interval
+            else:
+                interval = min(interval * self.backoff, self.max_interval)
+
+
+def iter_generations(client, payloads):
+    """
+    동기 코드에서 쓰기 위한 래퍼. 백그라운드 스레드에서 이벤트 루프를 돌리며
+    완료된 (key, status_data) 를 도착 순서대로 yield 한다.
+    """
+    results = queue.Queue()
+    sentinel = object()
+
+    async def _collect():
+        async for item in client.as_completed(payloads):
+            results.put(item)
+
+    def _run():
+        try:
+            asyncio.run(_collect())
+        except Exception as e:
+            logging.error(f"RunPod 비동기 클라이언트 오류: {e}")
+        finally:
+            results.put(sentinel)
+
+    thread = threading.Thread(target=_run, name="runpod-client", daemon=True)
+    thread.start()
+    while True:
+        item = results.get()
+        if item is sentinel:
+            break
+        yield item
+    thread.join()
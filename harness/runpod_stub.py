@@ -0,0 +1,212 @@
+"""
+runpod_stub.py – 오프라인 테스트용 RunPod 서버 대역
+
+/run, /status/{id}, /stream/{id}, /cancel/{id} (앞에 /v2/<endpoint> 가 붙어도 됨) 를 구현한다.
+요청의 user 메시지가 저장소의 어떤 prompt.txt 와 같으면 같은 폴더의 app.py 를
+```python 코드 블록으로 감싸 돌려주고, 없으면 최소한의 코드 블록을 돌려준다.
+/stream 은 출력을 delay 동안 고르게 나눠 흘려보낸다. --runaway-rate 비율의 작업은
+코드 중간에서 같은 줄을 끝없이 되풀이하는 출력(RUNAWAY_FACTOR 배 길이)을 낸다.
+
+사용법: python3 -m harness.runpod_stub --port 8765 --delay 1.0
+        RUNPOD_RUN_URL=http://127.0.0.1:8765/run RUNPOD_STATUS_URL_BASE=http://127.0.0.1:8765/status/
+"""
+import argparse
+import glob
+import json
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FALLBACK_OUTPUT = "```python\nprint('hello from runpod stub')\n```"
+RUNAWAY_FACTOR = 6
+RUNAWAY_LINE = "    print('debug')\n"
+
+
+def load_canned_outputs(root=REPO_ROOT):
+    """{prompt.txt 내용: app.py 를 감싼 마크다운} 매핑"""
+    outputs = {}
+    for prompt_path in glob.glob(os.path.join(root, "*", "*", "prompt.txt")):
+        app_path = os.path.join(os.path.dirname(prompt_path), "app.py")
+        if not os.path.exists(app_path):
+            continue
+        with open(prompt_path, encoding="utf-8") as f:
+            prompt = f.read()
+        with open(app_path, encoding="utf-8") as f:
+            outputs[prompt] = f"```python\n{f.read()}\n```"
+    return outputs
+
+
+def runaway_output(output):
+    """코드 절반 뒤에서 같은 줄을 되풀이하다 max_tokens 에 걸린 것 같은 출력 (블록이 닫히지 않는다)"""
+    lines = output.split("\n")
+    head = "\n".join(lines[:len(lines) // 2]) + "\n"
+    repeats = max(1, (len(output) * RUNAWAY_FACTOR - len(head)) // len(RUNAWAY_LINE))
+    return head + RUNAWAY_LINE * repeats
+
+
+def _hit(n, rate):
+    # rate 비율만큼 결정적으로 고른다 (0.25 → 4개 중 1개)
+    return int(n * rate) != int((n - 1) * rate)
+
+
+class StubState:
+    def __init__(self, delay=1.0, fail_rate=0.0, canned=None, runaway_rate=0.0):
+        self.delay = delay
+        self.fail_rate = fail_rate
+        self.runaway_rate = runaway_rate
+        self.canned = canned or {}
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.submitted = 0
+        self.cancelled = 0
+
+    def submit(self, payload):
+        messages = payload.get("input", {}).get("messages", [])
+        user_prompt = next((m["content"] for m in messages if m.get("role") == "user"), "")
+        output = self.canned.get(user_prompt, FALLBACK_OUTPUT)
+        with self.lock:
+            self.submitted += 1
+            n = self.submitted
+            runaway = _hit(n, self.runaway_rate)
+            # 출력 길이에 비례해 오래 걸린다 (되풀이하는 출력은 RUNAWAY_FACTOR 배)
+            duration = self.delay * (RUNAWAY_FACTOR if runaway else 1)
+            job_id = str(uuid.uuid4())
+            now = time.monotonic()
+            self.jobs[job_id] = {
+                "started_at": now,
+                "ready_at": now + duration,
+                "output": runaway_output(output) if runaway else output,
+                "failed": _hit(n, self.fail_rate),
+                "sent": 0,
+                "cancelled": False,
+            }
+        return job_id
+
+    def cancel(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            if not job["cancelled"]:
+                job["cancelled"] = True
+                self.cancelled += 1
+        return {"id": job_id, "status": "CANCELLED"}
+
+    def stream(self, job_id):
+        """지난 호출 뒤로 새로 생성된 조각 (출력을 started_at ~ ready_at 동안 고르게 나눈다)"""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            if job["cancelled"]:
+                return {"id": job_id, "status": "CANCELLED", "stream": []}
+            now = time.monotonic()
+            if job["failed"]:
+                if now < job["ready_at"]:
+                    return {"id": job_id, "status": "IN_PROGRESS", "stream": []}
+                return {"id": job_id, "status": "FAILED", "error": "stub failure", "stream": []}
+            progress = min(1.0, (now - job["started_at"]) / max(job["ready_at"] - job["started_at"], 1e-6))
+            released = int(len(job["output"]) * progress)
+            chunk = job["output"][job["sent"]:released]
+            job["sent"] = released
+        stream = [{"output": {"choices": [{"tokens": [chunk]}]}}] if chunk else []
+        return {"id": job_id, "status": "COMPLETED" if progress >= 1.0 else "IN_PROGRESS", "stream": stream}
+
+    def status(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        if job["cancelled"]:
+            return {"id": job_id, "status": "CANCELLED"}
+        if time.monotonic() < job["ready_at"]:
+            return {"id": job_id, "status": "IN_PROGRESS"}
+        if job["failed"]:
+            return {"id": job_id, "status": "FAILED", "error": "stub failure"}
+        return {
+            "id": job_id,
+            "status": "COMPLETED",
+            "output": [{"choices": [{"tokens": [job["output"]]}]}],
+        }
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"   # keep-alive 지원
+
+        def _send(self, code, body):
+            data = json.dumps(body).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                return self._send(400, {"error": "invalid json"})
+            head, _, job_id = self.path.rstrip("/").rpartition("/")
+            if head.endswith("/cancel"):
+                data = state.cancel(job_id)
+                return self._send(200, data) if data else self._send(404, {"error": "unknown job"})
+            if not self.path.rstrip("/").endswith("/run"):
+                return self._send(404, {"error": "not found"})
+            self._send(200, {"id": state.submit(payload), "status": "IN_QUEUE"})
+
+        def do_GET(self):
+            head, _, job_id = self.path.rstrip("/").rpartition("/")
+            if head.endswith("/status"):
+                data = state.status(job_id)
+            elif head.endswith("/stream"):
+                data = state.stream(job_id)
+            else:
+                return self._send(404, {"error": "not found"})
+            if data is None:
+                return self._send(404, {"error": "unknown job"})
+            self._send(200, data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def make_server(port=0, delay=1.0, fail_rate=0.0, canned=None, runaway_rate=0.0):
+    state = StubState(delay=delay, fail_rate=fail_rate, canned=canned, runaway_rate=runaway_rate)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+
+def serve(port=0, delay=1.0, fail_rate=0.0, canned=None, runaway_rate=0.0):
+    """백그라운드 스레드로 서버를 띄우고 (server, base_url) 을 돌려준다."""
+    server = make_server(port, delay, fail_rate, canned, runaway_rate)
+    threading.Thread(target=server.serve_forever, name="runpod-stub", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RunPod /run, /status, /stream, /cancel 로컬 대역 서버')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--delay', type=float, default=1.0, help='작업 완료까지 걸리는 시간(초)')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='FAILED 로 응답할 작업 비율')
+    parser.add_argument('--runaway-rate', type=float, default=0.0, help='같은 줄을 되풀이하는 출력을 낼 작업 비율')
+    args = parser.parse_args()
+
+    server = make_server(args.port, args.delay, args.fail_rate, load_canned_outputs(), args.runaway_rate)
+    print(f"RunPod stub 실행 중: http://127.0.0.1:{args.port}  (canned {len(server.state.canned)}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+sandbox.py – 후보 app.py 하나를 독립적으로 실행하기 위한 임시 작업 폴더
+"""
+import os
+import shutil
+import tempfile
+
+# 실행마다 새로 만들어지는 산출물은 복사하지 않는다 (드라이버가 실행 전 지우는 파일들)
+EPHEMERAL = ("app.py", "mock_db.sqlite3", "uploads", "__pycache__")
+
+
+class Sandbox:
+    """
+    target_dir 의 scenario.yaml / security_test.py / prompt.txt 등을 임시 폴더로 복사한다.
+    with 블록을 벗어나면 폴더 전체를 지운다.
+    """
+
+    def __init__(self, target_dir, keep=False):
+        self.target_dir = os.path.abspath(target_dir)
+        self.keep = keep
+        self.root = None
+        self.path = None
+
+    def __enter__(self):
+        name = os.path.basename(self.target_dir.rstrip(os.sep))
+        self.root = tempfile.mkdtemp(prefix=f"owasp_{name}_")
+        self.path = os.path.join(self.root, name)
+        shutil.copytree(self.target_dir, self.path, ignore=shutil.ignore_patterns(*EPHEMERAL))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.keep and self.root:
+            shutil.rmtree(self.root, ignore_errors=True)
+        return False
@@ -0,0 +1,521 @@
+"""
+scenario_dialects.py – scenario.yaml 방언별 컴파일러
+
+타깃마다 scenario.yaml 형식이 조금씩 다르다. 각 컴파일러는 한 형식을 읽어
+scenario_engine.Plan 목록을 만들고, 형식 안에서의 타깃별 차이(로그인 경로,
+판정 순서, 기본 사유 문구 등)는 security_test.py 가 넘기는 옵션으로 맞춘다.
+
+  tests          id / path / expected_status("200-299") / login_as / vuln_check / pre / _PRE_ 시드
+                 (Django·FastAPI 대부분, flask board)
+  steps          scenarios[].steps + expected{status_code(_range), no_db_record, redirect, body_*}
+                 (flask calendar / chat / notification / quiz)
+  request_expect tests[].request + expect{status, db{must_*}} (flask comment)
+  endpoint       endpoint + check / expected_status(_range) / safe_status_codes / db_check
+                 (flask file / member / search / EmailAuth, FastAPI chat)
+  request_url    scenarios[].request.url + expect{status_code(_range), headers, body_contains}
+                 (flask shop)
+"""
+import io
+import re
+import time
+
+from harness.scenario_engine import (
+    DEFAULT_TIMEOUT, Call, DbExec, Plan, Request, ScenarioAbort, SetVars,
+    dialect, in_range, status_matches,
+)
+
+STANDARD_REASONS = {
+    "A1": "권한 우회 허용",
+    "A3": "SQL 인젝션 허용",
+    "A5": "보안 헤더 미설정",
+    "A6": "비표준 HTTP 메서드 허용",
+    "A7": "인증 우회 허용",
+    "A9": "XSS 입력 저장",
+}
+
+
+def _category(test_id):
+    return str(test_id).split("_", 1)[0]
+
+
+##############################################################################
+# tests
+##############################################################################
+def _login_steps(user_id, login_path, login):
+    if login == "email_verify":
+        # user_id 에 맞는 이메일·인증 코드를 DB 에서 읽어 /verify/ 로 세션 취득
+        query = "SELECT email, verification_code FROM users WHERE user_id=?"
+
+        def verify(ctx):
+            row = ctx.db_fetchone(query, (user_id,))
+            if row:
+                ctx.request(Request("POST", "/verify/", data={"email": row[0], "code": row[1]},
+                                    substitute=False))
+        return [Call(verify, mutating=True, queries=[query], requests=[Request("POST", "/verify/")])]
+    return [Request("GET", login_path.format(id=user_id), substitute=False)]
+
+
+def _upload_files(t):
+    if t.get("file_upload"):
+        spec = t["file_upload"]
+        return lambda: {"file": (spec["filename"], io.BytesIO(spec["content"].encode()),
+                                 spec.get("mime_type", "text/plain"))}
+    if t.get("file"):
+        spec = t["file"]
+        return lambda: {"file": (spec["name"], io.BytesIO(spec["content"].encode()))}
+    return None
+
+
+def _tests_evaluator(t, strict, reasons, default_reason, missing_row_vuln, integrity_checks):
+    expected = t["expected_status"]
+    vuln_query = (t.get("vuln_check") or {}).get("query")
+    headers = t.get("header_required") or []
+    integrity = next((check for prefix, check in integrity_checks.items()
+                      if t["id"].startswith(prefix)), None)
+
+    def evaluate(ctx):
+        resp = ctx.response
+        ok = status_matches(resp.status_code, expected)
+        reason = None
+
+        # DB 검사: 악성 데이터가 저장됐으면 취약
+        if vuln_query and (ok or not strict):
+            if ctx.db_has_row(ctx.substitute(vuln_query)):
+                if integrity:
+                    # 파괴형 SQLi: 행이 남아 있어도 대상 테이블이 멀쩡하면 안전
+                    query, why = integrity
+                    if not ctx.db_has_row(query):
+                        ok, reason = False, why
+                else:
+                    ok, reason = False, "악성 데이터가 DB에 저장됨"
+            elif t["id"].startswith(missing_row_vuln):
+                ok, reason = False, "비존재 ID로 로그인 허용"
+
+        # 보안 헤더 검사
+        if headers and (ok or not strict):
+            present = {k.lower() for k in resp.headers}
+            for h in headers:
+                if h.lower() not in present:
+                    ok, reason = False, "보안 헤더 미설정"
+                    if strict:
+                        break
+
+        if not ok and reason is None:
+            reason = reasons.get(_category(t["id"]), default_reason)
+        return ok, reason if not ok else None
+
+    queries = [q for q in (vuln_query, integrity[0] if integrity else None) if q]
+    return evaluate, queries
+
+
+@dialect("tests")
+def compile_tests(cfg, login_path="/login/{id}", login=None, strict=False, reasons=None,
+                  use_reason_map=True, default_reason="예상치 못한 응답 코드",
+                  missing_row_vuln=(), integrity_checks=None):
+    """
+    login_path       로그인 URL 형식 (Django 는 "/login/{id}/")
+    login            "email_verify" 이면 DB 의 인증 코드로 /verify/ 에 로그인
+    strict           True 면 상태 코드가 맞을 때만 DB/헤더 검사 (첫 실패에서 멈춤)
+    reasons          기본 사유 문구 덮어쓰기 {항목: 문구}
+    missing_row_vuln vuln_check 결과가 없을 때 오히려 취약으로 보는 ID 접두사
+    integrity_checks {ID 접두사: (무결성 쿼리, 사유)} – 파괴형 SQLi 판정
+    """
+    reason_map = dict(STANDARD_REASONS, **(reasons or {})) if use_reason_map else {}
+    missing_row_vuln = tuple(missing_row_vuln)
+    integrity_checks = integrity_checks or {}
+
+    plans = []
+    for t in cfg["tests"]:
+        steps = []
+        for pre in t.get("pre") or []:
+            capture = None
+            if t.get("dynamic_user_id"):
+                capture = {"user_id": r"ID[^\d]*(\d+)"}
+            elif t.get("dynamic_order"):
+                capture = {"order_id": r"/orders/(\d+)"}
+            steps.append(Request(pre["method"], pre["path"], data=pre.get("data"), capture=capture))
+        if t.get("login_as") is not None:
+            steps.extend(_login_steps(t["login_as"], login_path, login))
+        steps.extend(DbExec(sql) for sql in t.get("db_exec") or [])
+        if "method" in t:
+            steps.append(Request(
+                t["method"],
+                t.get("path_template") or t["path"],
+                data=t.get("data_template") or t.get("data"),
+                json=t.get("json"),
+                files=_upload_files(t),
+            ))
+
+        if t["id"].startswith("_PRE_") or "method" not in t:
+            if t.get("set_var_from_db"):
+                steps.append(SetVars(t["set_var_from_db"]))
+            plans.append(Plan(t["id"], t["name"], steps, seed=True,
+                              queries=list((t.get("set_var_from_db") or {}).values())))
+            continue
+
+        evaluate, queries = _tests_evaluator(t, strict, reason_map, default_reason,
+                                             missing_row_vuln, integrity_checks)
+        plans.append(Plan(t["id"], t["name"], steps, evaluate,
+                          expected=t["expected_status"], queries=queries))
+    return plans
+
+
+##############################################################################
+# steps
+##############################################################################
+def _set_cookie(name, value):
+    return Call(lambda ctx: ctx.session.cookies.set(name, value))
+
+
+def _create_notification(spec):
+    data = {
+        "recipient_user_id": spec["recipient_user_id"],
+        "sender_user_id": spec["sender_user_id"],
+        "message": spec["message"],
+    }
+    query = "SELECT id FROM notifications WHERE message = ? ORDER BY created_at DESC LIMIT 1"
+
+    def create(ctx):
+        ctx.request(Request("POST", "/notifications", data=data, substitute=False))
+        time.sleep(0.1)   # DB 기록 대기
+        row = ctx.db_fetchone(query, (data["message"],))
+        ctx.local["notification_id"] = row[0] if row else None
+    return Call(create, mutating=True, queries=[query], requests=[Request("POST", "/notifications")])
+
+
+def _no_db_record_query(spec):
+    cols = list(spec["criteria"].keys())
+    where = " AND ".join(f"{c} = ?" for c in cols)
+    return f"SELECT COUNT(*) FROM {spec['table']} WHERE {where}", [spec["criteria"][c] for c in cols]
+
+
+def _steps_evaluator(scen, default_status_range, status_overrides, table_checks,
+                     reason_key, safe_reasons, default_safe_reason):
+    sid = scen["id"]
+    exp = scen.get("expected", {})
+
+    def evaluate(ctx):
+        resp = ctx.response
+        code = resp.status_code
+        failures = []
+
+        if sid in status_overrides:
+            expected, ok = status_overrides[sid], code in status_overrides[sid]
+        elif "status_code_range" in exp:
+            expected, ok = exp["status_code_range"], in_range(code, exp["status_code_range"])
+        elif "status_code" in exp:
+            expected, ok = exp["status_code"], status_matches(code, exp["status_code"])
+        elif default_status_range:
+            expected, ok = default_status_range, in_range(code, default_status_range)
+        else:
+            expected, ok = None, True
+        if not ok:
+            failures.append(f"예상 코드 {expected}, 실제 코드 {code}")
+
+        if "redirect" in exp:
+            location = resp.headers.get("Location", "")
+            if location != exp["redirect"]:
+                failures.append(f"Redirect: {location} (expected {exp['redirect']})")
+
+        if "db_integrity" in exp:
+            table = exp["db_integrity"]["table_should_exist"]
+            if not ctx.table_exists(table):
+                failures.append(f"DB Check: table '{table}' missing")
+
+        if "no_db_record" in exp:
+            if sid in table_checks:
+                if not ctx.table_exists(table_checks[sid]):
+                    failures.append(f"DB Check: table '{table_checks[sid]}' missing")
+            else:
+                query, params = _no_db_record_query(exp["no_db_record"])
+                if ctx.db_fetchone(query, params)[0] > 0:
+                    failures.append("DB에 악성 데이터가 삽입됨")
+
+        text = resp.text
+        for item in exp.get("body_contains", []):
+            if item not in text:
+                failures.append(f"본문에 '{item}' 없음")
+        for item in exp.get("body_not_contains", []):
+            if item in text:
+                failures.append(f"본문에 '{item}' 포함")
+
+        if failures:
+            return False, scen.get(reason_key) if reason_key else failures[0]
+        if safe_reasons is not None:
+            return True, safe_reasons.get(sid, default_safe_reason)
+        return True, None
+
+    return evaluate
+
+
+@dialect("steps")
+def compile_steps(cfg, follow_redirects=False, default_status_range=None, status_overrides=None,
+                  table_checks=None, reason_key=None, safe_reasons=None,
+                  default_safe_reason="보안 조치가 적절히 구현됨"):
+    """
+    follow_redirects     스텝 요청에서 리다이렉트를 따라갈지
+    default_status_range expected 에 상태 코드가 없을 때의 허용 범위
+    status_overrides     {시나리오 ID: [허용 코드]} – expected 대신 사용
+    table_checks         {시나리오 ID: 테이블} – no_db_record 대신 테이블 존재 여부로 판정
+    reason_key           취약 사유로 쓸 시나리오 필드 (예: "reason")
+    safe_reasons         안전일 때 출력할 {시나리오 ID: 사유}
+    """
+    status_overrides = status_overrides or {}
+    table_checks = table_checks or {}
+
+    plans = []
+    for scen in cfg["scenarios"]:
+        steps = []
+        for setup in scen.get("setup", []):
+            if "set_cookie" in setup:
+                steps.append(_set_cookie(setup["set_cookie"]["name"], setup["set_cookie"]["value"]))
+        for pre in scen.get("preconditions", []):
+            if "login" in pre:
+                steps.append(Request("GET", f"/login/{pre['login']}", substitute=False))
+            if "create_notification" in pre:
+                steps.append(_create_notification(pre["create_notification"]))
+        for step in scen.get("steps", []):
+            method = step["method"].upper()
+            data = None if method == "GET" else (step.get("body") or step.get("data") or {})
+            steps.append(Request(method, step["path"], data=data, follow_redirects=follow_redirects))
+
+        exp = scen.get("expected", {})
+        queries = []
+        if "no_db_record" in exp and scen["id"] not in table_checks:
+            queries.append(_no_db_record_query(exp["no_db_record"])[0])
+        expected = status_overrides.get(scen["id"], exp.get("status_code_range", exp.get("status_code")))
+        plans.append(Plan(
+            scen["id"], scen.get("name") or scen.get("description") or scen["id"], steps,
+            _steps_evaluator(scen, default_status_range, status_overrides, table_checks,
+                             reason_key, safe_reasons, default_safe_reason),
+            expected=expected, queries=queries,
+        ))
+    return plans
+
+
+##############################################################################
+# request_expect
+##############################################################################
+def _evaluate_db_value(expect, value):
+    # expect 딕셔너리에 어떤 키가 있느냐에 따라 pass/fail 판단
+    if "must_equal" in expect:
+        return value == expect["must_equal"], f"값이 {value} (≠ {expect['must_equal']})"
+    if "must_match" in expect:
+        matched = re.search(expect["must_match"], str(value) or "")
+        return bool(matched), f"값이 '{value}' 에서 패턴 일치 여부={bool(matched)}"
+    if "must_not_match" in expect:
+        matched = re.search(expect["must_not_match"], str(value) or "")
+        return not matched, f"값이 '{value}' 에서 패턴 일치 여부={bool(matched)}"
+    return True, "DB 조건 없음"
+
+
+@dialect("request_expect")
+def compile_request_expect(cfg):
+    plans = []
+    for t in cfg["tests"]:
+        steps = []
+        if t.get("login_user"):
+            steps.append(Request("GET", f"/login/{t['login_user']}", substitute=False))
+        req = t["request"]
+        steps.append(Request(req["method"], req["path"], data=req.get("data", {}), substitute=False))
+
+        expect = t["expect"]
+        db = expect.get("db")
+        query = f"SELECT {db['column']} FROM {db['table']} WHERE {db['where']}" if db else None
+
+        def evaluate(ctx, expect=expect, db=db, query=query):
+            status_ok = ctx.response.status_code == expect["status"]
+            reason = "HTTP 응답 코드 불일치" if not status_ok else "HTTP 응답 정상"
+            db_ok = True
+            if db:
+                row = ctx.db_fetchone(query)
+                db_ok, reason = _evaluate_db_value(db, None if row is None else row[0])
+            return status_ok and db_ok, reason
+
+        plans.append(Plan(t["id"], t["name"], steps, evaluate, expected=expect["status"],
+                          queries=[query] if query else []))
+    return plans
+
+
+##############################################################################
+# endpoint
+##############################################################################
+def _session_login_check(user_id):
+    # 별도 요청으로 로그인 가능 여부만 확인한다 (시나리오 세션에는 쿠키를 남기지 않음)
+    def check(ctx):
+        with ctx.target.new_session() as session:
+            resp = session.get(f"{ctx.target.base_url}/login/{user_id}", timeout=DEFAULT_TIMEOUT)
+        if resp.status_code != 200:
+            raise ScenarioAbort(f"로그인 실패 (user_id: {user_id})")
+    return Call(check, requests=[Request("GET", f"/login/{user_id}")])
+
+
+def _check_evaluator(chk):
+    """flask file_test 의 check{type: status_code | status_code_in | db_entry | content}"""
+    def evaluate(ctx):
+        resp = ctx.response
+        if chk["type"] == "status_code" and resp.status_code != chk.get("expect"):
+            return False, chk["reason"]
+        if chk["type"] == "status_code_in" and resp.status_code not in chk.get("expect", []):
+            return False, chk["reason"]
+        if chk["type"] == "db_entry":
+            try:
+                row = ctx.db_fetchone(chk["query"])
+            except Exception as e:
+                return False, f"쿼리 실행 실패 또는 예외 발생: {e}"
+            if row:
+                return False, chk["reason"].format(*row)
+        if chk["type"] == "content" and chk.get("should_not_contain") in resp.text:
+            return False, chk["reason"]
+        return True, None
+    return evaluate
+
+
+def _db_check_exists(ctx, check):
+    query = f"SELECT * FROM {check['table']} WHERE {check['column']} = ?"
+    return ctx.db_fetchone(query, (check["expected_value"],)) is not None
+
+
+def _endpoint_evaluator(t):
+    if "check" in t:
+        return _check_evaluator(t["check"])
+
+    def evaluate(ctx):
+        code = ctx.response.status_code
+
+        if "expected_status_range" in t:
+            bounds = t["expected_status_range"]
+            if not in_range(code, bounds):
+                return False, f"예상 코드 {bounds}, 실제 코드 {code}"
+            not_contains = (t.get("validate") or {}).get("not_contains")
+            if not_contains and not_contains in ctx.response.text:
+                return False, f"악성 내용이 포함됨 ({not_contains})"
+            return True, "모든 조건 통과"
+
+        if "safe_status_codes" in t:
+            codes = t["safe_status_codes"]
+            if code in codes:
+                return True, "모든 조건 통과"
+            return False, f"예상 코드 {codes}, 실제 코드 {code}"
+
+        expected = t.get("expected_status")
+        passed = status_matches(code, expected)
+        reason = t.get("reason")
+        if "db_check" in t:
+            check = t["db_check"]
+            exists = _db_check_exists(ctx, check)
+            if exists != check["result_should_exist"]:
+                db_info = f"(DB record {'found' if exists else 'not found'}: {check['column']}={check['expected_value']})"
+                state = "존재하지 않음" if check["result_should_exist"] else "존재함"
+                return False, f"{check['column']}={check['expected_value']} 값이 DB에 {state} {db_info}"
+            reason = f"{reason or ''} (DB check passed)"
+        elif not passed:
+            reason = f"예상 코드 {expected}, 실제 코드 {code}"
+        return passed, reason
+
+    return evaluate
+
+
+def _endpoint_queries(t):
+    if "check" in t and t["check"].get("query"):
+        return [t["check"]["query"]]
+    if "db_check" in t:
+        return [f"SELECT * FROM {t['db_check']['table']}"]
+    return []
+
+
+@dialect("endpoint")
+def compile_endpoint(cfg, follow_redirects=True, name_keys=("name", "title", "description"),
+                     error_is_vuln=False):
+    """
+    follow_redirects 본 요청에서 리다이렉트를 따라갈지
+    name_keys        출력 이름으로 쓸 필드 우선순위
+    error_is_vuln    요청 예외(연결 실패 등)를 취약으로 판정
+    """
+    plans = []
+    for t in cfg.get("tests") or cfg.get("scenarios") or []:
+        steps = []
+        if t.get("login"):
+            steps.append(Request("GET", f"/login/{t['login']}", follow_redirects=True, substitute=False))
+        if t.get("login_user_id") is not None:
+            steps.append(Request("GET", f"/login/{t['login_user_id']}", substitute=False))
+        if "session_login" in t:
+            steps.append(_session_login_check(t["session_login"]))
+
+        files = None
+        if t.get("files"):
+            spec = t["files"]
+            files = {key: (val[0], val[1].encode(), val[2]) for key, val in spec.items()}
+        steps.append(Request(
+            t.get("method", "GET"), t["endpoint"],
+            data=t.get("form") or t.get("data"),
+            json=t.get("payload") or None,
+            files=files,
+            headers=t.get("headers"),
+            follow_redirects=follow_redirects,
+            substitute=False,
+        ))
+
+        test_id = t.get("id") or t.get("test_id", "UNKNOWN")
+        name = next((t[key] for key in name_keys if t.get(key)), "Unnamed Test")
+        expected = (t.get("expected_status") or t.get("expected_status_range")
+                    or t.get("safe_status_codes") or (t.get("check") or {}).get("expect"))
+        plans.append(Plan(test_id, name, steps, _endpoint_evaluator(t), expected=expected,
+                          error_is_vuln=error_is_vuln, queries=_endpoint_queries(t)))
+    return plans
+
+
+##############################################################################
+# request_url
+##############################################################################
+def _set_session_cookies(values):
+    # 모든 세션 값을 문자열로 변환
+    return Call(lambda ctx: ctx.session.cookies.update({k: str(v) for k, v in values.items()}))
+
+
+@dialect("request_url")
+def compile_request_url(cfg, follow_redirects=True):
+    plans = []
+    for s in cfg["scenarios"]:
+        req = s["request"]
+        steps = []
+        if "session" in req:
+            steps.append(_set_session_cookies(req["session"]))
+        steps.append(Request(
+            req["method"], req["url"],
+            data=req.get("form") or req.get("data"),
+            headers=req.get("headers"),
+            params=req.get("params"),
+            follow_redirects=follow_redirects,
+            substitute=False,
+        ))
+
+        expect = s["expect"]
+        db_check = s.get("db_check")
+
+        def evaluate(ctx, expect=expect, db_check=db_check):
+            resp = ctx.response
+            reasons = []
+            if "status_code" in expect:
+                if resp.status_code != expect["status_code"]:
+                    reasons.append(f"상태 코드 {resp.status_code}, 예상 {expect['status_code']}")
+            elif "status_code_range" in expect:
+                if not status_matches(resp.status_code, expect["status_code_range"]):
+                    reasons.append(f"상태 코드 {resp.status_code}, 예상 범위 {expect['status_code_range']}")
+            for header, value in expect.get("headers", {}).items():
+                actual = resp.headers.get(header)
+                if actual != value:
+                    reasons.append(f"헤더 {header}: {actual} (예상 {value})")
+            if "body_contains" in expect and expect["body_contains"] not in resp.text:
+                reasons.append(f"본문에 '{expect['body_contains']}' 없음")
+            if db_check:
+                row = ctx.db_fetchone(db_check["query"])
+                actual_value = row[0] if row else None
+                if actual_value != db_check["expected"]:
+                    reasons.append(f"DB 검증 실패: `{db_check['query']}` → {actual_value} (예상 {db_check['expected']})")
+            return not reasons, "; ".join(reasons) or None
+
+        plans.append(Plan(s["id"], s.get("description") or s.get("name") or s["id"], steps, evaluate,
+                          expected=expect.get("status_code", expect.get("status_code_range")),
+                          queries=[db_check["query"]] if db_check else []))
+    return plans
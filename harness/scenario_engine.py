@@ -0,0 +1,626 @@
+"""
+scenario_engine.py – scenario.yaml 을 실행 계획으로 컴파일해 실행하는 공용 보안 테스트 엔진
+
+각 타깃의 security_test.py 는 이 모듈의 run_file() 만 호출한다.
+  1. scenario.yaml 을 한 번 읽어 방언(dialect)별 컴파일러로 Plan 목록을 만든다.
+  2. Plan 마다 새 세션(쿠키 분리)과 연결 풀(HTTPAdapter)을 만든다 – 앞 Plan 의 오류 응답 뒤
+     앱이 끊은 keep-alive 연결을 다른 Plan 이 물려받지 않는다.
+  3. HARNESS_SCENARIO_WORKERS 를 2 이상으로 주면 서로 영향을 주지 않는 Plan 을 동시에 실행한다
+     (스텝의 읽기/쓰기 범위로 의존성 판단). 기본은 선언 순서대로 하나씩.
+     DB 격리 모드(HARNESS_DB_ISOLATION=scenario)에서는 시드 직후 DB 를 메모리에 떠 두고
+     DB 를 바꾼 시나리오가 끝날 때마다 되돌려, 모든 시나리오가 같은 상태에서 시작한다.
+  4. 결과는 선언 순서대로 기존과 같은 형식으로 출력하고, results.emit() 으로 JSON Lines 에도 남긴다.
+
+방언 컴파일러는 harness/scenario_dialects.py 에 있다.
+"""
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from harness import inprocess, results
+
+SEP = "-" * 50
+DEFAULT_BASE_URL = "http://127.0.0.1:5000"
+DEFAULT_TIMEOUT = 10
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
+# 타깃 안에서 동시에 실행할 시나리오 수 (1 이면 선언 순서대로 하나씩).
+# GET 으로 상태를 바꾸는 생성 앱도 있어 범위 판단이 틀릴 수 있으므로 기본은 1 (이전 스윕과 판정 비교 가능)
+WORKERS_ENV = "HARNESS_SCENARIO_WORKERS"
+DEFAULT_WORKERS = 1
+# "scenario" 이면 시나리오마다 DB 를 시드 상태로 되돌린다
+ISOLATION_ENV = "HARNESS_DB_ISOLATION"
+
+TABLE_PATTERN = re.compile(r"\b(?:FROM|JOIN|INTO|UPDATE|TABLE)\s+[`\"\[]?(\w+)", re.IGNORECASE)
+
+# 방언 이름 → compile(cfg, **options) -> [Plan]
+DIALECTS: Dict[str, Callable] = {}
+
+
+def dialect(name):
+    def register(func):
+        DIALECTS[name] = func
+        return func
+    return register
+
+
+class ScenarioAbort(Exception):
+    """시나리오를 판정 없이 끝낸다 (예: 사전 로그인 실패)."""
+
+
+##############################################################################
+# 상태 코드 비교
+##############################################################################
+def status_matches(code, spec):
+    """'200-299' / '404' / 404 / '4xx' 형태의 기대값과 비교한다."""
+    if isinstance(spec, str):
+        spec = spec.strip()
+        m = re.match(r"(\d+)-(\d+)$", spec)
+        if m:
+            return int(m[1]) <= code <= int(m[2])
+        if len(spec) == 3 and spec.endswith("xx") and spec[0].isdigit():
+            start = int(spec[0]) * 100
+            return start <= code < start + 100
+    try:
+        return int(spec) == code
+    except (TypeError, ValueError):
+        return False
+
+
+def in_range(code, bounds):
+    return bounds[0] <= code <= bounds[1]
+
+
+##############################################################################
+# 부수 효과 범위 (동시 실행 판단용)
+#   키는 ("db", 테이블) 또는 ("http", 첫 경로 조각), 이름이 "*" 이면 그 종류 전체
+##############################################################################
+ANY = "*"
+
+
+def tables_of(*queries):
+    """SQL 문에서 읽거나 쓰는 테이블 이름 집합"""
+    return {name.lower() for query in queries for name in TABLE_PATTERN.findall(query)}
+
+
+def db_keys(*queries):
+    return {("db", table) for table in tables_of(*queries)}
+
+
+def http_resource(path):
+    """'/posts/3/edit' → 'posts'. 루트('/')는 목록 화면이라 모든 리소스를 본다고 가정한다."""
+    return path.split("?", 1)[0].strip("/").split("/", 1)[0] or ANY
+
+
+def _overlap(a, b):
+    return any(kind == other_kind and ANY in (name, other_name) or (kind, name) == (other_kind, other_name)
+               for kind, name in a for other_kind, other_name in b)
+
+
+##############################################################################
+# 실행 계획
+##############################################################################
+@dataclass
+class Request:
+    method: str
+    path: str
+    data: Any = None
+    json: Any = None
+    files: Any = None
+    headers: Optional[Dict[str, str]] = None
+    params: Any = None
+    follow_redirects: bool = False
+    substitute: bool = True
+    # 응답 본문에서 정규식 첫 그룹을 뽑아 이후 스텝의 {{이름}} 에 쓴다 (못 찾으면 빈 문자열)
+    capture: Optional[Dict[str, str]] = None
+
+    @property
+    def mutating(self):
+        return self.method.upper() not in READ_ONLY_METHODS
+
+    def footprint(self):
+        """(읽는 키, 쓰는 키) – 변경 요청은 어느 테이블을 건드릴지 모르므로 DB 전체를 쓴다고 본다."""
+        resource = ("http", http_resource(self.path))
+        return {resource}, ({resource, ("db", ANY)} if self.mutating else set())
+
+    def __call__(self, ctx):
+        resp = ctx.request(self)
+        for name, pattern in (self.capture or {}).items():
+            m = re.search(pattern, resp.text)
+            ctx.local[name] = m.group(1) if m else ""
+        return resp
+
+
+@dataclass
+class DbExec:
+    sql: str
+    mutating: bool = True
+
+    def footprint(self):
+        # DB 를 직접 바꾸면 어떤 화면에 보일지 모른다
+        return db_keys(self.sql), db_keys(self.sql) | {("http", ANY)}
+
+    def __call__(self, ctx):
+        ctx.db_exec(ctx.substitute(self.sql))
+
+
+@dataclass
+class SetVars:
+    """{변수: 쿼리} – 첫 행 첫 열을 타깃 전체에서 쓰는 {변수} 로 저장한다."""
+    queries: Dict[str, str]
+    mutating: bool = False
+
+    def footprint(self):
+        return db_keys(*self.queries.values()), set()
+
+    def __call__(self, ctx):
+        for name, query in self.queries.items():
+            row = ctx.db_fetchone(ctx.substitute(query))
+            ctx.vars[name] = row[0] if row else None
+
+
+@dataclass
+class Call:
+    """방언 고유 동작 (세션 쿠키 설정, DB 조회 후 로그인 등)"""
+    func: Callable
+    mutating: bool = False
+    queries: List[str] = field(default_factory=list)
+    requests: List[Request] = field(default_factory=list)   # 안에서 보내는 요청 (범위 계산용)
+
+    def footprint(self):
+        reads, writes = db_keys(*self.queries), set()
+        for req in self.requests:
+            req_reads, req_writes = req.footprint()
+            reads |= req_reads
+            writes |= req_writes
+        return reads, writes
+
+    def __call__(self, ctx):
+        return self.func(ctx)
+
+
+@dataclass
+class Plan:
+    id: str
+    name: str
+    steps: List[Any]
+    # ctx → (안전 여부, 이유). 안전 여부가 None 이면 판정하지 않은 것(실패)으로 본다.
+    evaluate: Optional[Callable] = None
+    expected: Any = None
+    seed: bool = False              # _PRE_ 시드 스텝: 판정/집계하지 않음
+    error_is_vuln: bool = False     # 요청 예외를 취약으로 판정 (아니면 그 Plan 만 실패)
+    queries: List[str] = field(default_factory=list)   # 판정에 쓰는 SQL (의존성 분석용)
+
+    @property
+    def category(self):
+        return results.category_of(self.id)
+
+    @property
+    def mutating(self):
+        return any(getattr(step, "mutating", False) for step in self.steps)
+
+    def footprint(self):
+        reads, writes = db_keys(*self.queries), set()
+        for step in self.steps:
+            step_reads, step_writes = step.footprint()
+            reads |= step_reads
+            writes |= step_writes
+        return reads, writes
+
+
+def conflicts(a, b):
+    """두 Plan 의 실행 순서가 결과에 영향을 줄 수 있는지 (시드는 항상 장벽)"""
+    if a.seed or b.seed:
+        return True
+    a_reads, a_writes = a.footprint()
+    b_reads, b_writes = b.footprint()
+    return _overlap(a_writes, b_reads) or _overlap(b_writes, a_reads) or _overlap(a_writes, b_writes)
+
+
+def dependencies(plans, isolated=False):
+    """
+    Plan 별로 먼저 끝나야 하는 앞선 Plan 인덱스 목록 (선언 순서는 충돌할 때만 지킨다).
+    DB 격리 모드에서는 시나리오끼리 상태를 물려받지 않으므로 시드만 순서를 지킨다.
+    """
+    if isolated:
+        return [[i for i in range(j) if plans[i].seed or plans[j].seed] for j in range(len(plans))]
+    return [[i for i in range(j) if conflicts(plans[i], plans[j])] for j in range(len(plans))]
+
+
+@dataclass
+class Outcome:
+    safe: Optional[bool]
+    status: Any = None
+    reason: Optional[str] = None
+    latency: float = 0.0
+
+
+##############################################################################
+# DB 스냅샷 (격리 모드)
+##############################################################################
+class DbSnapshot:
+    """SQLite backup API 로 DB 를 메모리에 복사해 두고, 필요할 때 원래 파일로 되돌린다."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.image = None
+
+    def capture(self):
+        if not os.path.exists(self.db_path):
+            return False
+        image = sqlite3.connect(":memory:", check_same_thread=False)
+        with closing(sqlite3.connect(self.db_path, timeout=DEFAULT_TIMEOUT)) as src:
+            src.backup(image)
+        if self.image is not None:
+            self.image.close()
+        self.image = image
+        return True
+
+    def restore(self):
+        # 앱이 연결을 열어 둔 상태여도 backup 은 잠금이 풀릴 때까지 재시도하며 페이지를 덮어쓴다
+        with closing(sqlite3.connect(self.db_path, timeout=DEFAULT_TIMEOUT)) as dest:
+            self.image.backup(dest)
+
+    def close(self):
+        if self.image is not None:
+            self.image.close()
+            self.image = None
+
+
+class SharedLock:
+    """읽기 전용 시나리오는 함께, DB 를 바꾸는 시나리오(와 복원)는 단독으로 실행한다."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+
+    @contextmanager
+    def shared(self):
+        with self._cond:
+            self._cond.wait_for(lambda: not self._writer)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        with self._cond:
+            self._cond.wait_for(lambda: not self._writer and self._readers == 0)
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+##############################################################################
+# 타깃 / 실행 컨텍스트
+##############################################################################
+def resolve_base_url(cfg_base_url, default=DEFAULT_BASE_URL):
+    """하네스가 할당한 포트(HARNESS_BASE_URL)가 있으면 scenario.yaml 의 base_url 보다 우선한다."""
+    base_url = os.environ.get("HARNESS_BASE_URL") or cfg_base_url or default
+    return base_url.rstrip("/")
+
+
+class Target:
+    def __init__(self, target_dir, cfg, default_base_url=DEFAULT_BASE_URL):
+        self.dir = target_dir
+        self.cfg = cfg
+        self.base_url = resolve_base_url(cfg.get("base_url"), default_base_url)
+        db_name = cfg.get("database") or cfg.get("db_path") or "mock_db.sqlite3"
+        self.db_path = os.path.join(target_dir, db_name)
+        self.vars = {}
+        # DB 격리 모드일 때만 설정된다
+        self.snapshot = None
+        self.lock = SharedLock()
+
+    def new_session(self):
+        """
+        Plan 하나가 쓸 세션. 소켓 전송이면 연결 풀도 Plan 마다 따로 둔다.
+        in-process 전송이면 소켓 대신 앱을 직접 호출하는 어댑터(타깃 공용)를 쓴다.
+        소켓 어댑터는 연결을 맺지 못한 경우만 한 번 다시 시도한다 (read=False: 보낸 뒤의 오류는
+        앱이 이미 처리했을 수 있으므로 여기서 다시 보내지 않는다 – Context.request 참고).
+        """
+        adapter = inprocess.get_adapter() or HTTPAdapter(
+            pool_connections=1, pool_maxsize=1,
+            max_retries=Retry(total=1, read=False, status=False, allowed_methods=None, raise_on_status=False))
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+
+def _reset_before_response(error):
+    """응답을 한 바이트도 받기 전에 연결이 리셋/종료됐는지 (ConnectionError 안의 원인을 따라간다)"""
+    seen = set()
+    while isinstance(error, BaseException) and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, (ConnectionResetError, BrokenPipeError)):
+            return True
+        causes = [arg for arg in error.args if isinstance(arg, BaseException)]
+        error = getattr(error, "reason", None) or (causes[-1] if causes else None)
+    return False
+
+
+class Context:
+    def __init__(self, target):
+        self.target = target
+        self.session = target.new_session()
+        self.vars = target.vars
+        self.local = {}
+        self.response = None
+        self.latency = 0.0
+
+    def substitute(self, value):
+        if isinstance(value, str):
+            for source in (self.local, self.vars):
+                for key, val in source.items():
+                    value = value.replace(f"{{{{{key}}}}}", str(val)).replace(f"{{{key}}}", str(val))
+            return value
+        if isinstance(value, dict):
+            return {k: self.substitute(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.substitute(v) for v in value]
+        return value
+
+    def request(self, spec):
+        sub = self.substitute if spec.substitute else (lambda v: v)
+        url = self.target.base_url + sub(spec.path)
+        start = time.perf_counter()
+        # 읽기 요청은 연결 오류가 나면 새 연결로 한 번 더 보낸다. 변경 요청(POST/PUT/DELETE 등)은
+        # 앞 요청이 남긴 keep-alive 연결이 응답 전에 리셋된 경우만 다시 보낸다 – 앱이 오류 응답 뒤
+        # 닫은 연결이라 요청이 처리되지 않았다. 그 밖의 오류는 앱이 이미 처리했을 수 있어 그대로 올린다.
+        for attempt in range(2):
+            reused = self._keep_alive(url)
+            try:
+                resp = self.session.request(
+                    spec.method.upper(),
+                    url,
+                    data=sub(spec.data),
+                    json=sub(spec.json),
+                    files=spec.files() if callable(spec.files) else spec.files,
+                    headers=spec.headers,
+                    params=spec.params,
+                    allow_redirects=spec.follow_redirects,
+                    timeout=DEFAULT_TIMEOUT,
+                )
+                break
+            except requests.ConnectionError as e:
+                retry = not spec.mutating or (reused and _reset_before_response(e))
+                if attempt or not retry:
+                    raise
+        self.latency += time.perf_counter() - start
+        self.response = resp
+        return resp
+
+    def _keep_alive(self, url):
+        """이 세션의 풀에 앞 요청이 남긴 연결이 있는지 (다음 요청은 그 연결로 나간다)"""
+        adapter = self.session.get_adapter(url)
+        if isinstance(adapter, inprocess.InProcessAdapter):
+            return False
+        pool = adapter.poolmanager.connection_from_url(url)
+        return any(conn is not None and conn.sock is not None for conn in list(pool.pool.queue))
+
+    def close(self):
+        self.session.close()
+
+    # ── DB helpers ───────────────────────────────────────────────
+    def db_fetchone(self, query, params=()):
+        with sqlite3.connect(self.target.db_path) as conn:
+            return conn.execute(query, params).fetchone()
+
+    def db_has_row(self, query, params=()):
+        """쿼리 결과가 있으면 True, SQL 오류는 행 없음으로 본다."""
+        try:
+            return self.db_fetchone(query, params) is not None
+        except sqlite3.Error:
+            return False
+
+    def db_exec(self, sql, params=()):
+        with sqlite3.connect(self.target.db_path) as conn:
+            conn.execute(sql, params)
+            conn.commit()
+
+    def table_exists(self, table):
+        try:
+            self.db_fetchone(f"SELECT 1 FROM {table} LIMIT 1")
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+
+##############################################################################
+# 실행 / 출력
+##############################################################################
+def execute(target, plan):
+    ctx = Context(target)
+    try:
+        for step in plan.steps:
+            step(ctx)
+        status = ctx.response.status_code if ctx.response is not None else None
+        if plan.seed:
+            return Outcome(None, status, latency=ctx.latency)
+        safe, reason = plan.evaluate(ctx)
+        return Outcome(safe, status, reason, ctx.latency)
+    except ScenarioAbort as e:
+        return Outcome(None, None, str(e), ctx.latency)
+    except requests.RequestException as e:
+        # error_is_vuln 이 아니면 이 Plan 만 판정하지 않은 것(실패)으로 남기고 나머지 시나리오는 계속 실행한다
+        return Outcome(False if plan.error_is_vuln else None, "Error", f"요청 중 예외 발생: {e}", ctx.latency)
+    finally:
+        ctx.close()
+
+
+def report(plan, outcome):
+    if plan.seed:
+        status = f" (Status {outcome.status})" if outcome.status is not None else ""
+        print(f"[PRE] {plan.name} → 완료{status}")
+        return
+
+    print(SEP)
+    print(f"[Test ID: {plan.id}] {plan.name}")
+    if plan.expected is not None:
+        print(f"Status Code: {outcome.status}  (expected {plan.expected})")
+    else:
+        print(f"Status Code: {outcome.status}")
+    if outcome.safe is None:
+        print("결과: ⚠️ 실패")
+    else:
+        print(f"결과: {'✅ 안전' if outcome.safe else '❌ 취약'}")
+    if outcome.reason:
+        print(f"이유: {outcome.reason}")
+
+    if outcome.safe is not None:
+        results.emit(plan.id, outcome.safe, name=plan.name,
+                     expected_status=None if plan.expected is None else str(plan.expected),
+                     actual_status=outcome.status, reason=outcome.reason,
+                     latency=round(outcome.latency, 6))
+
+
+def execute_isolated(target, plan):
+    """격리 모드: DB 를 바꿀 수 있는 Plan 은 단독 실행 후 스냅샷으로 되돌린다. 시드는 스냅샷을 새로 뜬다."""
+    snapshot = target.snapshot
+    if snapshot is None:
+        return execute(target, plan)
+    if plan.seed:
+        with target.lock.exclusive():
+            outcome = execute(target, plan)
+            snapshot.capture()
+            return outcome
+    if plan.footprint()[1]:
+        with target.lock.exclusive():
+            try:
+                return execute(target, plan)
+            finally:
+                snapshot.restore()
+    with target.lock.shared():
+        return execute(target, plan)
+
+
+def _execute_after(deps, target, plan):
+    # 앞선 Plan 은 항상 먼저 제출되므로 (FIFO) 여기서 기다려도 교착되지 않는다
+    wait(deps)
+    return execute_isolated(target, plan)
+
+
+def resolve_workers(workers=None):
+    if workers is None:
+        workers = int(os.environ.get(WORKERS_ENV) or DEFAULT_WORKERS)
+    return max(1, workers)
+
+
+def resolve_isolation(isolate=None):
+    if isolate is None:
+        isolate = os.environ.get(ISOLATION_ENV, "").lower() == "scenario"
+    return bool(isolate)
+
+
+def run_plans(target, plans, workers=None, isolate=None):
+    workers = resolve_workers(workers)
+    if resolve_isolation(isolate):
+        target.snapshot = DbSnapshot(target.db_path)
+        if not target.snapshot.capture():
+            print(f"⚠️ DB 파일이 없어 격리 모드를 끕니다: {target.db_path}")
+            target.snapshot = None
+    try:
+        _run_plans(target, plans, workers)
+    finally:
+        if target.snapshot is not None:
+            target.snapshot.close()
+    print(SEP)
+
+
+def _run_plans(target, plans, workers):
+    if workers == 1:
+        for plan in plans:
+            report(plan, execute_isolated(target, plan))
+        return
+
+    deps = dependencies(plans, isolated=target.snapshot is not None)
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scenario")
+    try:
+        futures = []
+        for plan, before in zip(plans, deps):
+            futures.append(pool.submit(_execute_after, [futures[i] for i in before], target, plan))
+        # 완료 순서와 상관없이 선언 순서대로 출력
+        for plan, future in zip(plans, futures):
+            report(plan, future.result())
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+##############################################################################
+# 진입점
+##############################################################################
+_compiled = {}
+
+
+def load_plans(scenario_path, dialect_name, options):
+    """scenario.yaml 을 방언 컴파일러로 한 번만 컴파일한다 (파일이 바뀌면 다시)."""
+    mtime = os.path.getmtime(scenario_path)
+    key = (scenario_path, mtime, dialect_name, repr(sorted(options.items())))
+    if key not in _compiled:
+        with open(scenario_path, encoding="utf-8") as f:
+            cfg = yaml.safe_load(f)
+        _compiled[key] = (cfg, DIALECTS[dialect_name](cfg, **options))
+    return _compiled[key]
+
+
+def run_file(test_file, dialect="tests", scenario="scenario.yaml", base_url=DEFAULT_BASE_URL,
+             fixtures=None, cleanup=(), workers=None, isolate=None, **options):
+    """
+    security_test.py 에서 호출한다.
+      dialect  – scenario.yaml 형식 (harness/scenario_dialects.py 참고)
+      base_url – scenario.yaml 에 base_url 이 없을 때 쓸 기본 주소
+      fixtures – 실행 전에 만들 파일 {상대 경로: 내용}
+      cleanup  – 실행 후 지울 폴더/파일 (상대 경로)
+      workers  – 동시에 실행할 시나리오 수 (기본: HARNESS_SCENARIO_WORKERS 또는 1)
+      isolate  – 시나리오마다 DB 를 시드 상태로 되돌릴지 (기본: HARNESS_DB_ISOLATION=scenario)
+      options  – 방언 컴파일러에 넘길 타깃별 설정
+    """
+    target_dir = os.path.dirname(os.path.abspath(test_file))
+    scenario_path = os.path.join(target_dir, scenario)
+    if not os.path.exists(scenario_path):
+        print("❗ scenario.yaml 파일을 찾을 수 없습니다.")
+        return
+
+    for rel_path, content in (fixtures or {}).items():
+        path = os.path.join(target_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    try:
+        cfg, plans = load_plans(scenario_path, dialect, options)
+        run_plans(Target(target_dir, cfg, base_url), plans, workers, isolate)
+    finally:
+        for rel_path in cleanup:
+            path = os.path.join(target_dir, rel_path)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            elif os.path.exists(path):
+                os.remove(path)
+        sys.stdout.flush()
+
+
+# 방언 컴파일러 등록
+from harness import scenario_dialects  # noqa: E402,F401
@@ -0,0 +1,231 @@
+"""
+static_analysis.py – bandit 을 프로세스 안에서 실행하는 정적 분석 단계
+
+bandit 과 플러그인은 import 시 한 번만 로드하고, 여러 파일을 한 번의
+BanditManager 실행으로 검사한다. 결과는 `bandit -f json` 과 같은
+{"metrics": {"_totals": ...}, "results": [...]} 형태의 JSON 문자열로 돌려주므로
+드라이버의 기존 집계 코드를 그대로 쓸 수 있다.
+
+검사 결과는 (코드 SHA-256, bandit 버전/설정) 을 키로 디스크에도 저장해
+재시도나 다음 스윕에서 같은 코드를 다시 검사하지 않는다.
+
+bandit 의 로거는 드라이버의 DEBUG 루트 로거를 물려받으므로 WARNING 으로 올려 둔다
+(검사마다 플러그인 로드/노드 방문 DEBUG 로그가 수천 줄씩 실행 로그에 남는다).
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import Counter
+
+from harness.cache import DiskCache, content_hash
+
+try:
+    import bandit
+    from bandit.core import config as b_config
+    from bandit.core import extension_loader as b_extensions
+    from bandit.core import manager as b_manager
+except ImportError:  # bandit 이 다른 인터프리터에만 설치된 경우 CLI 로 대체
+    bandit = b_config = b_extensions = b_manager = None
+
+BANDIT_LOG_LEVEL = logging.WARNING
+logging.getLogger("bandit").setLevel(BANDIT_LOG_LEVEL)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 ".cache", "bandit")
+
+_lock = threading.Lock()
+_config = None
+_fingerprint = None
+_cache = None
+# 이번 실행 안에서 이미 검사한 코드 (키 → 결과)
+_memo = {}
+# 조회 결과별 횟수 (memory: _memo 적중, disk: 디스크 캐시 적중, miss: 새로 검사)
+_stats_lock = threading.Lock()
+_lookups = Counter()
+
+
+def _get_config():
+    global _config
+    if _config is None:
+        _config = b_config.BanditConfig()
+    return _config
+
+
+def _bandit_fingerprint():
+    """bandit 버전, 설정, 로드된 플러그인 목록 – 하나라도 바뀌면 캐시 키가 달라진다."""
+    global _fingerprint
+    if _fingerprint is None:
+        if b_manager is None:
+            version = subprocess.run(["bandit", "--version"], capture_output=True, text=True).stdout
+            _fingerprint = content_hash("bandit-cli", version.strip())
+        else:
+            _fingerprint = content_hash("bandit", bandit.__version__, _get_config().config,
+                                        sorted(b_extensions.MANAGER.plugins_by_id))
+    return _fingerprint
+
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        _cache = DiskCache(DEFAULT_CACHE_DIR, max_bytes=128 * 1024 * 1024)
+    return _cache
+
+
+def set_cache(cache):
+    """디스크 캐시를 바꾼다. None 이면 디스크 캐시를 쓰지 않는다."""
+    global _cache
+    _cache = cache if cache is not None else False
+
+
+def cache_stats():
+    """
+    {"memory_hits", "hits", "misses", "entries", "bytes", "disk"} – hits 는 디스크 캐시 적중,
+    memory_hits 는 이번 실행 안에서 같은 코드를 다시 만난 경우 (재시도, pass@k 후보).
+    디스크 캐시를 쓰지 않으면 disk=False, entries/bytes 는 0.
+    """
+    with _stats_lock:
+        stats = {"memory_hits": _lookups["memory"], "hits": _lookups["disk"], "misses": _lookups["miss"],
+                 "entries": 0, "bytes": 0, "disk": False}
+    cache = get_cache()
+    if cache is not False:
+        disk = cache.stats()
+        stats.update(entries=disk["entries"], bytes=disk["bytes"], disk=True)
+    return stats
+
+
+def _count(kind):
+    with _stats_lock:
+        _lookups[kind] += 1
+
+
+def _source_key(code):
+    code_hash = hashlib.sha256(code.encode("utf-8")).hexdigest()
+    return content_hash(code_hash, _bandit_fingerprint())
+
+
+def _lookup(key):
+    if key in _memo:
+        _count("memory")
+        return _memo[key]
+    cache = get_cache()
+    result = cache.get(key) if cache is not False else None
+    if result is not None:
+        _memo[key] = result
+    _count("disk" if result is not None else "miss")
+    return result
+
+
+def _store(key, result):
+    _memo[key] = result
+    cache = get_cache()
+    if cache is not False:
+        cache.put(key, result)
+
+
+def _compile(code):
+    try:
+        compile(code, "app.py", "exec")
+        return True, None
+    except Exception as e:
+        return False, str(e)
+
+
+def _scan_in_process(paths):
+    # 호출한 쪽이 로깅을 다시 설정했더라도 bandit 의 DEBUG/INFO 로그는 실행 로그에 남기지 않는다
+    bandit_logger = logging.getLogger("bandit")
+    if bandit_logger.getEffectiveLevel() < BANDIT_LOG_LEVEL:
+        bandit_logger.setLevel(BANDIT_LOG_LEVEL)
+    with _lock:
+        manager = b_manager.BanditManager(_get_config(), "file", quiet=True)
+        manager.discover_files(paths, False)
+        manager.run_tests()
+        issues = manager.get_issue_list()
+        metrics = {path: dict(manager.metrics.data.get(path, {})) for path in paths}
+
+    results = {path: [] for path in paths}
+    for issue in issues:
+        results.setdefault(issue.fname, []).append(issue.as_dict())
+    return {
+        path: {"errors": [], "metrics": {"_totals": metrics[path], path: metrics[path]},
+               "results": results[path]}
+        for path in paths
+    }
+
+
+def _scan_with_cli(paths):
+    output = {}
+    for path in paths:
+        result = subprocess.run(["bandit", "-r", path, "-f", "json"], capture_output=True, text=True)
+        output[path] = json.loads(result.stdout)
+    return output
+
+
+def analyze_sources(sources):
+    """
+    sources: {label: code}
+    컴파일되는 코드만 모아 bandit 을 한 번 실행하고
+    {label: {"compile_ok", "compile_err", "bandit_ok", "bandit_output"}} 을 돌려준다.
+    """
+    results = {}
+    pending = {}
+    for label, code in sources.items():
+        compile_ok, compile_err = _compile(code)
+        if not compile_ok:
+            results[label] = {"compile_ok": False, "compile_err": compile_err,
+                              "bandit_ok": None, "bandit_output": ""}
+            continue
+        key = _source_key(code)
+        if key in pending:
+            # 같은 묶음에 같은 코드가 또 있으면 한 번만 검사한다
+            _count("memory")
+            pending[key].append(label)
+            continue
+        cached = _lookup(key)
+        if cached is not None:
+            results[label] = cached
+            continue
+        pending.setdefault(key, []).append(label)
+
+    if not pending:
+        return results
+
+    tmp_dir = tempfile.mkdtemp(prefix="bandit_")
+    try:
+        paths = {}
+        for key, labels in pending.items():
+            path = os.path.join(tmp_dir, f"{key}.py")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(sources[labels[0]])
+            paths[path] = key
+
+        try:
+            scans = _scan_in_process(list(paths)) if b_manager else _scan_with_cli(list(paths))
+        except Exception as e:
+            logging.error(f"Bandit 실행 실패: {str(e)}")
+            scans = None
+
+        for path, key in paths.items():
+            if scans is None:
+                result = {"compile_ok": True, "compile_err": None,
+                          "bandit_ok": False, "bandit_output": ""}
+            else:
+                scan = scans[path]
+                result = {"compile_ok": True, "compile_err": None,
+                          "bandit_ok": not scan["results"],
+                          "bandit_output": json.dumps(scan, ensure_ascii=False)}
+                _store(key, result)
+            for label in pending[key]:
+                results[label] = result
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def analyze_source(code):
+    """코드 하나를 검사한다. 같은 코드는 다시 검사하지 않는다."""
+    return analyze_sources({0: code})[0]
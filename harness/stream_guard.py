@@ -0,0 +1,144 @@
+"""
+stream_guard.py – 스트리밍으로 받는 생성 결과를 조각마다 검사해 일찍 끊는다 (--stream-guard)
+
+  guard = StreamGuard(target)
+  for delta in 스트림:
+      stop = guard.feed(delta)
+      if stop: 작업 취소 → stop.accept 면 stop.text 를 결과로, 아니면 바로 재생성
+  text = guard.finish()       # 끝까지 받은 경우
+
+  fence  파이썬 블록이 닫혔고 그 블록만으로 완성된 앱이면 (파싱됨 + __main__ 실행 구문) 바로 받아들인다
+         – 뒤따르는 설명 문장/실행 방법 예시를 기다리지 않는다
+  loop   같은 줄(또는 몇 줄 묶음)이 되풀이되면 반복에 빠진 것으로 보고 끊어 재생성한다
+  prose  코드가 아닌 내용(블록 밖 설명 문장, 파이썬이 아닌 블록)이 한도를 넘으면 끊는다
+         – 그때까지 받은 내용에서 완성된 앱을 꺼낼 수 있으면 받아들이고, 아니면 재생성
+
+줄 단위 판단은 harness.extract.CodeScanner 를 그대로 쓴다.
+"""
+import logging
+import re
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass
+
+from harness.extract import CODE_LINE, PYTHON_LANGS, CodeScanner, extract_code
+
+LOOP_LINES = 40           # 최근 이만큼의 (빈 줄이 아닌) 줄이
+MAX_PERIOD = 8            # 이 길이 이하의 묶음으로 되풀이되면 반복으로 본다
+NON_PYTHON_CHARS = 3000   # 코드가 아닌 내용이 이 글자 수를 넘으면 끊는다
+# 설명 문장 (대문자로 시작하는 단어 뒤에 단어 셋 이상, 또는 목록 항목)
+PROSE = re.compile(r"^(?:[A-Z][a-z]+(?:[ ,'’]+\S+){3,}|(?:[-*+]|\d+[.)])\s+\w)")
+TRIPLE_QUOTE = re.compile(r'"""|\'\'\'')
+
+_lock = threading.Lock()
+_stats = Counter()
+
+
+@dataclass
+class Stop:
+    reason: str           # fence / loop / prose
+    accept: bool          # 받은 내용을 결과로 쓸 수 있는지 (아니면 재생성)
+    text: str             # 끊은 시점까지 받은 출력
+    detail: str = ""
+
+
+class StreamGuard(CodeScanner):
+    def __init__(self, target=""):
+        super().__init__()
+        self.target = target
+        self.chunks = []
+        self.stop = None
+        self.non_python = 0                       # 코드가 아닌 내용의 글자 수
+        self._recent = deque(maxlen=LOOP_LINES)
+        self._in_string = False                   # 블록 밖 코드의 삼중 따옴표 문자열 안인지
+
+    def text(self):
+        return "".join(self.chunks)
+
+    def feed(self, text):
+        """새로 받은 조각을 검사한다. 끊어야 하면 Stop (이후 조각은 무시)."""
+        if self.stop is None and text:
+            self.chunks.append(text)
+            super().feed(text)
+        return self.stop
+
+    def finish(self):
+        """끝까지 받은 생성의 전체 출력"""
+        with _lock:
+            _stats["completed"] += 1
+        return self.text()
+
+    def _line(self, line):
+        if self.stop is not None:
+            return
+        in_block = self._open is not None
+        closed = len(self.blocks)
+        super()._line(line)
+
+        stripped = line.strip()
+        if stripped:
+            self._recent.append(stripped)
+            period = self._loop_period()
+            if period:
+                return self._stop("loop", False, f"{period}줄 묶음이 {LOOP_LINES // period}번 넘게 반복")
+
+        if len(self.blocks) > closed:
+            lang, lines, _ = self.blocks[-1]
+            if _is_python(lang) and _complete_app("\n".join(lines)):
+                return self._stop("fence", True)
+            return
+        if in_block and not _is_python(self._open[1]) and stripped and not CODE_LINE.match(line):
+            self.non_python += len(stripped)
+        elif not in_block and self._open is None:
+            # 블록 밖 (펜스 없이 코드만 쓰는 경우 포함) – 문자열 안의 줄은 코드로 본다
+            if not self._in_string and PROSE.match(stripped) and not CODE_LINE.match(line):
+                self.non_python += len(stripped)
+            if len(TRIPLE_QUOTE.findall(line)) % 2:
+                self._in_string = not self._in_string
+        if self.non_python > NON_PYTHON_CHARS:
+            extraction = extract_code(self.text())
+            self._stop("prose", extraction.ok and _complete_app(extraction.code), f"{self.non_python}자")
+
+    def _loop_period(self):
+        if len(self._recent) < LOOP_LINES:
+            return None
+        recent = list(self._recent)
+        for period in range(1, MAX_PERIOD + 1):
+            if all(recent[i] == recent[i - period] for i in range(period, LOOP_LINES)):
+                return period
+        return None
+
+    def _stop(self, reason, accept, detail=""):
+        self.stop = Stop(reason, accept, self.text(), detail)
+        with _lock:
+            _stats[reason] += 1
+            _stats["accepted" if accept else "aborted"] += 1
+        action = "결과로 받아들입니다" if accept else "끊고 다시 생성합니다"
+        logging.info(f"✂️ 생성 조기 종료 [{reason}{f': {detail}' if detail else ''}] "
+                     f"{len(self.stop.text)}자에서 {action}: {self.target}")
+
+
+def _is_python(lang):
+    return lang in PYTHON_LANGS or lang.endswith(".py")
+
+
+def _complete_app(code):
+    # 조각이 아니라 그대로 실행할 수 있는 앱 (여러 블록으로 나눠 쓰는 중이면 마지막 블록까지 기다린다)
+    extraction = extract_code(f"```python\n{code}\n```")
+    return extraction.ok and "__main__" in code
+
+
+def stats():
+    with _lock:
+        return dict(_stats)
+
+
+def log_summary(log=logging.info):
+    counts = stats()
+    stopped = counts.get("accepted", 0) + counts.get("aborted", 0)
+    if not stopped and not counts.get("completed"):
+        return
+    reasons = ", ".join(f"{reason} {counts[reason]}" for reason in ("fence", "loop", "prose") if counts.get(reason))
+    log(f"\n✂️ 스트리밍 생성: 끝까지 받음 {counts.get('completed', 0)}건, 조기 종료 {stopped}건"
+        f"{f' ({reasons})' if reasons else ''} – 받아들임 {counts.get('accepted', 0)}건 / "
+        f"재생성 {counts.get('aborted', 0)}건")
@@ -0,0 +1,57 @@
+"""
+test_launcher.py – security_test.py 를 할당된 포트의 앱에 대해 실행하는 래퍼
+
+사용법: HARNESS_BASE_URL=http://127.0.0.1:<port> python3 harness/test_launcher.py security_test.py
+
+scenario.yaml 의 base_url 이나 테스트 코드에 하드코딩된 기본 주소
+(127.0.0.1:5000 / :8000) 로 나가는 요청을 HARNESS_BASE_URL 로 돌린다.
+HARNESS_RESULTS_FILE 이 있으면 테스트 결과를 그 파일에 JSON Lines 로 남긴다 (harness/results.py).
+HARNESS_TRANSPORT=inprocess 이면 앱 서버 없이 HARNESS_APP 을 이 프로세스에서 로드해
+직접 호출한다 (harness/inprocess.py).
+"""
+import os
+import runpy
+import sys
+
+
+def _patch_requests(module):
+    from harness.ports import rewrite_url
+
+    base_url = os.environ.get("HARNESS_BASE_URL")
+    original_request = module.Session.request
+
+    def request(self, method, url, *args, **kwargs):
+        if base_url:
+            url = rewrite_url(url, base_url)
+        return original_request(self, method, url, *args, **kwargs)
+
+    module.Session.request = request
+
+
+def main():
+    test_path = os.path.abspath(sys.argv[1])
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    sys.path.insert(0, repo_root)
+    from harness.hooks import when_imported
+    from harness import ports  # noqa: F401
+    from harness import inprocess
+    when_imported("requests", _patch_requests)
+
+    # security_test.py 가 harness.scenario_engine 을 쓰므로 repo_root 는 남기되,
+    # 타깃 폴더의 app.py 등이 먼저 잡히도록 맨 뒤로 보낸다.
+    sys.path.remove(repo_root)
+    sys.path.append(repo_root)
+
+    sys.path[0] = os.path.dirname(test_path)
+    if inprocess.enabled():
+        app_path = os.path.abspath(os.environ[inprocess.APP_ENV])
+        argv, sys.argv = sys.argv, [app_path]
+        inprocess.install(app_path)
+        sys.argv = argv
+    sys.argv = [test_path] + sys.argv[2:]
+    runpy.run_path(test_path, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+warehouse.py – 실행 이력을 모아 두는 결과 저장소 (SQLite, 기본 logs/results.sqlite3)
+
+  runs           실행 한 번 (이름 = 로그 파일 이름, 시작 시각, 백엔드, 모델, 설정)
+  targets        평가 단위 한 건 (프레임워크, 타깃, 샘플 번호, 성공 여부, 안전/취약 수)
+  generations    단위별 생성 시도 (결과, 걸린 시간, 대기 시간, 오류)
+  bandit_issues  단위별 Bandit 이슈
+  verdicts       보안 테스트 한 건의 판정 (항목 A1~A10, test_id, safe/vuln, 상태 코드, 지연 시간)
+
+드라이버는 단위가 끝날 때마다 체크포인트로 기록하고(저널 항목과 같은 형식),
+예전 실행은 저널에서 가져올 수 있다. 로그를 grep 하지 않고 바로 묻는다:
+
+  python3 -m harness.warehouse rate --category A3 --last 5            # 모델별 A3 취약 비율 (모델마다 최근 5회)
+  python3 -m harness.warehouse rate --by model,category --framework flask
+  python3 -m harness.warehouse runs --last 10
+  python3 -m harness.warehouse import logs/*.journal.jsonl
+"""
+import argparse
+import glob
+import json
+import os
+import sqlite3
+import sys
+import time
+from contextlib import closing, contextmanager
+from datetime import datetime
+
+from harness.journal import run_name
+from harness.results import read_results
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs", "results.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    name       TEXT NOT NULL UNIQUE,
+    started_at REAL NOT NULL,
+    backend    TEXT,
+    model      TEXT,
+    samples    INTEGER,
+    sweeps     INTEGER,
+    config     TEXT
+);
+CREATE TABLE IF NOT EXISTS targets (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id      INTEGER NOT NULL REFERENCES runs (id),
+    unit        TEXT NOT NULL,
+    framework   TEXT NOT NULL,
+    target      TEXT NOT NULL,
+    sample      INTEGER NOT NULL,
+    ok          INTEGER NOT NULL,
+    safe        INTEGER NOT NULL,
+    vuln        INTEGER NOT NULL,
+    finished_at REAL,
+    UNIQUE (run_id, unit)
+);
+CREATE TABLE IF NOT EXISTS generations (
+    target_id INTEGER NOT NULL REFERENCES targets (id),
+    attempt   INTEGER NOT NULL,
+    outcome   TEXT NOT NULL,
+    elapsed   REAL,
+    waited    REAL,
+    error     TEXT
+);
+CREATE TABLE IF NOT EXISTS bandit_issues (
+    target_id INTEGER NOT NULL REFERENCES targets (id),
+    issue     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS verdicts (
+    target_id       INTEGER NOT NULL REFERENCES targets (id),
+    run_id          INTEGER NOT NULL REFERENCES runs (id),
+    framework       TEXT NOT NULL,
+    target          TEXT NOT NULL,
+    category        TEXT,
+    test_id         TEXT,
+    verdict         TEXT NOT NULL,
+    expected_status TEXT,
+    actual_status   TEXT,
+    latency         REAL,
+    reason          TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_by_model ON runs (model, started_at);
+CREATE INDEX IF NOT EXISTS runs_by_date ON runs (started_at);
+CREATE INDEX IF NOT EXISTS targets_by_run ON targets (run_id, framework);
+CREATE INDEX IF NOT EXISTS generations_by_target ON generations (target_id);
+CREATE INDEX IF NOT EXISTS issues_by_target ON bandit_issues (target_id);
+CREATE INDEX IF NOT EXISTS verdicts_by_run ON verdicts (run_id, category, verdict);
+CREATE INDEX IF NOT EXISTS verdicts_by_category ON verdicts (category, framework);
+CREATE INDEX IF NOT EXISTS verdicts_by_target ON verdicts (target_id);
+"""
+
+# rate --by 에 쓸 수 있는 묶음 기준 → 컬럼
+GROUPS = {
+    "model": "r.model",
+    "framework": "v.framework",
+    "category": "v.category",
+    "target": "v.target",
+    "run": "r.name",
+}
+
+
+class Warehouse:
+    def __init__(self, path=DEFAULT_PATH, timeout=60):
+        self.path = path
+        self.timeout = timeout
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def start_run(self, name, config, started_at=None):
+        """실행을 등록하고 id 를 돌려준다 (같은 이름이면 기존 실행에 이어 쓴다 – --resume)"""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO runs (name, started_at, backend, model, samples, sweeps, config) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (name, started_at or time.time(), config.get("backend"), config.get("model"),
+                 config.get("samples"), config.get("sweeps"), json.dumps(config, ensure_ascii=False)))
+            return conn.execute("SELECT id FROM runs WHERE name = ?", (name,)).fetchone()["id"]
+
+    def add_unit(self, run_id, entry):
+        """저널 항목(harness.journal.make_entry) 하나를 넣는다. 같은 단위가 이미 있으면 바꾼다."""
+        with self._transaction() as conn:
+            old = conn.execute("SELECT id FROM targets WHERE run_id = ? AND unit = ?", (run_id, entry["unit"])).fetchone()
+            if old is not None:
+                for table in ("generations", "bandit_issues", "verdicts"):
+                    conn.execute(f"DELETE FROM {table} WHERE target_id = ?", (old["id"],))
+                conn.execute("DELETE FROM targets WHERE id = ?", (old["id"],))
+            target_id = conn.execute(
+                "INSERT INTO targets (run_id, unit, framework, target, sample, ok, safe, vuln, finished_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, entry["unit"], entry["framework"], entry["target"], entry["sample"], int(entry["ok"]),
+                 entry["safe"], entry["vuln"], entry.get("finished_at"))).lastrowid
+            conn.executemany(
+                "INSERT INTO generations (target_id, attempt, outcome, elapsed, waited, error) VALUES (?, ?, ?, ?, ?, ?)",
+                [(target_id, a["number"], a["outcome"], a["elapsed"], a["waited"], a["error"]) for a in entry["attempts"]])
+            conn.executemany(
+                "INSERT INTO bandit_issues (target_id, issue) VALUES (?, ?)",
+                [(target_id, issue) for issue in entry["bandit_issues"]])
+            conn.executemany(
+                "INSERT INTO verdicts (target_id, run_id, framework, target, category, test_id, verdict, "
+                "expected_status, actual_status, latency, reason) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(target_id, run_id, entry["framework"], entry["target"], record.get("category"),
+                  record.get("test_id"), record["verdict"], _text(record.get("expected_status")),
+                  _text(record.get("actual_status")), record.get("latency"), record.get("reason"))
+                 for record in entry["records"] if record.get("verdict") in ("safe", "vuln")])
+            return target_id
+
+    def recorder(self, name, config, started_at=None):
+        return RunRecorder(self, self.start_run(name, config, started_at))
+
+    def import_journal(self, path):
+        """기존 체크포인트 저널(.journal.jsonl)을 실행 하나로 가져온다. 가져온 단위 수를 돌려준다."""
+        entries = read_results(path)
+        header = next((entry for entry in entries if entry.get("type") == "header"), None)
+        if header is None:
+            raise ValueError(f"저널 헤더가 없습니다: {path}")
+        run_id = self.start_run(run_name(path), header["config"], header.get("started_at"))
+        # 같은 단위가 여러 번 기록됐으면 마지막 기록을 쓴다
+        units = {entry["unit"]: entry for entry in entries if entry.get("type") == "unit"}
+        for entry in units.values():
+            self.add_unit(run_id, entry)
+        return len(units)
+
+    def runs(self, last=None, model=None):
+        """최근 실행 목록 (단위 수, 안전/취약 합계 포함)"""
+        query = ("SELECT r.id, r.name, r.started_at, r.backend, r.model, COUNT(t.id) AS units, "
+                 "SUM(t.ok) AS ok, SUM(t.safe) AS safe, SUM(t.vuln) AS vuln "
+                 "FROM runs r LEFT JOIN targets t ON t.run_id = r.id "
+                 "WHERE (:model IS NULL OR r.model = :model) "
+                 "GROUP BY r.id ORDER BY r.started_at DESC")
+        if last:
+            query += " LIMIT :last"
+        with closing(self._connect()) as conn:
+            return [dict(row) for row in conn.execute(query, {"model": model, "last": last})]
+
+    def vuln_rates(self, by=("model",), category=None, framework=None, model=None, last=None, since=None):
+        """
+        묶음(by)별 취약 판정 비율. last 를 주면 모델마다 최근 last 회 실행만 센다.
+        반환: [{"model": ..., "vuln": n, "total": n, "rate": 0~1, "runs": n}, ...]
+        """
+        columns = []
+        for key in by:
+            if key not in GROUPS:
+                raise ValueError(f"알 수 없는 묶음 기준: {key} (가능: {', '.join(GROUPS)})")
+            columns.append(f"{GROUPS[key]} AS {key}")
+        group = ", ".join(by)
+        query = f"""
+            WITH r AS (
+                SELECT id, name, model,
+                       ROW_NUMBER() OVER (PARTITION BY model ORDER BY started_at DESC) AS recent
+                FROM runs
+                WHERE (:model IS NULL OR model = :model) AND (:since IS NULL OR started_at >= :since)
+            )
+            SELECT {", ".join(columns)}, SUM(v.verdict = 'vuln') AS vuln, COUNT(*) AS total,
+                   COUNT(DISTINCT v.run_id) AS runs
+            FROM r JOIN verdicts v ON v.run_id = r.id
+            WHERE (:last IS NULL OR r.recent <= :last)
+              AND (:category IS NULL OR v.category = :category)
+              AND (:framework IS NULL OR v.framework = :framework)
+            GROUP BY {group} ORDER BY {group}
+        """
+        params = {"model": model, "since": since, "last": last, "category": category, "framework": framework}
+        with closing(self._connect()) as conn:
+            rows = [dict(row) for row in conn.execute(query, params)]
+        for row in rows:
+            row["rate"] = row["vuln"] / row["total"] if row["total"] else 0.0
+        return rows
+
+
+class RunRecorder:
+    """드라이버의 체크포인트 훅: 끝난 단위를 실행 하나에 기록한다."""
+
+    def __init__(self, warehouse, run_id):
+        self.warehouse = warehouse
+        self.run_id = run_id
+
+    def record(self, request, entry):
+        self.warehouse.add_unit(self.run_id, entry)
+
+
+def _text(value):
+    return None if value is None else str(value)
+
+
+def _print_table(headers, rows):
+    widths = [max(len(str(h)), *(len(str(row[i])) for row in rows)) if rows else len(str(h))
+              for i, h in enumerate(headers)]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(value).ljust(w) for value, w in zip(row, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='평가 결과 저장소 조회')
+    parser.add_argument('--db', type=str, default=DEFAULT_PATH, help='결과 저장소 경로')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    rate = commands.add_parser('rate', help='취약 판정 비율 (기본: 모델별)')
+    rate.add_argument('--by', type=str, default='model', help=f'묶음 기준 (쉼표 구분, 가능: {", ".join(GROUPS)})')
+    rate.add_argument('--category', type=str, default=None, help='A1 ~ A10 중 하나')
+    rate.add_argument('--framework', type=str, default=None)
+    rate.add_argument('--model', type=str, default=None)
+    rate.add_argument('--last', type=int, default=None, help='모델마다 최근 N회 실행만')
+    rate.add_argument('--since', type=str, default=None, help='이 날짜(YYYY-MM-DD) 이후 실행만')
+
+    runs = commands.add_parser('runs', help='최근 실행 목록')
+    runs.add_argument('--model', type=str, default=None)
+    runs.add_argument('--last', type=int, default=20)
+
+    imports = commands.add_parser('import', help='체크포인트 저널(.journal.jsonl)을 가져온다')
+    imports.add_argument('paths', nargs='*', help='저널 경로 (기본: logs/*.journal.jsonl)')
+
+    args = parser.parse_args()
+    warehouse = Warehouse(args.db)
+    started = time.perf_counter()
+
+    if args.command == 'rate':
+        since = datetime.strptime(args.since, "%Y-%m-%d").timestamp() if args.since else None
+        by = [key.strip() for key in args.by.split(",") if key.strip()]
+        try:
+            rows = warehouse.vuln_rates(by, args.category, args.framework, args.model, args.last, since)
+        except ValueError as e:
+            parser.error(str(e))
+        _print_table(by + ["취약", "전체", "취약 비율", "실행 수"],
+                     [[row[key] for key in by] + [row["vuln"], row["total"], f"{row['rate'] * 100:.1f}%", row["runs"]]
+                      for row in rows])
+    elif args.command == 'runs':
+        rows = warehouse.runs(args.last, args.model)
+        _print_table(["id", "실행", "시작", "백엔드", "모델", "단위", "성공", "안전", "취약"],
+                     [[row["id"], row["name"], datetime.fromtimestamp(row["started_at"]).strftime("%Y-%m-%d %H:%M"),
+                       row["backend"] or "-", row["model"] or "-", row["units"], row["ok"] or 0,
+                       row["safe"] or 0, row["vuln"] or 0] for row in rows])
+    elif args.command == 'import':
+        paths = args.paths or sorted(glob.glob(os.path.join(os.path.dirname(DEFAULT_PATH), "*.journal.jsonl")))
+        for path in paths:
+            try:
+                count = warehouse.import_journal(path)
+            except (ValueError, KeyError) as e:
+                print(f"❌ {path}: {e}", file=sys.stderr)
+                continue
+            print(f"📥 {path}: 단위 {count}개")
+
+    print(f"\n({(time.perf_counter() - started) * 1000:.1f}ms, {args.db})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
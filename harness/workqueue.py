@@ -0,0 +1,170 @@
+"""
+workqueue.py – 여러 호스트가 나눠 처리하는 SQLite 작업 큐 (공유 스토리지의 파일 하나)
+
+  enqueue   드라이버가 (모델, 평가 단위) 를 넣는다 (이미 있는 단위는 그대로 둔다)
+  lease     워커가 pending 이거나 임대 시간이 지난 단위를 가져간다 (BEGIN IMMEDIATE 로 원자적)
+  renew     실행 중인 단위의 임대를 연장한다 (하트비트)
+  complete  단위 결과(harness.journal 항목과 같은 형식)를 저장한다
+  results   리듀서가 끝난 단위 결과를 넣은 순서대로 읽는다
+
+워커가 죽으면 그 단위의 임대가 만료된 뒤 다른 워커가 다시 가져간다.
+파일 잠금이 동작하는 곳(로컬 디스크, NFSv4 등)에 두어야 한다.
+"""
+import json
+import logging
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    model       TEXT NOT NULL,
+    unit        TEXT NOT NULL,
+    framework   TEXT NOT NULL,
+    target      TEXT NOT NULL,
+    sample      INTEGER NOT NULL,
+    status      TEXT NOT NULL DEFAULT 'pending',   -- pending / leased / done
+    worker      TEXT,
+    lease_until REAL,
+    leases      INTEGER NOT NULL DEFAULT 0,
+    result      TEXT,
+    updated_at  REAL,
+    UNIQUE (model, unit)
+);
+CREATE INDEX IF NOT EXISTS units_by_status ON units (model, status, lease_until);
+"""
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+
+
+class WorkQueue:
+    def __init__(self, path, timeout=60):
+        self.path = path
+        self.timeout = timeout
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        # 자동 커밋 모드 – 쓰기는 _transaction() 의 BEGIN IMMEDIATE 로 묶는다
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def init_config(self, config):
+        """처음 넣는 설정을 저장하고, 이미 있으면 저장된 설정을 돌려준다."""
+        with self._transaction() as conn:
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('config', ?)", (json.dumps(config),))
+            row = conn.execute("SELECT value FROM meta WHERE key = 'config'").fetchone()
+        return json.loads(row["value"])
+
+    def config(self):
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'config'").fetchone()
+        return json.loads(row["value"]) if row else None
+
+    def enqueue(self, model, requests):
+        """requests: GenerationRequest 목록, 새로 들어간 단위 수를 돌려준다."""
+        now = time.time()
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO units (model, unit, framework, target, sample, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(model, r.unit, r.framework.name, r.target, r.sample, now) for r in requests])
+            return conn.total_changes - before
+
+    def lease(self, model, worker, ttl, limit=1):
+        """pending 이거나 임대가 만료된 단위를 최대 limit 개 임대한다. [row dict, ...]"""
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, unit, framework, target, sample FROM units "
+                "WHERE model = ? AND (status = ? OR (status = ? AND lease_until < ?)) "
+                "ORDER BY id LIMIT ?",
+                (model, PENDING, LEASED, now, limit)).fetchall()
+            conn.executemany(
+                "UPDATE units SET status = ?, worker = ?, lease_until = ?, leases = leases + 1, updated_at = ? "
+                "WHERE id = ?",
+                [(LEASED, worker, now + ttl, now, row["id"]) for row in rows])
+        return [dict(row) for row in rows]
+
+    def renew(self, model, units, worker, ttl):
+        now = time.time()
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE units SET lease_until = ?, updated_at = ? "
+                "WHERE model = ? AND unit = ? AND worker = ? AND status = ?",
+                [(now + ttl, now, model, unit, worker, LEASED) for unit in units])
+
+    def complete(self, model, unit, worker, entry):
+        """결과 저장. 임대가 만료돼 다른 워커도 처리한 경우 먼저 끝낸 쪽의 결과를 남긴다."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE units SET status = ?, worker = ?, lease_until = NULL, result = ?, updated_at = ? "
+                "WHERE model = ? AND unit = ? AND status != ?",
+                (DONE, worker, json.dumps(entry, ensure_ascii=False), time.time(), model, unit, DONE))
+            return cursor.rowcount > 0
+
+    def release(self, model, units, worker):
+        """끝내지 못한 임대를 바로 돌려준다 (워커 중단 시)."""
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE units SET status = ?, worker = NULL, lease_until = NULL, updated_at = ? "
+                "WHERE model = ? AND unit = ? AND worker = ? AND status = ?",
+                [(PENDING, time.time(), model, unit, worker, LEASED) for unit in units])
+
+    def counts(self, model=None):
+        """{status: 단위 수} (model 을 주면 그 모델만)"""
+        query = "SELECT status, COUNT(*) AS n FROM units"
+        params = ()
+        if model is not None:
+            query += " WHERE model = ?"
+            params = (model,)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query + " GROUP BY status", params).fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def results(self):
+        """끝난 단위를 넣은 순서대로: [(model, 저널 항목), ...]"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT model, result FROM units WHERE status = ? ORDER BY id", (DONE,)).fetchall()
+        return [(row["model"], json.loads(row["result"])) for row in rows]
+
+    def models(self):
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT model FROM units GROUP BY model ORDER BY MIN(id)").fetchall()
+        return [row["model"] for row in rows]
+
+
+class QueueCheckpoint:
+    """run_auto_script 의 체크포인트 훅: 단위가 끝나면 큐에 결과를 쓰고 임대 목록에서 뺀다."""
+
+    def __init__(self, queue, model, worker, held):
+        self.queue = queue
+        self.model = model
+        self.worker = worker
+        self.held = held      # 이 워커가 임대 중인 단위 (하트비트 대상)
+
+    def record(self, request, entry):
+        if not self.queue.complete(self.model, request.unit, self.worker, entry):
+            # 임대가 만료돼 다른 워커가 먼저 끝낸 경우
+            logging.warning(f"⚠️ 다른 워커가 먼저 끝낸 단위입니다: {request.unit}")
+        self.held.discard(request.unit)